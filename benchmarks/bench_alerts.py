@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from bench_search import WORDS, synthetic_articles
+
+from healthcare_news_scraper.alerts import AlertMatcher, AlertRule, _alert_text
+from healthcare_news_scraper.filters import filter_articles_by_keyword
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time matching standing alert rules against one run of articles")
+    parser.add_argument("--rules", type=int, default=5000, help="Alert rules")
+    parser.add_argument("--articles", type=int, default=500, help="New articles in the run")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    rules = [AlertRule(f"rule-{index}", tuple(rng.sample(WORDS, 3))) for index in range(args.rules)]
+    articles = synthetic_articles(args.articles)
+    rows = [{"name": article["title"], "category": article["category"], "description": "", "body": article["body"]} for article in articles]
+
+    started = time.perf_counter()
+    matcher = AlertMatcher(rules)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    found = matcher.match_many([_alert_text(row) for row in rows], [row["category"] for row in rows])
+    match_ms = (time.perf_counter() - started) * 1000
+
+    sample = rules[: max(1, args.rules // 50)]
+    started = time.perf_counter()
+    for rule in sample:
+        for keyword in rule.keywords:
+            filter_articles_by_keyword(articles, keyword)
+    loop_ms = (time.perf_counter() - started) * 1000 * args.rules / len(sample)
+
+    print(f"compile {args.rules} rules     {compile_ms:9.1f} ms")
+    print(f"match {args.articles} articles     {match_ms:9.1f} ms ({sum(map(len, found))} matches)")
+    print(f"per-rule filter loop (est.) {loop_ms:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from bench_search import TOPIC_WORDS, synthetic_articles
+
+from healthcare_news_scraper.article_index import ArticleIndex
+from healthcare_news_scraper.filters import article_matches_keyword
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare topic views from one ArticleIndex against linear keyword scans")
+    parser.add_argument("--articles", type=int, default=50_000, help="Articles per batch")
+    parser.add_argument("--views", type=int, default=40, help="Topic views sliced from the batch")
+    args = parser.parse_args()
+
+    articles = synthetic_articles(args.articles)
+    topics = [TOPIC_WORDS[index % len(TOPIC_WORDS)] for index in range(args.views)]
+
+    started = time.perf_counter()
+    linear = [[article for article in articles if article_matches_keyword(article, topic)] for topic in topics]
+    linear_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = ArticleIndex(articles)
+    build_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    indexed = [index.search(topic) for topic in topics]
+    query_seconds = time.perf_counter() - started
+
+    print(f"linear scan   {linear_seconds * 1000:9.1f} ms for {args.views} views ({sum(map(len, linear))} hits)")
+    print(f"index build   {build_seconds * 1000:9.1f} ms")
+    print(f"index queries {query_seconds * 1000:9.1f} ms for {args.views} views ({sum(map(len, indexed))} hits)")
+    print(f"facets        {index.facet_counts('vaccine OR outbreak')}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
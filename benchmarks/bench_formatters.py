@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict, Iterator
+
+from healthcare_news_scraper.formatters import JSON_FORMATS, available_encoders, get_articles_category_json, write_articles
+
+
+def synthetic_articles(count: int) -> Iterator[Dict[str, str]]:
+    for index in range(count):
+        yield {
+            "title": f"WHO update {index} on cholera vaccination campaigns",
+            "url": f"https://www.who.int/news/item/{index:07d}",
+            "category": "outbreak" if index % 3 else "research",
+            "date": "Tue Feb 17",
+            "source": "healthcare_web",
+        }
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measure(mode: str, count: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as stream:
+        if mode == "baseline":
+            pass
+        elif mode == "string":
+            stream.write(get_articles_category_json(list(synthetic_articles(count)), ""))
+        else:
+            encoder, fmt = mode.split(":")
+            write_articles(synthetic_articles(count), stream, fmt, encoder=encoder)
+    return {"seconds": time.perf_counter() - started, "peak_rss_mib": _peak_rss_mib()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare peak memory and throughput of JSON formatters")
+    parser.add_argument("--articles", type=int, default=1_000_000, help="Articles to format")
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(_measure(args.mode, args.articles)))
+        return 0
+
+    modes = ["baseline", "string"] + [f"{encoder}:{fmt}" for encoder in available_encoders() for fmt in JSON_FORMATS]
+    print(f"{'mode':16} {'seconds':>8} {'articles/s':>12} {'peak RSS MiB':>13}")
+    for mode in modes:
+        output = subprocess.run(
+            [sys.executable, __file__, "--articles", str(args.articles), "--mode", mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        rate = args.articles / result["seconds"] if mode != "baseline" and result["seconds"] else 0
+        print(f"{mode:16} {result['seconds']:8.2f} {rate:12.0f} {result['peak_rss_mib']:13.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
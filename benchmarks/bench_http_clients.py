@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+from healthcare_news_scraper.http import RequestsHttpClient, SessionHttpClient
+
+
+PAGE = ("<html><body>" + "<div><a href='/news/item/1'>WHO Outbreak Update</a></div>" * 200 + "</body></html>").encode()
+GZIPPED_PAGE = gzip.compress(PAGE)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        body = GZIPPED_PAGE if "gzip" in self.headers.get("Accept-Encoding", "") else PAGE
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if body is GZIPPED_PAGE:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        return
+
+
+def _start_server() -> Tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/news"
+
+
+def _requests_per_second(client: RequestsHttpClient, url: str, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        client.get(url, headers={}, timeout=5).raise_for_status()
+    return count / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare per-request and pooled HTTP clients against a local stub server")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per client")
+    args = parser.parse_args()
+
+    server, url = _start_server()
+    try:
+        per_request = _requests_per_second(RequestsHttpClient(), url, args.requests)
+        with SessionHttpClient() as pooled_client:
+            pooled = _requests_per_second(pooled_client, url, args.requests)
+    finally:
+        server.shutdown()
+
+    print(f"RequestsHttpClient: {per_request:8.1f} req/s")
+    print(f"SessionHttpClient:  {pooled:8.1f} req/s ({pooled / per_request:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
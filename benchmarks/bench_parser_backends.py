@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from healthcare_news_scraper.parsing import available_backends
+from healthcare_news_scraper.scraper import HealthcareNewsScraper
+
+
+def synthetic_listing(items: int) -> str:
+    rows = []
+    for index in range(items):
+        rows.append(
+            "<div class='list-view--item'>"
+            f"<span class='timestamp'>Thu Feb {index % 28 + 1:02d}</span>"
+            f"<a href='/news/item/{index}'>WHO outbreak research update {index}</a>"
+            "<p>Clinical trial results and public health guidance for member states.</p>"
+            "<ul class='meta'><li>Disease outbreak</li><li>Research</li></ul>"
+            "</div>"
+        )
+    filler = "<section><p>Navigation and footer content</p></section>" * (items // 4)
+    return f"<html><head><title>News</title></head><body>{filler}{''.join(rows)}{filler}</body></html>"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report parse throughput per parser backend on synthetic listing pages")
+    parser.add_argument("--items", type=int, default=2000, help="Articles per synthetic page")
+    parser.add_argument("--repeat", type=int, default=3, help="Parses per backend")
+    args = parser.parse_args()
+
+    html = synthetic_listing(args.items)
+    megabytes = len(html.encode("utf-8")) / 1_000_000
+    print(f"page size: {megabytes:.2f} MB, {args.items} articles")
+
+    reference = None
+    for backend in available_backends():
+        for use_strainer in (False, True):
+            scraper = HealthcareNewsScraper(delay_seconds=0, parser_backend=backend, use_strainer=use_strainer)
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                articles = scraper.parse_articles(html)
+            elapsed = (time.perf_counter() - started) / args.repeat
+
+            reference = reference if reference is not None else articles
+            label = f"{backend}{' +strainer' if use_strainer else ''}"
+            match = "ok" if articles == reference else "MISMATCH"
+            print(f"{label:22s} {elapsed * 1000:8.1f} ms/page {megabytes / elapsed:7.2f} MB/s  output={match}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
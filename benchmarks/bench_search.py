@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List
+
+from healthcare_news_scraper.search import match_expression
+from healthcare_news_scraper.storage import SQLiteArticleStore
+
+TOPIC_WORDS = (
+    "cholera measles malaria vaccine outbreak policy research guidance emergency response funding "
+    "surveillance nutrition maternal child mental health tuberculosis polio dengue climate"
+).split()
+WORDS = TOPIC_WORDS + [f"term{index}" for index in range(5000)]
+CUMULATIVE_WEIGHTS = list(accumulate(1 / (rank + 1) for rank in range(len(WORDS))))
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choices(WORDS, cum_weights=CUMULATIVE_WEIGHTS, k=count))
+
+
+def synthetic_articles(count: int, seed: int = 7) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "title": f"{_words(rng, 6)} {index}",
+            "url": f"https://www.who.int/news/item/{index:07d}",
+            "category": rng.choice(["outbreak", "research", "policy", "general"]),
+            "date": "",
+            "body": _words(rng, 40),
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure full-text search latency over synthetic stored articles")
+    parser.add_argument("--articles", type=int, default=200_000, help="Articles to index")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to time")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = SQLiteArticleStore(str(Path(tmp_dir) / "bench.db"), persistent=True)
+        store.init_schema()
+        started = time.perf_counter()
+        store.persist_run(
+            source="benchmark",
+            fetched_at="2026-02-17T00:00:00+00:00",
+            search_term="",
+            record_limit=0,
+            status="success",
+            attempts=1,
+            error="",
+            articles=synthetic_articles(args.articles),
+        )
+        print(f"indexed {args.articles} articles in {time.perf_counter() - started:.1f}s")
+
+        for label, build in (
+            ("common term", lambda: match_expression(rng.choice(TOPIC_WORDS[5:]))),
+            ("two terms", lambda: match_expression(" ".join(rng.sample(WORDS[:500], 2)))),
+            ("phrase", lambda: match_expression(" ".join(rng.sample(WORDS[:200], 2)), phrase=True)),
+        ):
+            timings = []
+            for _ in range(args.queries):
+                match = build()
+                query_started = time.perf_counter()
+                store.search(match, category="outbreak", limit=20)
+                timings.append((time.perf_counter() - query_started) * 1000)
+            timings.sort()
+            print(
+                f"{label:12} median {statistics.median(timings):7.2f} ms"
+                f"  p95 {timings[int(len(timings) * 0.95) - 1]:7.2f} ms"
+            )
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from healthcare_news_scraper.storage import SQLiteArticleStore
+
+
+def synthetic_articles(count: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "title": f"WHO update {index}",
+            "url": f"https://www.who.int/news/item/{index:07d}",
+            "category": "outbreak" if index % 3 else "research",
+            "date": "Tue Feb 17",
+            "source": "healthcare_web",
+        }
+        for index in range(count)
+    ]
+
+
+def _persist(store: SQLiteArticleStore, articles: List[Dict[str, str]], fetched_at: str) -> float:
+    started = time.perf_counter()
+    store.persist_run(
+        source="benchmark",
+        fetched_at=fetched_at,
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        articles=articles,
+    )
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure SQLiteArticleStore.persist_run throughput on synthetic articles")
+    parser.add_argument("--articles", type=int, default=100_000, help="Articles per run")
+    args = parser.parse_args()
+
+    articles = synthetic_articles(args.articles)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = SQLiteArticleStore(str(Path(tmp_dir) / "bench.db"))
+        store.init_schema()
+        first = _persist(store, articles, "2026-02-17T00:00:00+00:00")
+        repeat = _persist(store, articles, "2026-02-17T06:00:00+00:00")
+
+        cold = SQLiteArticleStore(str(Path(tmp_dir) / "bench.db"), product_cache_size=0)
+        uncached = _persist(cold, articles, "2026-02-17T12:00:00+00:00")
+
+    print(f"first run (inserts):         {first:6.2f}s {args.articles / first:10.0f} articles/s")
+    print(f"repeat run (cached ids):     {repeat:6.2f}s {args.articles / repeat:10.0f} articles/s")
+    print(f"repeat run (no id cache):    {uncached:6.2f}s {args.articles / uncached:10.0f} articles/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,20 @@
 from importlib.metadata import PackageNotFoundError, version
 
+from .article_index import ArticleIndex
 from .filters import filter_articles_by_keyword
-from .formatters import get_articles_category_json
+from .formatters import get_articles_category_json, get_articles_category_views
 from .models import HealthcareArticle
 from .newsletter_parser import parse_newsletter_html
-from .protocols import ArticleScraper, ArticleStore, HttpClient, HttpResponse
+from .protocols import (
+    ArticleScraper,
+    ArticleStore,
+    ArticleUrlIndex,
+    AsyncArticleScraper,
+    AsyncHttpClient,
+    HttpClient,
+    HttpResponse,
+    StreamingArticleStore,
+)
 from .scraper import HealthcareNewsScraper, scrape_default_healthcare_news
 
 try:
@@ -13,15 +23,21 @@ except PackageNotFoundError:  # pragma: no cover - local editable usage
     __version__ = "0.0.0"
 
 __all__ = [
+    "ArticleIndex",
     "HealthcareArticle",
     "HealthcareNewsScraper",
     "ArticleScraper",
     "ArticleStore",
+    "ArticleUrlIndex",
+    "AsyncArticleScraper",
+    "AsyncHttpClient",
     "HttpClient",
     "HttpResponse",
+    "StreamingArticleStore",
     "filter_articles_by_keyword",
     "scrape_default_healthcare_news",
     "get_articles_category_json",
+    "get_articles_category_views",
     "parse_newsletter_html",
     "__version__",
 ]
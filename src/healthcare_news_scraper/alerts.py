@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple
+
+from .classifier import KeywordClassifier, KeywordRule
+from .config import load_config_from_env
+from .queries import DEFAULT_PAGE_SIZE, Page, Query, decode_cursor, encode_cursor, fetch_page, page_size
+
+if TYPE_CHECKING:
+    from .storage import SQLiteArticleStore
+
+
+logger = logging.getLogger("healthcare_news_scraper.alerts")
+
+ALERTS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS alert_rules (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    keywords TEXT NOT NULL,
+    categories TEXT NOT NULL DEFAULT '[]',
+    team TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS alert_matches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rule_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    snapshot_id INTEGER NOT NULL,
+    run_id INTEGER NOT NULL,
+    matched_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(rule_id) REFERENCES alert_rules(id) ON DELETE CASCADE,
+    UNIQUE(rule_id, product_id)
+);
+
+CREATE TABLE IF NOT EXISTS alert_cursor (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_run_id INTEGER NOT NULL
+);
+"""
+
+ALERT_TEXT_COLUMNS = ("name", "category", "description", "body")
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    name: str
+    keywords: Tuple[str, ...]
+    categories: Tuple[str, ...] = ()
+    team: str = ""
+
+
+@dataclass(frozen=True)
+class AlertReport:
+    rules: int
+    articles_scanned: int
+    matches: int
+    last_run_id: Optional[int]
+    elapsed_seconds: float
+
+
+class AlertMatcher:
+    def __init__(self, rules: Sequence[AlertRule]) -> None:
+        self.rules = list(rules)
+        self._classifier = KeywordClassifier([KeywordRule(rule.name, tuple(rule.keywords)) for rule in self.rules])
+        self._categories = [{category.lower() for category in rule.categories} for rule in self.rules]
+
+    def match_many(self, texts: Sequence[str], categories: Sequence[str]) -> List[List[int]]:
+        matched = []
+        for found, category in zip(self._classifier.rule_matches_many(texts), categories):
+            folded = (category or "").lower()
+            matched.append(sorted(index for index in found if not self._categories[index] or folded in self._categories[index]))
+        return matched
+
+    def match(self, text: str, category: str = "") -> List[AlertRule]:
+        return [self.rules[index] for index in self.match_many([text], [category])[0]]
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript(ALERTS_SCHEMA_SQL)
+
+
+def add_rule(store: "SQLiteArticleStore", rule: AlertRule) -> int:
+    if not any(keyword.strip("* ") for keyword in rule.keywords):
+        raise ValueError(f"Alert rule {rule.name!r} needs at least one keyword")
+    with store.transaction() as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            """
+            INSERT INTO alert_rules (name, keywords, categories, team)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                keywords = excluded.keywords,
+                categories = excluded.categories,
+                team = excluded.team
+            """,
+            (rule.name, json.dumps(list(rule.keywords)), json.dumps(list(rule.categories)), rule.team),
+        )
+        return int(conn.execute("SELECT id FROM alert_rules WHERE name = ?", (rule.name,)).fetchone()["id"])
+
+
+def remove_rule(store: "SQLiteArticleStore", name: str) -> bool:
+    with store.transaction() as conn:
+        _ensure_schema(conn)
+        return conn.execute("DELETE FROM alert_rules WHERE name = ?", (name,)).rowcount > 0
+
+
+def _load_rules(conn: sqlite3.Connection) -> Tuple[List[int], List[AlertRule]]:
+    ids, rules = [], []
+    for row in conn.execute("SELECT id, name, keywords, categories, team FROM alert_rules ORDER BY id"):
+        ids.append(int(row["id"]))
+        rules.append(
+            AlertRule(
+                name=row["name"],
+                keywords=tuple(json.loads(row["keywords"])),
+                categories=tuple(json.loads(row["categories"])),
+                team=row["team"],
+            )
+        )
+    return ids, rules
+
+
+def list_rules(store: "SQLiteArticleStore") -> List[AlertRule]:
+    with store.transaction() as conn:
+        _ensure_schema(conn)
+        return _load_rules(conn)[1]
+
+
+def _alert_text(row: sqlite3.Row) -> str:
+    return "\n".join(str(row[column] or "") for column in ALERT_TEXT_COLUMNS)
+
+
+def _insert_matches(conn: sqlite3.Connection, values: List[Tuple[int, int, int, int]]) -> int:
+    before = conn.total_changes
+    conn.executemany(
+        "INSERT OR IGNORE INTO alert_matches (rule_id, product_id, snapshot_id, run_id) VALUES (?, ?, ?, ?)",
+        values,
+    )
+    return conn.total_changes - before
+
+
+def evaluate_alerts(store: "SQLiteArticleStore", *, batch_size: int = 1000) -> AlertReport:
+    started = time.perf_counter()
+    with store.transaction() as conn:
+        _ensure_schema(conn)
+        conn.execute("INSERT OR IGNORE INTO alert_cursor (id, last_run_id) SELECT 1, COALESCE(MAX(id), 1) - 1 FROM runs")
+        since_run = int(conn.execute("SELECT last_run_id FROM alert_cursor WHERE id = 1").fetchone()["last_run_id"])
+        target = conn.execute("SELECT MAX(id) AS id FROM runs").fetchone()["id"]
+        rule_ids, rules = _load_rules(conn)
+
+    if target is None or target <= since_run:
+        return AlertReport(len(rules), 0, 0, since_run, time.perf_counter() - started)
+
+    scanned = matches = 0
+    if rules:
+        matcher = AlertMatcher(rules)
+        batch: List[sqlite3.Row] = []
+
+        def flush() -> int:
+            found = matcher.match_many([_alert_text(row) for row in batch], [row["category"] for row in batch])
+            values = [
+                (rule_ids[index], row["product_id"], row["snapshot_id"], row["run_id"])
+                for row, indexes in zip(batch, found)
+                for index in indexes
+            ]
+            with store.transaction() as conn:
+                return _insert_matches(conn, values)
+
+        for row in store.iter_snapshots(since_run=since_run, batch_size=batch_size):
+            if row["run_id"] > target:
+                continue
+            batch.append(row)
+            scanned += 1
+            if len(batch) >= batch_size:
+                matches += flush()
+                batch = []
+        if batch:
+            matches += flush()
+
+    with store.transaction() as conn:
+        conn.execute("UPDATE alert_cursor SET last_run_id = ? WHERE id = 1", (target,))
+    return AlertReport(len(rules), scanned, matches, target, time.perf_counter() - started)
+
+
+def alert_matches_query(after: Optional[str] = None, team: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Query:
+    (after_id,) = decode_cursor(after, 1) if after else (0,)
+    clauses = ["alert.id > ?"]
+    params: List[object] = [after_id]
+    if team is not None:
+        clauses.append("rule.team = ?")
+        params.append(team)
+    sql = f"""
+        SELECT
+            alert.id AS alert_id,
+            rule.name AS rule,
+            rule.team,
+            alert.run_id,
+            alert.snapshot_id,
+            alert.product_id,
+            products.name,
+            products.url,
+            alert.matched_at
+        FROM alert_matches AS alert
+        JOIN alert_rules AS rule ON rule.id = alert.rule_id
+        JOIN products ON products.id = alert.product_id
+        WHERE {" AND ".join(clauses)}
+        ORDER BY alert.id
+        LIMIT ?
+    """
+    return sql, (*params, page_size(limit) + 1)
+
+
+def poll_alerts(
+    store: "SQLiteArticleStore",
+    *,
+    after: Optional[str] = None,
+    team: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Page:
+    with store.transaction() as conn:
+        _ensure_schema(conn)
+        page = fetch_page(conn, alert_matches_query(after, team, limit), limit, ("alert_id",))
+    if page.next_cursor is None:
+        return Page(rows=page.rows, next_cursor=encode_cursor([page.rows[-1]["alert_id"]]) if page.rows else after)
+    return page
+
+
+def _split(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    parts = (part.strip() for value in values or () for part in value.split(","))
+    return tuple(dict.fromkeys(part for part in parts if part))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage keyword alert rules and poll matched articles")
+    parser.add_argument("--db-path", help="Override DB path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Create or replace a rule")
+    add.add_argument("name")
+    add.add_argument("keywords", nargs="+", help="Keywords or phrases; prefix* wildcards allowed; any one matches")
+    add.add_argument("--category", action="append", help="Only match articles in these categories")
+    add.add_argument("--team", default="", help="Team to notify")
+
+    remove = commands.add_parser("remove", help="Delete a rule and its matches")
+    remove.add_argument("name")
+
+    commands.add_parser("list", help="List rules")
+    commands.add_parser("evaluate", help="Match articles stored since the last evaluation")
+
+    poll = commands.add_parser("poll", help="Print matches recorded after a cursor")
+    poll.add_argument("--after", help="Cursor printed by the previous poll")
+    poll.add_argument("--team", help="Only matches for this team")
+    poll.add_argument("--limit", type=int, default=DEFAULT_PAGE_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from .partitioned import open_store
+
+    cfg = load_config_from_env()
+    with open_store(cfg, args.db_path) as store:
+        store.init_schema()
+        if args.command == "add":
+            add_rule(store, AlertRule(args.name, tuple(args.keywords), _split(args.category), args.team))
+        elif args.command == "remove":
+            if not remove_rule(store, args.name):
+                parser.exit(1, f"No alert rule named {args.name!r}\n")
+        elif args.command == "list":
+            for rule in list_rules(store):
+                print(f"{rule.name}\t{rule.team or '-'}\t{','.join(rule.categories) or '*'}\t{' | '.join(rule.keywords)}")
+        elif args.command == "evaluate":
+            report = evaluate_alerts(store)
+            logger.info(
+                "Evaluated %s rules against %s articles: %s new matches in %.1f ms",
+                report.rules,
+                report.articles_scanned,
+                report.matches,
+                report.elapsed_seconds * 1000,
+            )
+        else:
+            page = poll_alerts(store, after=args.after, team=args.team, limit=args.limit)
+            for row in page.rows:
+                print(f"{row['alert_id']}\t{row['rule']}\t{row['team'] or '-'}\t{row['name']}\t{row['url'] or ''}")
+            if page.next_cursor:
+                print(f"# resume with --after {page.next_cursor}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
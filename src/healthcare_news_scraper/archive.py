@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+ARCHIVE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS fetches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_fetches_fetched_at ON fetches(fetched_at);
+CREATE INDEX IF NOT EXISTS idx_fetches_url ON fetches(url, fetched_at);
+"""
+
+
+@dataclass(frozen=True)
+class ArchivedFetch:
+    fetch_id: int
+    url: str
+    fetched_at: str
+    digest: str
+    size: int
+
+
+class RawHtmlArchive:
+    def __init__(self, root_dir: str) -> None:
+        self.root = Path(root_dir)
+        self.blob_dir = self.root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.db"
+        with self._connect() as conn:
+            conn.executescript(ARCHIVE_SCHEMA_SQL)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            connection.row_factory = sqlite3.Row
+            yield connection
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.html.gz"
+
+    def _write_blob(self, digest: str, payload: bytes) -> None:
+        path = self.blob_path(digest)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(gzip.compress(payload, mtime=0))
+        os.replace(tmp_path, path)
+
+    def store(self, url: str, html: str, fetched_at: Optional[str] = None) -> str:
+        payload = html.encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        self._write_blob(digest, payload)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO fetches (url, fetched_at, digest, size) VALUES (?, ?, ?, ?)",
+                (url, fetched_at or datetime.now(timezone.utc).isoformat(), digest, len(payload)),
+            )
+        return digest
+
+    def load(self, digest: str) -> str:
+        return gzip.decompress(self.blob_path(digest).read_bytes()).decode("utf-8")
+
+    def iter_fetches(self, url: Optional[str] = None, since: Optional[str] = None) -> Iterator[ArchivedFetch]:
+        clauses = []
+        params = []
+        if url:
+            clauses.append("url = ?")
+            params.append(url)
+        if since:
+            clauses.append("fetched_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT * FROM fetches {where} ORDER BY fetched_at, id", params).fetchall()
+        for row in rows:
+            yield ArchivedFetch(
+                fetch_id=int(row["id"]),
+                url=row["url"],
+                fetched_at=row["fetched_at"],
+                digest=row["digest"],
+                size=int(row["size"]),
+            )
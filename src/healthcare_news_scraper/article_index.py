@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import bisect
+import re
+from collections import Counter
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .classifier import WILDCARD
+
+
+DEFAULT_FIELDS = ("title", "category")
+FACET_FIELD = "category"
+OPERATORS = {"AND", "OR", "NOT"}
+
+GRAM_SIZE = 3
+TOKEN_PATTERN = re.compile(r"\w+")
+QUERY_TOKEN_PATTERN = re.compile(r'\(|\)|-?[\w.]+:"[^"]*"|-?"[^"]*"|[^\s()]+')
+FIELD_PATTERN = re.compile(r"(\w+):(.+)")
+
+Postings = Set[int]
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class ArticleIndex:
+    def __init__(self, articles: Sequence[Dict[str, str]], fields: Sequence[str] = DEFAULT_FIELDS) -> None:
+        self.articles = list(articles)
+        self.fields = tuple(fields)
+        self._all: FrozenSet[int] = frozenset(range(len(self.articles)))
+        self._terms: Dict[str, Postings] = {}
+        self._field_terms: Dict[Tuple[str, str], Postings] = {}
+        self._facets: Dict[str, Postings] = {}
+        self._texts: List[Dict[str, str]] = []
+        for doc_id, article in enumerate(self.articles):
+            texts = {field: str(article.get(field) or "").lower() for field in self.fields}
+            self._texts.append(texts)
+            for field, text in texts.items():
+                for token in set(tokenize(text)):
+                    self._terms.setdefault(token, set()).add(doc_id)
+                    self._field_terms.setdefault((field, token), set()).add(doc_id)
+            self._facets.setdefault(str(article.get(FACET_FIELD) or "").lower(), set()).add(doc_id)
+        self._vocabulary = sorted(self._terms)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def _articles(self, doc_ids: Iterable[int], limit: Optional[int] = None) -> List[Dict[str, str]]:
+        ordered = sorted(doc_ids)
+        if limit is not None:
+            ordered = ordered[: max(0, limit)]
+        return [self.articles[doc_id] for doc_id in ordered]
+
+    def _prefix_postings(self, prefix: str, field: Optional[str]) -> Postings:
+        matched: Postings = set()
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            matched |= self._term_postings(token, field)
+        return matched
+
+    def _term_postings(self, token: str, field: Optional[str]) -> Postings:
+        if field is None:
+            return self._terms.get(token, set())
+        return self._field_terms.get((field, token), set())
+
+    def _phrase_postings(self, phrase: str, field: Optional[str]) -> Postings:
+        tokens = tokenize(phrase)
+        if not tokens:
+            return set(self._all)
+        candidates = set.intersection(*(self._term_postings(token, field) for token in tokens))
+        fields = (field,) if field else self.fields
+        needle = phrase.lower()
+        return {doc_id for doc_id in candidates if any(needle in self._texts[doc_id][name] for name in fields)}
+
+    def term(self, text: str, field: Optional[str] = None) -> Postings:
+        if field == FACET_FIELD and not text.endswith(WILDCARD):
+            return set(self._facets.get(text.lower(), set()))
+        if field is not None and field not in self.fields:
+            raise ValueError(f"Unknown query field: {field!r}")
+        if text.endswith(WILDCARD):
+            return self._prefix_postings(text.rstrip(WILDCARD).lower(), field)
+        tokens = tokenize(text)
+        if len(tokens) == 1 and tokens[0] == text.lower():
+            return set(self._term_postings(tokens[0], field))
+        return self._phrase_postings(text, field)
+
+    def contains(self, needle: str) -> List[Dict[str, str]]:
+        needle = needle.lower().strip()
+        if not needle:
+            return list(self.articles)
+        words = tokenize(needle)
+        if words:
+            candidates = set.intersection(*(self._substring_postings(word) for word in words))
+        else:
+            candidates = set(self._all)
+        return self._articles(
+            doc_id for doc_id in candidates if any(needle in self._texts[doc_id][field] for field in self.fields)
+        )
+
+    @cached_property
+    def _grams(self) -> Dict[str, Set[str]]:
+        grams: Dict[str, Set[str]] = {}
+        for token in self._vocabulary:
+            for start in range(len(token) - GRAM_SIZE + 1):
+                grams.setdefault(token[start : start + GRAM_SIZE], set()).add(token)
+        return grams
+
+    def _substring_postings(self, word: str) -> Postings:
+        if len(word) < GRAM_SIZE:
+            tokens: Iterable[str] = self._vocabulary
+        else:
+            tokens = set.intersection(
+                *(self._grams.get(word[start : start + GRAM_SIZE], set()) for start in range(len(word) - GRAM_SIZE + 1))
+            )
+        matched: Postings = set()
+        for token in tokens:
+            if word in token:
+                matched |= self._terms[token]
+        return matched
+
+    def match(self, query: str, *, categories: Optional[Iterable[str]] = None) -> Postings:
+        tokens = QUERY_TOKEN_PATTERN.findall(query)
+        result = _QueryParser(self, tokens).parse() if tokens else set(self._all)
+        if categories is not None:
+            allowed: Postings = set()
+            for category in categories:
+                allowed |= self._facets.get(category.lower(), set())
+            result &= allowed
+        return result
+
+    def search(
+        self,
+        query: str,
+        *,
+        categories: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, str]]:
+        return self._articles(self.match(query, categories=categories), limit)
+
+    def facet_counts(self, query: str = "") -> Dict[str, int]:
+        matched = self.match(query)
+        counts = Counter({category: len(ids & matched) for category, ids in self._facets.items()})
+        return {category: count for category, count in counts.most_common() if count}
+
+    def complement(self, doc_ids: Postings) -> Postings:
+        return set(self._all - doc_ids)
+
+
+class _QueryParser:
+    def __init__(self, index: ArticleIndex, tokens: List[str]) -> None:
+        self.index = index
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _take(self) -> str:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> Postings:
+        result = self._or()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected {self._peek()!r} in query")
+        return result
+
+    def _or(self) -> Postings:
+        result = self._and()
+        while self._peek() == "OR":
+            self._take()
+            result = result | self._and()
+        return result
+
+    def _and(self) -> Postings:
+        result = self._not()
+        while self._peek() not in (None, "OR", ")"):
+            if self._peek() == "AND":
+                self._take()
+            result = result & self._not()
+        return result
+
+    def _not(self) -> Postings:
+        token = self._peek()
+        if token == "NOT":
+            self._take()
+            return self.index.complement(self._not())
+        if token is not None and token.startswith("-") and len(token) > 1:
+            self._take()
+            return self.index.complement(self._term(token[1:]))
+        return self._atom()
+
+    def _atom(self) -> Postings:
+        token = self._peek()
+        if token is None or token in OPERATORS or token == ")":
+            raise ValueError(f"Expected a search term, got {token!r}")
+        self._take()
+        if token != "(":
+            return self._term(token)
+        result = self._or()
+        if self._peek() != ")":
+            raise ValueError("Unbalanced parentheses in query")
+        self._take()
+        return result
+
+    def _term(self, token: str) -> Postings:
+        field: Optional[str] = None
+        match = FIELD_PATTERN.fullmatch(token)
+        if match and (match.group(1) in self.index.fields or match.group(1) == FACET_FIELD):
+            field, token = match.group(1), match.group(2)
+        value = token.strip('"')
+        if not value:
+            raise ValueError(f"Empty search term in {token!r}")
+        return self.index.term(value, field)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from .cache import JsonFileCache
+from .exceptions import ResponseTooLargeError, ScraperNetworkError, ScraperTimeoutError
+from .http import DEFAULT_MAX_RESPONSE_BYTES, NOT_MODIFIED_STATUS, READ_CHUNK_BYTES, conditional_headers
+
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_PER_HOST_LIMIT = 10
+
+
+class BufferedHttpResponse:
+    def __init__(self, url: str, status_code: int, text: str, not_modified: bool = False) -> None:
+        self.url = url
+        self.status_code = status_code
+        self._text = text
+        self._not_modified = not_modified
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def not_modified(self) -> bool:
+        return self._not_modified
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise ScraperNetworkError(f"Network error fetching {self.url}: HTTP {self.status_code}")
+
+
+class AiohttpHttpClient:
+    def __init__(
+        self,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+        validator_cache: Optional[JsonFileCache] = None,
+    ) -> None:
+        self.connection_limit = connection_limit
+        self.per_host_limit = per_host_limit
+        self.max_response_bytes = max_response_bytes
+        self._validators = validator_cache
+        self._session: Any = None
+
+    def _ensure_session(self) -> Any:
+        if self._session is not None:
+            return self._session
+        try:
+            import aiohttp
+        except ImportError as exc:  # pragma: no cover - depends on installed extras
+            raise ImportError(
+                "AiohttpHttpClient requires aiohttp; install healthcare_news_scraper[async]"
+            ) from exc
+
+        connector = aiohttp.TCPConnector(limit=self.connection_limit, limit_per_host=self.per_host_limit)
+        self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _read_body(self, url: str, response: Any) -> bytes:
+        if response.content_length is not None and response.content_length > self.max_response_bytes:
+            raise ResponseTooLargeError(f"Response from {url} exceeds {self.max_response_bytes} bytes")
+
+        chunks = []
+        received = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+            received += len(chunk)
+            if received > self.max_response_bytes:
+                raise ResponseTooLargeError(f"Response from {url} exceeds {self.max_response_bytes} bytes")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _remember(self, url: str, status: int, headers: Any, text: str) -> None:
+        if self._validators is None or status >= 400:
+            return
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+        self._validators.set(url, {"etag": etag, "last_modified": last_modified, "body": text})
+
+    async def get(self, url: str, *, headers: Dict[str, str], timeout: int) -> BufferedHttpResponse:
+        import aiohttp
+
+        session = self._ensure_session()
+        cached = self._validators.get(url) if self._validators is not None else None
+        try:
+            async with session.get(
+                url,
+                headers=conditional_headers(headers, cached),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                if cached and response.status == NOT_MODIFIED_STATUS:
+                    return BufferedHttpResponse(url, response.status, cached.get("body", ""), not_modified=True)
+                body = await self._read_body(url, response)
+                text = body.decode(response.charset or "utf-8", errors="replace")
+                self._remember(url, response.status, response.headers, text)
+                return BufferedHttpResponse(url, response.status, text)
+        except asyncio.TimeoutError as exc:
+            raise ScraperTimeoutError(f"Timed out fetching {url}", cause=exc) from exc
+        except aiohttp.ClientError as exc:
+            raise ScraperNetworkError(f"Network error fetching {url}", cause=exc) from exc
+
+    async def close(self) -> None:
+        if self._validators is not None:
+            self._validators.flush()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AiohttpHttpClient":
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .archive import ArchivedFetch, RawHtmlArchive
+from .config import load_config_from_env
+from .protocols import ArticleStore, RunHistory
+from .scraper import PAGE_QUERY_PARAM, merge_article_pages
+
+
+logger = logging.getLogger("healthcare_news_scraper.backfill")
+
+BACKFILL_SOURCE = "backfill"
+
+
+_PARSER = None
+
+
+def _init_parser(parser_backend: str, use_strainer: bool, category_keywords_path: str) -> None:
+    from .classifier import KeywordClassifier
+    from .http import RequestsHttpClient
+    from .scraper import HealthcareNewsScraper
+
+    global _PARSER
+    _PARSER = HealthcareNewsScraper(
+        delay_seconds=0,
+        http_client=RequestsHttpClient(),
+        parser_backend=parser_backend,
+        use_strainer=use_strainer,
+        category_classifier=(
+            KeywordClassifier.from_file(category_keywords_path, default="general") if category_keywords_path else None
+        ),
+    )
+
+
+def _parse_archived(job: Tuple[str, str]) -> List[Dict[str, str]]:
+    archive_dir, digest = job
+    return _PARSER.parse_articles(RawHtmlArchive(archive_dir).load(digest))
+
+
+def _is_follow_up_page(url: str) -> bool:
+    values = parse_qs(urlsplit(url).query).get(PAGE_QUERY_PARAM)
+    return bool(values) and values[0].isdigit() and int(values[0]) > 1
+
+
+def group_crawls(fetches: Iterable[ArchivedFetch]) -> List[List[ArchivedFetch]]:
+    crawls: List[List[ArchivedFetch]] = []
+    for fetch in fetches:
+        if crawls and _is_follow_up_page(fetch.url):
+            crawls[-1].append(fetch)
+        else:
+            crawls.append([fetch])
+    return crawls
+
+
+def backfill_archive(
+    archive: RawHtmlArchive,
+    store: ArticleStore,
+    *,
+    since: Optional[str] = None,
+    workers: int = 0,
+    parser_backend: str = "html.parser",
+    use_strainer: bool = False,
+    category_keywords_path: str = "",
+) -> int:
+    store.init_schema()
+    persisted = store.run_timestamps(BACKFILL_SOURCE) if isinstance(store, RunHistory) else set()
+    crawls = [crawl for crawl in group_crawls(archive.iter_fetches(since=since)) if crawl[0].fetched_at not in persisted]
+    digests = list(dict.fromkeys(fetch.digest for crawl in crawls for fetch in crawl))
+    if not digests:
+        return 0
+
+    with ProcessPoolExecutor(
+        max_workers=workers or None,
+        initializer=_init_parser,
+        initargs=(parser_backend, use_strainer, category_keywords_path),
+    ) as executor:
+        jobs = [(str(archive.root), digest) for digest in digests]
+        parsed = dict(zip(digests, executor.map(_parse_archived, jobs, chunksize=max(1, len(jobs) // 64))))
+
+    for crawl in crawls:
+        store.persist_run(
+            source=BACKFILL_SOURCE,
+            fetched_at=crawl[0].fetched_at,
+            search_term="",
+            record_limit=0,
+            status="success",
+            attempts=1,
+            error="",
+            articles=merge_article_pages(parsed[fetch.digest] for fetch in crawl),
+        )
+    return len(crawls)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay archived raw HTML through the parser without network access")
+    parser.add_argument("--archive-dir", help="Raw HTML archive directory. Defaults to ARCHIVE_DIR env.")
+    parser.add_argument("--db-path", help="Override DB path")
+    parser.add_argument("--since", help="Only replay fetches at or after this ISO timestamp")
+    parser.add_argument("--workers", type=int, default=0, help="Parser processes (default: CPU count)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    cfg = load_config_from_env()
+    archive_dir = args.archive_dir or cfg.archive_dir
+    if not archive_dir:
+        parser.error("--archive-dir or ARCHIVE_DIR is required")
+
+    from .partitioned import open_store
+
+    started = time.perf_counter()
+    with open_store(cfg, args.db_path) as store:
+        replayed = backfill_archive(
+            RawHtmlArchive(archive_dir),
+            store,
+            since=args.since,
+            workers=args.workers,
+            parser_backend=cfg.parser_backend,
+            use_strainer=cfg.parser_strainer,
+            category_keywords_path=cfg.category_keywords_path,
+        )
+    logger.info("Replayed %s archived crawls in %.1fs", replayed, time.perf_counter() - started)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
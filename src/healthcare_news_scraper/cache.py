@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_FLUSH_EVERY = 64
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class JsonFileCache:
+    def __init__(self, path: str, flush_every: int = DEFAULT_FLUSH_EVERY, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = Path(path)
+        self.flush_every = max(1, flush_every)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = self._load()
+        self._unsaved = 0
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(self._entries, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            if self.max_entries > 0:
+                for stale in list(self._entries)[: len(self._entries) - self.max_entries]:
+                    del self._entries[stale]
+            self._unsaved += 1
+            if self._unsaved >= self.flush_every:
+                self._save()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "JsonFileCache":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import bisect
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Set, Tuple
+
+
+WILDCARD = "*"
+BATCH_SEPARATOR = "\n"
+
+
+@dataclass(frozen=True)
+class KeywordRule:
+    label: str
+    keywords: Tuple[str, ...]
+    priority: int = 0
+
+
+def _render_trie(node: Dict[str, object], boundary: str) -> str:
+    alternatives = []
+    for char in sorted(key for key in node if key):
+        alternatives.append(re.escape(char) + _render_trie(node[char], boundary))  # type: ignore[arg-type]
+    terminal = node.get("")
+    if terminal == "prefix":
+        alternatives.append(r"\w*" + boundary if boundary else "")
+    elif terminal == "exact":
+        alternatives.append(boundary)
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+def compile_keyword_pattern(
+    keywords: Iterable[str],
+    word_boundaries: bool = True,
+    case_sensitive: bool = False,
+    overlapping: bool = False,
+) -> Pattern[str]:
+    trie: Dict[str, object] = {}
+    for keyword in keywords:
+        is_prefix = keyword.endswith(WILDCARD)
+        word = keyword.rstrip(WILDCARD)
+        if not word:
+            continue
+        node = trie
+        for char in word if case_sensitive else word.lower():
+            node = node.setdefault(char, {})  # type: ignore[assignment]
+        if is_prefix or node.get("") != "prefix":
+            node[""] = "prefix" if is_prefix else "exact"
+    if not trie:
+        return re.compile(r"(?!)")
+
+    boundary = r"\b" if word_boundaries else ""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    body = _render_trie(trie, boundary)
+    if overlapping:
+        body = f"(?=({body}))"
+    return re.compile(boundary + body, flags)
+
+
+class KeywordClassifier:
+    def __init__(
+        self,
+        rules: Sequence[KeywordRule],
+        default: str = "",
+        case_sensitive: bool = False,
+        word_boundaries: bool = True,
+    ) -> None:
+        self.rules = list(rules)
+        self.default = default
+        self.case_sensitive = case_sensitive
+        self._exact: Dict[str, Set[int]] = {}
+        self._prefixes: Dict[str, Set[int]] = {}
+        for index, rule in enumerate(self.rules):
+            for keyword in rule.keywords:
+                target = self._prefixes if keyword.endswith(WILDCARD) else self._exact
+                target.setdefault(self._fold(keyword.rstrip(WILDCARD)), set()).add(index)
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+        keywords = [keyword for rule in self.rules for keyword in rule.keywords]
+        self._pattern = compile_keyword_pattern(keywords, word_boundaries=word_boundaries, case_sensitive=case_sensitive)
+        self._starts = compile_keyword_pattern(
+            keywords,
+            word_boundaries=word_boundaries,
+            case_sensitive=case_sensitive,
+            overlapping=True,
+        )
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, Sequence[str]], **kwargs: object) -> "KeywordClassifier":
+        rules = [KeywordRule(label, tuple(keywords), priority) for priority, (label, keywords) in enumerate(mapping.items())]
+        return cls(rules, **kwargs)  # type: ignore[arg-type]
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: object) -> "KeywordClassifier":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            return cls.from_mapping(data, **kwargs)
+        rules = [
+            KeywordRule(str(item["label"]), tuple(item["keywords"]), int(item.get("priority", index)))
+            for index, item in enumerate(data)
+        ]
+        return cls(rules, **kwargs)  # type: ignore[arg-type]
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _rules_for_match(self, matched: str) -> Set[int]:
+        key = self._fold(matched)
+        found = set(self._exact.get(key, ()))
+        for position in range(1, len(key)):
+            if not key[position].isalnum() and key[position - 1].isalnum():
+                found.update(self._exact.get(key[:position], ()))
+        for length in self._prefix_lengths:
+            if length > len(key):
+                break
+            found.update(self._prefixes.get(key[:length], ()))
+        return found
+
+    def _best_label(self, rule_indexes: Iterable[int]) -> str:
+        best: Optional[Tuple[int, int]] = None
+        for index in rule_indexes:
+            candidate = (self.rules[index].priority, index)
+            if best is None or candidate < best:
+                best = candidate
+        return self.rules[best[1]].label if best is not None else self.default
+
+    def matches(self, text: str) -> bool:
+        return self._pattern.search(text) is not None
+
+    def _matched_rules(self, text: str) -> Set[int]:
+        found: Set[int] = set()
+        for match in self._starts.finditer(text):
+            found |= self._rules_for_match(match.group(1))
+        return found
+
+    def labels(self, text: str) -> List[str]:
+        found = self._matched_rules(text)
+        ordered = sorted(found, key=lambda index: (self.rules[index].priority, index))
+        return list(dict.fromkeys(self.rules[index].label for index in ordered))
+
+    def classify(self, text: str) -> str:
+        return self._best_label(self._matched_rules(text))
+
+    def rule_matches_many(self, texts: Sequence[str]) -> List[Set[int]]:
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + len(BATCH_SEPARATOR)
+
+        found: List[Set[int]] = [set() for _ in texts]
+        for match in self._starts.finditer(BATCH_SEPARATOR.join(texts)):
+            found[bisect.bisect_right(offsets, match.start()) - 1] |= self._rules_for_match(match.group(1))
+        return found
+
+    def classify_many(self, texts: Sequence[str]) -> List[str]:
+        return [self._best_label(indexes) for indexes in self.rule_matches_many(texts)]
@@ -12,11 +12,52 @@ class PipelineConfig:
     scraper_strategy: str = "web"
     scraper_search_term: str = ""
     scraper_limit: int = 0
+    scraper_max_pages: int = 1
+    scraper_max_workers: int = 4
+    scraper_async: bool = False
+    parser_backend: str = "html.parser"
+    parser_strainer: bool = False
+    category_keywords_path: str = ""
+    enrich_articles: bool = False
+    enrich_max_workers: int = 4
+    rate_limit_per_second: float = 1.0
+    rate_limit_burst: int = 4
+    max_concurrent_per_host: int = 4
     db_path: str = "/data/healthcare_news.db"
+    db_partition_dir: str = ""
+    persist_chunk_size: int = 0
+    db_journal_mode: str = ""
+    db_synchronous: str = ""
+    db_cache_size_kib: int = 16384
+    db_mmap_size_bytes: int = 0
+    db_busy_timeout_ms: int = 5000
+    db_write_queue: bool = False
+    db_write_queue_size: int = 16
+    db_write_batch_size: int = 32
+    db_group_commit_ms: int = 10
+    db_write_queue_timeout_seconds: float = 0.0
+    retention_max_age_days: int = 0
+    retention_max_runs: int = 0
+    retention_batch_size: int = 500
+    alerts_enabled: bool = False
+    dedup_min_similarity: float = 0.0
+    dedup_min_tokens: int = 4
+    url_canonicalize: bool = True
+    url_force_https: bool = True
+    url_strip_www: bool = False
+    url_strip_params: str = "utm_*,fbclid,gclid,dclid,msclkid,mc_cid,mc_eid,_ga,_gl,_hsenc,_hsmkt,mkt_tok"
+    db_product_cache_size: int = 100000
+    http_cache_dir: str = ""
+    archive_dir: str = ""
+    http_pool_size: int = 10
+    http_max_response_bytes: int = 10 * 1024 * 1024
     retry_attempts: int = 3
     retry_backoff_seconds: float = 5.0
     api_token: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if self.scraper_async and self.persist_chunk_size > 0:
+            raise ValueError("SCRAPER_ASYNC cannot be combined with PERSIST_CHUNK_SIZE; streaming runs use the sync engine")
 
 
 def _env_int(name: str, default: int) -> int:
@@ -35,6 +76,14 @@ def _env_float(name: str, default: float) -> float:
 
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+
 def load_config_from_env() -> PipelineConfig:
     return PipelineConfig(
         cron_schedule=os.getenv("CRON_SCHEDULE", "0 */6 * * *"),
@@ -42,7 +91,45 @@ def load_config_from_env() -> PipelineConfig:
         scraper_strategy=os.getenv("SCRAPER_STRATEGY", "web"),
         scraper_search_term=os.getenv("SCRAPER_SEARCH_TERM", ""),
         scraper_limit=_env_int("SCRAPER_LIMIT", 0),
+        scraper_max_pages=_env_int("SCRAPER_MAX_PAGES", 1),
+        scraper_max_workers=_env_int("SCRAPER_MAX_WORKERS", 4),
+        scraper_async=_env_bool("SCRAPER_ASYNC", False),
+        parser_backend=os.getenv("PARSER_BACKEND", "html.parser"),
+        parser_strainer=_env_bool("PARSER_STRAINER", False),
+        category_keywords_path=os.getenv("CATEGORY_KEYWORDS_PATH", ""),
+        enrich_articles=_env_bool("ENRICH_ARTICLES", False),
+        enrich_max_workers=_env_int("ENRICH_MAX_WORKERS", 4),
+        rate_limit_per_second=_env_float("RATE_LIMIT_PER_SECOND", 1.0),
+        rate_limit_burst=_env_int("RATE_LIMIT_BURST", 4),
+        max_concurrent_per_host=_env_int("MAX_CONCURRENT_PER_HOST", 4),
         db_path=os.getenv("DB_PATH", "/data/healthcare_news.db"),
+        db_partition_dir=os.getenv("DB_PARTITION_DIR", ""),
+        persist_chunk_size=_env_int("PERSIST_CHUNK_SIZE", 0),
+        db_journal_mode=os.getenv("DB_JOURNAL_MODE", ""),
+        db_synchronous=os.getenv("DB_SYNCHRONOUS", ""),
+        db_cache_size_kib=_env_int("DB_CACHE_SIZE_KIB", 16384),
+        db_mmap_size_bytes=_env_int("DB_MMAP_SIZE_BYTES", 0),
+        db_busy_timeout_ms=_env_int("DB_BUSY_TIMEOUT_MS", 5000),
+        db_write_queue=_env_bool("DB_WRITE_QUEUE", False),
+        db_write_queue_size=_env_int("DB_WRITE_QUEUE_SIZE", 16),
+        db_write_batch_size=_env_int("DB_WRITE_BATCH_SIZE", 32),
+        db_group_commit_ms=_env_int("DB_GROUP_COMMIT_MS", 10),
+        db_write_queue_timeout_seconds=_env_float("DB_WRITE_QUEUE_TIMEOUT_SECONDS", 0.0),
+        retention_max_age_days=_env_int("RETENTION_MAX_AGE_DAYS", 0),
+        retention_max_runs=_env_int("RETENTION_MAX_RUNS", 0),
+        retention_batch_size=_env_int("RETENTION_BATCH_SIZE", 500),
+        alerts_enabled=_env_bool("ALERTS_ENABLED", False),
+        dedup_min_similarity=_env_float("DEDUP_MIN_SIMILARITY", 0.0),
+        dedup_min_tokens=_env_int("DEDUP_MIN_TOKENS", 4),
+        url_canonicalize=_env_bool("URL_CANONICALIZE", True),
+        url_force_https=_env_bool("URL_FORCE_HTTPS", True),
+        url_strip_www=_env_bool("URL_STRIP_WWW", False),
+        url_strip_params=os.getenv("URL_STRIP_PARAMS", PipelineConfig.url_strip_params),
+        db_product_cache_size=_env_int("DB_PRODUCT_CACHE_SIZE", 100000),
+        http_cache_dir=os.getenv("HTTP_CACHE_DIR", ""),
+        archive_dir=os.getenv("ARCHIVE_DIR", ""),
+        http_pool_size=_env_int("HTTP_POOL_SIZE", 10),
+        http_max_response_bytes=_env_int("HTTP_MAX_RESPONSE_BYTES", 10 * 1024 * 1024),
         retry_attempts=_env_int("RETRY_ATTEMPTS", 3),
         retry_backoff_seconds=_env_float("RETRY_BACKOFF_SECONDS", 5.0),
         api_token=os.getenv("API_TOKEN"),
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import sqlite3
+import struct
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .config import PipelineConfig
+
+
+SIGNATURE_SIZE = 32
+BAND_COUNT = 8
+BAND_ROWS = SIGNATURE_SIZE // BAND_COUNT
+MERSENNE_PRIME = (1 << 61) - 1
+HASH_MASK = (1 << 32) - 1
+SIGNATURE_FORMAT = struct.Struct(f"<{SIGNATURE_SIZE}I")
+LOOKUP_CHUNK_SIZE = 400
+BODY_SHINGLE_SIZE = 3
+BODY_MIN_SHINGLES = 8
+FINGERPRINT_COLUMNS = {"event_date": "TEXT", "body_signature": "BLOB"}
+MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+ISO_DATE_PATTERN = re.compile(r"\b\d{4}-(\d{2})-(\d{2})\b")
+
+TOKEN_PATTERN = re.compile(r"\w+")
+_RNG = random.Random(20260217)
+PERMUTATIONS = tuple((_RNG.randrange(1, MERSENNE_PRIME), _RNG.randrange(0, MERSENNE_PRIME)) for _ in range(SIGNATURE_SIZE))
+
+DEDUP_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS product_fingerprints (
+    product_id INTEGER PRIMARY KEY,
+    signature BLOB NOT NULL,
+    event_date TEXT,
+    body_signature BLOB
+);
+
+CREATE TABLE IF NOT EXISTS fingerprint_bands (
+    band INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    PRIMARY KEY (band, value, product_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS product_aliases (
+    alias_key TEXT PRIMARY KEY,
+    product_id INTEGER NOT NULL,
+    similarity REAL NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_product_aliases_product ON product_aliases(product_id);
+"""
+
+ProductRow = Tuple[str, str, Optional[str], Optional[str], Optional[str]]
+Signature = Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class NearDuplicatePolicy:
+    min_similarity: float = 0.0
+    min_tokens: int = 4
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.min_similarity <= 1.0:
+            raise ValueError(f"min_similarity must be between 0 and 1, got {self.min_similarity}")
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> "NearDuplicatePolicy":
+        return cls(min_similarity=config.dedup_min_similarity, min_tokens=config.dedup_min_tokens)
+
+    @property
+    def enabled(self) -> bool:
+        return self.min_similarity > 0
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _minhash(items: FrozenSet[str]) -> Signature:
+    hashes = [_token_hash(item) for item in items]
+    return tuple(min([(a * value + b) % MERSENNE_PRIME for value in hashes]) & HASH_MASK for a, b in PERMUTATIONS)
+
+
+def minhash_signature(text: str, min_tokens: int = 1) -> Optional[Signature]:
+    tokens = frozenset(TOKEN_PATTERN.findall(text.lower()))
+    if len(tokens) < max(1, min_tokens):
+        return None
+    return _minhash(tokens)
+
+
+def body_signature(body: Optional[str]) -> Optional[Signature]:
+    words = TOKEN_PATTERN.findall((body or "").lower())
+    shingles = frozenset(" ".join(words[index : index + BODY_SHINGLE_SIZE]) for index in range(len(words) - BODY_SHINGLE_SIZE + 1))
+    if len(shingles) < BODY_MIN_SHINGLES:
+        return None
+    return _minhash(shingles)
+
+
+def date_key(text: Optional[str]) -> str:
+    text = (text or "").lower()
+    iso = ISO_DATE_PATTERN.search(text)
+    if iso:
+        return f"{int(iso.group(1)):02d}-{int(iso.group(2)):02d}"
+    tokens = TOKEN_PATTERN.findall(text)
+    month = next((MONTHS.index(token[:3]) + 1 for token in tokens if token[:3] in MONTHS and len(token) >= 3), None)
+    day = next((int(token) for token in tokens if token.isdigit() and len(token) <= 2 and 1 <= int(token) <= 31), None)
+    if month is not None and day is not None:
+        return f"{month:02d}-{day:02d}"
+    return " ".join(tokens)
+
+
+def similarity(left: Signature, right: Signature) -> float:
+    return sum(1 for a, b in zip(left, right) if a == b) / SIGNATURE_SIZE
+
+
+def pack_signature(signature: Signature) -> bytes:
+    return SIGNATURE_FORMAT.pack(*signature)
+
+
+def unpack_signature(blob: bytes) -> Signature:
+    return SIGNATURE_FORMAT.unpack(blob)
+
+
+def bands(signature: Signature) -> List[Tuple[int, int]]:
+    packed = pack_signature(signature)
+    width = BAND_ROWS * 4
+    return [
+        (band, int.from_bytes(hashlib.blake2b(packed[band * width : (band + 1) * width], digest_size=8).digest(), "big", signed=True))
+        for band in range(BAND_COUNT)
+    ]
+
+
+def _source(url: Optional[str]) -> str:
+    try:
+        return urlsplit(url or "").netloc.lower()
+    except ValueError:
+        return ""
+
+
+def _numbers(text: str) -> FrozenSet[str]:
+    return frozenset(token.lstrip("0") for token in TOKEN_PATTERN.findall(text) if token.isdigit())
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    key: str
+    name: str
+    url: Optional[str]
+    signature: Signature = ()
+    event_date: str = ""
+    body: Optional[Signature] = None
+
+
+class NearDuplicateResolver:
+    def __init__(self, conn: sqlite3.Connection, policy: NearDuplicatePolicy) -> None:
+        self.conn = conn
+        self.policy = policy
+        self.aliases: List[Tuple[str, str, float]] = []
+        self.fingerprints: List[_Candidate] = []
+        self._batch: Dict[Tuple[int, int], List[_Candidate]] = {}
+
+    def _known(self, keys: Sequence[str]) -> Dict[str, _Candidate]:
+        known: Dict[str, _Candidate] = {}
+        for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[start : start + LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            for row in self.conn.execute(
+                f"""
+                SELECT products.canonical_key AS lookup, products.canonical_key, products.name, products.url
+                FROM products
+                WHERE canonical_key IN ({placeholders})
+                UNION ALL
+                SELECT alias.alias_key, products.canonical_key, products.name, products.url
+                FROM product_aliases AS alias
+                JOIN products ON products.id = alias.product_id
+                WHERE alias.alias_key IN ({placeholders})
+                """,
+                (*chunk, *chunk),
+            ):
+                known.setdefault(row["lookup"], _Candidate(row["canonical_key"], row["name"], row["url"]))
+        return known
+
+    def _stored_candidates(self, signature_bands: List[Tuple[int, int]]) -> List[_Candidate]:
+        rows = self.conn.execute(
+            f"""
+            SELECT
+                products.canonical_key,
+                products.name,
+                products.url,
+                fingerprint.signature,
+                fingerprint.event_date,
+                fingerprint.body_signature
+            FROM products
+            JOIN product_fingerprints AS fingerprint ON fingerprint.product_id = products.id
+            WHERE products.id IN (
+                SELECT product_id FROM fingerprint_bands
+                WHERE (band, value) IN (VALUES {", ".join("(?, ?)" for _ in signature_bands)})
+            )
+            ORDER BY products.id
+            """,
+            [value for pair in signature_bands for value in pair],
+        )
+        return [
+            _Candidate(
+                row["canonical_key"],
+                row["name"],
+                row["url"],
+                unpack_signature(row["signature"]),
+                row["event_date"] or "",
+                unpack_signature(row["body_signature"]) if row["body_signature"] else None,
+            )
+            for row in rows
+        ]
+
+    def _corroborated(self, new: _Candidate, old: _Candidate) -> bool:
+        if new.url and old.url and _source(new.url) == _source(old.url):
+            return False
+        if _numbers(new.name) != _numbers(old.name):
+            return False
+        if new.event_date and old.event_date and new.event_date != old.event_date:
+            return False
+        if new.body is not None and old.body is not None:
+            return similarity(new.body, old.body) >= self.policy.min_similarity
+        return bool(new.event_date and old.event_date)
+
+    def _nearest(self, new: _Candidate, signature_bands: List[Tuple[int, int]]) -> Optional[Tuple[_Candidate, float]]:
+        candidates = self._stored_candidates(signature_bands)
+        for pair in signature_bands:
+            candidates.extend(self._batch.get(pair, ()))
+        best: Optional[Tuple[_Candidate, float]] = None
+        for candidate in candidates:
+            score = similarity(new.signature, candidate.signature)
+            if score >= self.policy.min_similarity and (best is None or score > best[1]) and self._corroborated(new, candidate):
+                best = (candidate, score)
+        return best
+
+    def _resolve_new(self, product_row: ProductRow, event_date: str) -> _Candidate:
+        key, name, url, body = product_row[:4]
+        signature = minhash_signature(name, self.policy.min_tokens)
+        if signature is None:
+            return _Candidate(key, name, url)
+        candidate = _Candidate(key, name, url, signature, date_key(event_date), body_signature(body))
+        signature_bands = bands(signature)
+        nearest = self._nearest(candidate, signature_bands)
+        if nearest is not None:
+            self.aliases.append((key, nearest[0].key, nearest[1]))
+            return nearest[0]
+        self.fingerprints.append(candidate)
+        for pair in signature_bands:
+            self._batch.setdefault(pair, []).append(candidate)
+        return candidate
+
+    def resolve(self, product_rows: Sequence[ProductRow], event_dates: Sequence[str]) -> List[ProductRow]:
+        known = self._known(list(dict.fromkeys(row[0] for row in product_rows)))
+        resolved = []
+        for product_row, event_date in zip(product_rows, event_dates):
+            key = product_row[0]
+            match = known.get(key)
+            if match is None:
+                match = known[key] = self._resolve_new(product_row, event_date)
+            resolved.append(product_row if match.key == key else (match.key, match.name, match.url) + product_row[3:])
+        return resolved
+
+    def link(self) -> None:
+        self.conn.executemany(
+            """
+            INSERT OR IGNORE INTO product_aliases (alias_key, product_id, similarity)
+            SELECT ?, id, ? FROM products WHERE canonical_key = ?
+            """,
+            [(alias_key, score, canonical_key) for alias_key, canonical_key, score in self.aliases],
+        )
+        self.conn.executemany(
+            """
+            INSERT OR IGNORE INTO product_fingerprints (product_id, signature, event_date, body_signature)
+            SELECT id, ?, ?, ? FROM products WHERE canonical_key = ?
+            """,
+            [
+                (
+                    pack_signature(candidate.signature),
+                    candidate.event_date or None,
+                    pack_signature(candidate.body) if candidate.body is not None else None,
+                    candidate.key,
+                )
+                for candidate in self.fingerprints
+            ],
+        )
+        self.conn.executemany(
+            """
+            INSERT OR IGNORE INTO fingerprint_bands (band, value, product_id)
+            SELECT ?, ?, id FROM products WHERE canonical_key = ?
+            """,
+            [(band, value, candidate.key) for candidate in self.fingerprints for band, value in bands(candidate.signature)],
+        )
+
+
+def ensure_dedup_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript(DEDUP_SCHEMA_SQL)
+    existing = {row["name"] for row in conn.execute("PRAGMA table_info(product_fingerprints)")}
+    for name, declaration in FINGERPRINT_COLUMNS.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE product_fingerprints ADD COLUMN {name} {declaration}")
+
+
+def backfill_fingerprints(conn: sqlite3.Connection, policy: NearDuplicatePolicy) -> int:
+    has_snapshots = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'product_snapshots'"
+    ).fetchone()
+    event_date = "snapshot.event_date" if has_snapshots else "NULL"
+    snapshot_join = (
+        "LEFT JOIN product_snapshots AS snapshot ON snapshot.id = products.last_snapshot_id" if has_snapshots else ""
+    )
+    rows = conn.execute(
+        f"""
+        SELECT products.id, products.name, products.body, {event_date} AS event_date
+        FROM products
+        {snapshot_join}
+        LEFT JOIN product_fingerprints AS fingerprint ON fingerprint.product_id = products.id
+        WHERE fingerprint.product_id IS NULL
+        """
+    ).fetchall()
+    fingerprints = []
+    for row in rows:
+        signature = minhash_signature(row["name"], policy.min_tokens)
+        if signature is not None:
+            body = body_signature(row["body"])
+            fingerprints.append(
+                (
+                    row["id"],
+                    signature,
+                    date_key(row["event_date"]) or None,
+                    pack_signature(body) if body is not None else None,
+                )
+            )
+    conn.executemany(
+        "INSERT INTO product_fingerprints (product_id, signature, event_date, body_signature) VALUES (?, ?, ?, ?)",
+        [(product_id, pack_signature(signature), day, body) for product_id, signature, day, body in fingerprints],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO fingerprint_bands (band, value, product_id) VALUES (?, ?, ?)",
+        [(band, value, product_id) for product_id, signature, _, _ in fingerprints for band, value in bands(signature)],
+    )
+    return len(fingerprints)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+from bs4 import BeautifulSoup
+
+from .exceptions import HealthcareNewsError
+from .http import SessionHttpClient
+from .protocols import HttpClient
+from .ratelimit import HostRateLimiter
+from .scraper import DEFAULT_USER_AGENT
+
+
+logger = logging.getLogger("healthcare_news_scraper.enrichment")
+
+PUBLISHED_META_NAMES = ["article:published_time", "datePublished", "date", "dc.date"]
+BODY_CONTAINERS = ["article", "main"]
+TAG_SEPARATOR = ", "
+
+
+def _meta_content(soup: BeautifulSoup, names: Iterable[str]) -> str:
+    for name in names:
+        tag = soup.find("meta", attrs={"property": name}) or soup.find("meta", attrs={"name": name})
+        if tag and tag.get("content"):
+            return " ".join(tag["content"].split())
+    return ""
+
+
+def _extract_published_date(soup: BeautifulSoup) -> str:
+    published = _meta_content(soup, PUBLISHED_META_NAMES)
+    if published:
+        return published
+    time_tag = soup.find("time")
+    if time_tag is None:
+        return ""
+    return " ".join((time_tag.get("datetime") or time_tag.get_text(" ")).split())
+
+
+def _extract_body(soup: BeautifulSoup) -> str:
+    container = None
+    for name in BODY_CONTAINERS:
+        container = soup.find(name)
+        if container is not None:
+            break
+    paragraphs = (container or soup).find_all("p")
+    return "\n".join(" ".join(p.get_text(" ").split()) for p in paragraphs if p.get_text(strip=True))
+
+
+def _extract_tags(soup: BeautifulSoup) -> str:
+    tags: List[str] = []
+    keywords = _meta_content(soup, ["keywords"])
+    tags.extend(keyword.strip() for keyword in keywords.split(",") if keyword.strip())
+    for link in soup.select("a[rel~=tag], .tags a, .tag"):
+        text = " ".join(link.get_text(" ").split())
+        if text:
+            tags.append(text)
+    return TAG_SEPARATOR.join(dict.fromkeys(tags))
+
+
+def parse_article_detail(html: str) -> Dict[str, str]:
+    soup = BeautifulSoup(html, "html.parser")
+    return {
+        "date": _extract_published_date(soup),
+        "body": _extract_body(soup),
+        "tags": _extract_tags(soup),
+    }
+
+
+class ArticleEnricher:
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        max_workers: int = 4,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout_seconds: int = 10,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.user_agent = user_agent
+        self.timeout_seconds = timeout_seconds
+        self._http = http_client or SessionHttpClient(pool_maxsize=self.max_workers)
+        self._rate_limiter = rate_limiter or HostRateLimiter(rate_per_second=0)
+
+    def _headers(self) -> Dict[str, str]:
+        return {"User-Agent": self.user_agent, "Accept": "text/html,application/xhtml+xml"}
+
+    def _enrich_one(self, article: Dict[str, str]) -> Dict[str, str]:
+        url = article.get("url", "")
+        try:
+            with self._rate_limiter.acquire(url):
+                response = self._http.get(url, headers=self._headers(), timeout=self.timeout_seconds)
+            response.raise_for_status()
+            detail = parse_article_detail(response.text)
+        except HealthcareNewsError as exc:
+            logger.warning("Skipping enrichment for %s: %s", url, exc)
+            return article
+
+        enriched = dict(article)
+        enriched["date"] = detail["date"] or article.get("date", "")
+        enriched["body"] = detail["body"]
+        enriched["tags"] = detail["tags"]
+        return enriched
+
+    def enrich(self, articles: List[Dict[str, str]], skip_urls: Optional[Set[str]] = None) -> List[Dict[str, str]]:
+        skip = skip_urls or set()
+        pending = [index for index, article in enumerate(articles) if article.get("url") and article["url"] not in skip]
+        if not pending:
+            return list(articles)
+
+        workers = min(self.max_workers, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            enriched = list(executor.map(self._enrich_one, (articles[index] for index in pending)))
+
+        result = list(articles)
+        for index, article in zip(pending, enriched):
+            result[index] = article
+        return result
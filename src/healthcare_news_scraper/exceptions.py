@@ -17,9 +17,20 @@ class ScraperTimeoutError(ScraperNetworkError):
     pass
 
 
+class ResponseTooLargeError(ScraperNetworkError):
+    pass
+
+
 class ScraperParseError(HealthcareNewsError):
     pass
 
 
 class StorageError(HealthcareNewsError):
     pass
+
+
+class PartialPersistError(StorageError):
+    def __init__(self, message: str, run_record: object, cause: Optional[BaseException] = None) -> None:
+        super().__init__(message)
+        self.run_record = run_record
+        self.cause = cause
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from .article_index import ArticleIndex
+
+
+def article_matches_keyword(article: Dict[str, str], keyword: str) -> bool:
+    needle = keyword.lower().strip()
+    if not needle:
+        return True
+    return needle in article.get("title", "").lower() or needle in article.get("category", "").lower()
 
 
 def filter_articles_by_keyword(
     articles: List[Dict[str, str]],
     keyword: str,
+    index: Optional[ArticleIndex] = None,
 ) -> List[Dict[str, str]]:
     needle = keyword.lower().strip()
     if not needle:
         return articles
-    return [article for article in articles if needle in article.get("title", "").lower() or needle in article.get("category", "").lower()]
+    if index is not None:
+        return index.contains(needle)
+    return [article for article in articles if article_matches_keyword(article, needle)]
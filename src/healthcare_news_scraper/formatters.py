@@ -1,11 +1,154 @@
 from __future__ import annotations
 
+import importlib.util
 import json
-from typing import Dict, List
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional
 
+from .article_index import ArticleIndex
 from .filters import filter_articles_by_keyword
 
 
-def get_articles_category_json(articles: List[Dict[str, str]], category: str = "research") -> str:
-    filtered_articles = filter_articles_by_keyword(articles, category)
+STDLIB_ENCODER = "json"
+ORJSON_ENCODER = "orjson"
+AUTO_ENCODER = "auto"
+JSON_ENCODERS = (STDLIB_ENCODER, ORJSON_ENCODER)
+JSON_FORMATS = ("json", "ndjson", "pretty")
+WRITE_BATCH_SIZE = 512
+PRETTY_INDENT = "  "
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@dataclass(frozen=True)
+class JsonEncoder:
+    name: str
+    compact: Callable[[object], str]
+    pretty: Callable[[object], str]
+
+
+def available_encoders() -> List[str]:
+    encoders = [STDLIB_ENCODER]
+    if importlib.util.find_spec("orjson") is not None:
+        encoders.append(ORJSON_ENCODER)
+    return encoders
+
+
+def json_encoder(name: str = AUTO_ENCODER) -> JsonEncoder:
+    if name == AUTO_ENCODER:
+        name = available_encoders()[-1]
+    if name not in JSON_ENCODERS:
+        raise ValueError(f"Unsupported JSON encoder: {name}")
+    if name not in available_encoders():
+        raise ImportError(f"JSON encoder {name!r} is not installed; install healthcare_news_scraper[fast]")
+
+    if name == ORJSON_ENCODER:
+        import orjson
+
+        return JsonEncoder(
+            name=name,
+            compact=lambda value: orjson.dumps(value).decode("utf-8"),
+            pretty=lambda value: orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8"),
+        )
+
+    compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    return JsonEncoder(name=name, compact=compact, pretty=_stdlib_pretty(compact))
+
+
+def _stdlib_pretty(compact: Callable[[object], str]) -> Callable[[object], str]:
+    indented = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+    def encode(value: object) -> str:
+        if (
+            isinstance(value, dict)
+            and value
+            and all(type(key) is str and isinstance(item, SCALAR_TYPES) for key, item in value.items())
+        ):
+            return "{\n" + ",\n".join(f"{PRETTY_INDENT}{compact(key)}: {compact(item)}" for key, item in value.items()) + "\n}"
+        return indented(value)
+
+    return encode
+
+
+def _batches(items: Iterable[str]) -> Iterator[List[str]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, WRITE_BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
+def _write_array(encoded: Iterable[str], stream: IO[str], separator: str, opening: str, closing: str) -> int:
+    count = 0
+    for batch in _batches(encoded):
+        stream.write((opening if count == 0 else separator) + separator.join(batch))
+        count += len(batch)
+    stream.write(closing if count else "[]")
+    return count
+
+
+def write_json(articles: Iterable[Dict[str, object]], stream: IO[str], encoder: Optional[JsonEncoder] = None) -> int:
+    encode = (encoder or json_encoder()).compact
+    return _write_array((encode(article) for article in articles), stream, ",", "[", "]")
+
+
+def write_pretty_json(
+    articles: Iterable[Dict[str, object]],
+    stream: IO[str],
+    encoder: Optional[JsonEncoder] = None,
+) -> int:
+    encode = (encoder or json_encoder()).pretty
+    indented = (PRETTY_INDENT + encode(article).replace("\n", "\n" + PRETTY_INDENT) for article in articles)
+    return _write_array(indented, stream, ",\n", "[\n", "\n]")
+
+
+def write_ndjson(articles: Iterable[Dict[str, object]], stream: IO[str], encoder: Optional[JsonEncoder] = None) -> int:
+    encode = (encoder or json_encoder()).compact
+    count = 0
+    for batch in _batches(encode(article) for article in articles):
+        stream.write("\n".join(batch) + "\n")
+        count += len(batch)
+    return count
+
+
+JSON_WRITERS: Dict[str, Callable[..., int]] = {
+    "json": write_json,
+    "ndjson": write_ndjson,
+    "pretty": write_pretty_json,
+}
+
+
+def write_articles(
+    articles: Iterable[Dict[str, object]],
+    stream: IO[str],
+    fmt: str = "json",
+    encoder: str = AUTO_ENCODER,
+) -> int:
+    if fmt not in JSON_WRITERS:
+        raise ValueError(f"Unsupported output format: {fmt}")
+    return JSON_WRITERS[fmt](articles, stream, json_encoder(encoder))
+
+
+def write_articles_category(
+    articles: List[Dict[str, str]],
+    stream: IO[str],
+    category: str = "research",
+    fmt: str = "pretty",
+    index: Optional[ArticleIndex] = None,
+) -> int:
+    return write_articles(filter_articles_by_keyword(articles, category, index=index), stream, fmt)
+
+
+def get_articles_category_json(
+    articles: List[Dict[str, str]],
+    category: str = "research",
+    index: Optional[ArticleIndex] = None,
+) -> str:
+    filtered_articles = filter_articles_by_keyword(articles, category, index=index)
     return json.dumps(filtered_articles, ensure_ascii=False, indent=2)
+
+
+def get_articles_category_views(articles: List[Dict[str, str]], categories: Iterable[str]) -> Dict[str, str]:
+    index = ArticleIndex(articles)
+    return {category: get_articles_category_json(articles, category, index=index) for category in categories}
@@ -1,19 +1,50 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .exceptions import ScraperNetworkError, ScraperTimeoutError
+from .cache import JsonFileCache
+from .exceptions import ResponseTooLargeError, ScraperNetworkError, ScraperTimeoutError
+
+
+NOT_MODIFIED_STATUS = 304
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+ACCEPT_ENCODING = "gzip, deflate"
+READ_CHUNK_BYTES = 64 * 1024
+
+
+def conditional_headers(headers: Dict[str, str], cached: Optional[Dict[str, str]]) -> Dict[str, str]:
+    request_headers = dict(headers)
+    if not cached:
+        return request_headers
+    if cached.get("etag"):
+        request_headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        request_headers["If-Modified-Since"] = cached["last_modified"]
+    return request_headers
 
 
 class RequestsHttpResponse:
-    def __init__(self, response: requests.Response) -> None:
+    def __init__(
+        self,
+        response: requests.Response,
+        text: Optional[str] = None,
+        not_modified: bool = False,
+    ) -> None:
         self._response = response
+        self._text = text
+        self._not_modified = not_modified
 
     @property
     def text(self) -> str:
-        return self._response.text
+        return self._text if self._text is not None else self._response.text
+
+    @property
+    def not_modified(self) -> bool:
+        return self._not_modified
 
     def raise_for_status(self) -> None:
         try:
@@ -26,11 +57,87 @@ class RequestsHttpResponse:
 
 
 class RequestsHttpClient:
+    def __init__(self, validator_cache: Optional[JsonFileCache] = None) -> None:
+        self._validators = validator_cache
+
+    def _remember(self, url: str, response: requests.Response) -> None:
+        if self._validators is None or not response.ok:
+            return
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+        self._validators.set(
+            url,
+            {"etag": etag, "last_modified": last_modified, "body": response.text},
+        )
+
+    def _send(self, url: str, headers: Dict[str, str], timeout: int) -> requests.Response:
+        return requests.get(url, headers=headers, timeout=timeout)
+
     def get(self, url: str, *, headers: Dict[str, str], timeout: int) -> RequestsHttpResponse:
+        cached = self._validators.get(url) if self._validators is not None else None
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            return RequestsHttpResponse(response)
+            response = self._send(url, conditional_headers(headers, cached), timeout)
         except requests.Timeout as exc:
             raise ScraperTimeoutError(f"Timed out fetching {url}", cause=exc) from exc
         except requests.RequestException as exc:
             raise ScraperNetworkError(f"Network error fetching {url}", cause=exc) from exc
+
+        if cached and response.status_code == NOT_MODIFIED_STATUS:
+            return RequestsHttpResponse(response, text=cached.get("body", ""), not_modified=True)
+        self._remember(url, response)
+        return RequestsHttpResponse(response)
+
+    def close(self) -> None:
+        if self._validators is not None:
+            self._validators.flush()
+
+
+class SessionHttpClient(RequestsHttpClient):
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_SIZE,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+        validator_cache: Optional[JsonFileCache] = None,
+    ) -> None:
+        super().__init__(validator_cache=validator_cache)
+        self.max_response_bytes = max_response_bytes
+        self._session = requests.Session()
+        self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self._session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def _too_large(self, url: str) -> ResponseTooLargeError:
+        return ResponseTooLargeError(f"Response from {url} exceeds {self.max_response_bytes} bytes")
+
+    def _send(self, url: str, headers: Dict[str, str], timeout: int) -> requests.Response:
+        response = self._session.get(url, headers=headers, timeout=timeout, stream=True)
+        with response:
+            declared = response.headers.get("Content-Length", "")
+            if declared.isdigit() and int(declared) > self.max_response_bytes:
+                raise self._too_large(url)
+
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=READ_CHUNK_BYTES):
+                received += len(chunk)
+                if received > self.max_response_bytes:
+                    raise self._too_large(url)
+                chunks.append(chunk)
+
+        response._content = b"".join(chunks)
+        return response
+
+    def close(self) -> None:
+        super().close()
+        self._session.close()
+
+    def __enter__(self) -> "SessionHttpClient":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
@@ -3,13 +3,12 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import Dict, List
 
-from bs4 import BeautifulSoup
-
 from .models import HealthcareArticle
+from .parsing import HTML_PARSER, anchor_strainer, make_soup, resolve_backend
 
 
-def parse_newsletter_html(raw_html: str) -> List[Dict[str, str]]:
-    soup = BeautifulSoup(raw_html, "html.parser")
+def parse_newsletter_html(raw_html: str, parser_backend: str = HTML_PARSER) -> List[Dict[str, str]]:
+    soup = make_soup(raw_html, resolve_backend(parser_backend), anchor_strainer())
     articles: List[HealthcareArticle] = []
 
     ignore_tokens = [
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+HTML_PARSER = "html.parser"
+LXML_PARSER = "lxml"
+AUTO_BACKEND = "auto"
+PARSER_BACKENDS = (HTML_PARSER, LXML_PARSER)
+CONTAINER_TAGS = ["tr", "li", "div", "article"]
+
+
+def available_backends() -> List[str]:
+    backends = [HTML_PARSER]
+    if importlib.util.find_spec("lxml") is not None:
+        backends.append(LXML_PARSER)
+    return backends
+
+
+def resolve_backend(name: str = AUTO_BACKEND) -> str:
+    if name == AUTO_BACKEND:
+        return available_backends()[-1]
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unsupported parser backend: {name}")
+    if name not in available_backends():
+        raise ImportError(f"Parser backend {name!r} is not installed; install healthcare_news_scraper[fast]")
+    return name
+
+
+def listing_strainer() -> SoupStrainer:
+    return SoupStrainer(CONTAINER_TAGS + ["a"])
+
+
+def anchor_strainer() -> SoupStrainer:
+    return SoupStrainer("a")
+
+
+def make_soup(html: str, backend: str = HTML_PARSER, strainer: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    return BeautifulSoup(html, backend, parse_only=strainer)
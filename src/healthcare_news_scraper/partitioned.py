@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from .config import PipelineConfig
+from .dedup import NearDuplicatePolicy
+from .exceptions import StorageError
+from .queries import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    PRODUCT_READ_INDEX_SQL,
+    SNAPSHOT_READ_INDEX_SQL,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    page_size,
+    snapshot_export_query,
+)
+from .storage import (
+    DEFAULT_PRODUCT_CACHE_SIZE,
+    PRODUCTS_SCHEMA_SQL,
+    RUNS_SCHEMA_SQL,
+    SQLITE_MAX_PARAMS,
+    RunRecord,
+    SQLiteArticleStore,
+    SQLiteTuning,
+    StreamWrite,
+    fetch_moment,
+)
+from .urls import UrlRules
+
+
+CATALOG_FILE = "catalog.db"
+PARTITION_PREFIX = "runs-"
+PARTITION_SUFFIX = ".db"
+PARTITION_ALIAS = "partition"
+MONTH_ID_BITS = 32
+PARTITIONED_TABLES = {"runs", "product_snapshots"}
+
+PARTITION_SCHEMA_SQL = (
+    "PRAGMA foreign_keys = ON;\n"
+    + RUNS_SCHEMA_SQL
+    + """
+CREATE TABLE IF NOT EXISTS product_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    votes INTEGER,
+    description TEXT,
+    topics TEXT,
+    category TEXT,
+    event_date TEXT,
+    observed_at TEXT NOT NULL,
+    content_hash TEXT,
+    last_seen_run_id INTEGER,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(run_id) REFERENCES runs(id) ON DELETE CASCADE,
+    UNIQUE(run_id, product_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshots_run_id ON product_snapshots(run_id);
+CREATE INDEX IF NOT EXISTS idx_snapshots_product_id ON product_snapshots(product_id);
+"""
+    + SNAPSHOT_READ_INDEX_SQL
+)
+
+SNAPSHOT_DETAIL_COLUMNS = ("run_id", "description", "category", "event_date", "observed_at", "last_seen_run_id")
+
+
+def month_key(moment: datetime) -> str:
+    return moment.strftime("%Y-%m")
+
+
+def month_offset(month: str) -> int:
+    year, number = (int(part) for part in month.split("-"))
+    return (year * 12 + number - 1) << MONTH_ID_BITS
+
+
+def month_of_id(row_id: int) -> str:
+    key = int(row_id) >> MONTH_ID_BITS
+    return f"{key // 12:04d}-{key % 12 + 1:02d}"
+
+
+class PartitionedArticleStore(SQLiteArticleStore):
+    def __init__(
+        self,
+        root_dir: str,
+        *,
+        tuning: Optional[SQLiteTuning] = None,
+        near_duplicates: Optional[NearDuplicatePolicy] = None,
+        url_rules: Optional[UrlRules] = None,
+        product_cache_size: int = DEFAULT_PRODUCT_CACHE_SIZE,
+        clock: Optional[Callable[[], datetime]] = None,
+    ) -> None:
+        self.root_dir = Path(root_dir)
+        super().__init__(
+            str(self.root_dir / CATALOG_FILE),
+            persistent=False,
+            tuning=tuning,
+            near_duplicates=near_duplicates,
+            url_rules=url_rules,
+            product_cache_size=product_cache_size,
+        )
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._scope = threading.local()
+        self._partition_lock = threading.Lock()
+
+    def partition_path(self, month: str) -> Path:
+        return self.root_dir / f"{PARTITION_PREFIX}{month}{PARTITION_SUFFIX}"
+
+    def partitions(self) -> List[str]:
+        return sorted(
+            path.name[len(PARTITION_PREFIX) : -len(PARTITION_SUFFIX)]
+            for path in self.root_dir.glob(f"{PARTITION_PREFIX}*{PARTITION_SUFFIX}")
+        )
+
+    def _open_connection(self) -> sqlite3.Connection:
+        connection = super()._open_connection()
+        month = getattr(self._scope, "month", None)
+        if month is not None:
+            connection.execute(f"ATTACH DATABASE ? AS {PARTITION_ALIAS}", (str(self.partition_path(month)),))
+            if self.tuning and self.tuning.synchronous:
+                connection.execute(f"PRAGMA {PARTITION_ALIAS}.synchronous = {self.tuning.synchronous.lower()}")
+        return connection
+
+    @contextmanager
+    def _on_partition(self, month: Optional[str]):
+        previous = getattr(self._scope, "month", None)
+        self._scope.month = month
+        try:
+            yield
+        finally:
+            self._scope.month = previous
+
+    def _observed_at(self, fetched_at: object) -> str:
+        return self._run_moment(fetched_at).isoformat()
+
+    def _create_partition(self, month: str) -> None:
+        connection = sqlite3.connect(str(self.partition_path(month)))
+        try:
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            if self.tuning and self.tuning.journal_mode:
+                connection.execute(f"PRAGMA journal_mode = {self.tuning.journal_mode.lower()}")
+            connection.executescript(PARTITION_SCHEMA_SQL)
+            offset = month_offset(month)
+            connection.execute(
+                "INSERT INTO sqlite_sequence (name, seq) VALUES ('runs', ?), ('product_snapshots', ?)",
+                (offset, offset),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+    def seal_partitions(self, before: Optional[str] = None) -> List[str]:
+        cutoff = before or month_key(self._clock())
+        sealed = []
+        for month in self.partitions():
+            if month >= cutoff:
+                continue
+            connection = sqlite3.connect(str(self.partition_path(month)))
+            try:
+                if connection.execute("PRAGMA journal_mode").fetchone()[0] != "delete":
+                    connection.execute("PRAGMA journal_mode = DELETE")
+                    sealed.append(month)
+            finally:
+                connection.close()
+        return sealed
+
+    def _run_moment(self, fetched_at: object) -> datetime:
+        return fetch_moment(fetched_at) or self._clock()
+
+    @contextmanager
+    def _writing(self, fetched_at: object):
+        moment = self._run_moment(fetched_at)
+        month = month_key(moment)
+        with self._partition_lock:
+            if not self.partition_path(month).exists():
+                self._create_partition(month)
+                self.seal_partitions(before=min(month, month_key(self._clock())))
+        with self._on_partition(month):
+            yield
+
+    def init_schema(self) -> None:
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(PRODUCTS_SCHEMA_SQL)
+            conn.executescript(PRODUCT_READ_INDEX_SQL)
+            self._rekey_products(conn)
+            self._create_dedup_index(conn)
+            self._create_search_index(conn)
+        self.warm_product_cache()
+
+    def _last_seen_run(self, conn: sqlite3.Connection, snapshot_id: Optional[int]) -> int:
+        if snapshot_id is None or not self.partition_path(month_of_id(snapshot_id)).exists():
+            return 0
+        partition = sqlite3.connect(str(self.partition_path(month_of_id(snapshot_id))))
+        try:
+            return super()._last_seen_run(partition, snapshot_id)
+        finally:
+            partition.close()
+
+    def _move_snapshots(self, conn: sqlite3.Connection, loser: int, survivor: int) -> None:
+        for month in self.partitions():
+            partition = sqlite3.connect(str(self.partition_path(month)))
+            try:
+                super()._move_snapshots(partition, loser, survivor)
+                partition.commit()
+            finally:
+                partition.close()
+
+    def persist_runs(self, runs: Iterable[Dict[str, object]]) -> List[RunRecord]:
+        runs = list(runs)
+        months = [month_key(self._run_moment(fields["fetched_at"])) for fields in runs]
+        records: Dict[int, RunRecord] = {}
+        for month in dict.fromkeys(months):
+            indexes = [index for index, run_month in enumerate(months) if run_month == month]
+            with self._writing(runs[indexes[0]]["fetched_at"]):
+                records.update(zip(indexes, super().persist_runs([runs[index] for index in indexes])))
+        return [records[index] for index in range(len(runs))]
+
+    def _stream_run(self, write: StreamWrite, **kwargs) -> RunRecord:
+        fetched_at = kwargs.get("fetched_at")
+
+        def scoped(call: Callable[[], object]) -> object:
+            def on_partition() -> object:
+                with self._writing(fetched_at):
+                    return call()
+
+            return write(on_partition)
+
+        return super()._stream_run(scoped, **kwargs)
+
+    def transaction(self):
+        raise StorageError("Partitioned stores have no single database to open a transaction on")
+
+    def _months_between(self, since: Optional[str], until: Optional[str]) -> List[str]:
+        return [
+            month
+            for month in self.partitions()
+            if (since is None or month >= since[:7]) and (until is None or month <= until[:7])
+        ]
+
+    def rebuild_search_index(self) -> int:
+        with self._connect() as conn:
+            if not self._has_search_index(conn):
+                raise StorageError("Full-text search requires SQLite built with FTS5")
+            conn.execute("DELETE FROM article_search")
+        indexed = 0
+        for month in self.partitions():
+            with self._on_partition(month), self._connect() as conn:
+                cursor = conn.execute(
+                    """
+                    INSERT OR REPLACE INTO article_search (rowid, name, description, body, category, event_date, observed_at)
+                    SELECT
+                        products.id,
+                        products.name,
+                        snapshot.description,
+                        COALESCE(products.body, ''),
+                        snapshot.category,
+                        snapshot.event_date,
+                        snapshot.observed_at
+                    FROM products
+                    JOIN product_snapshots AS snapshot ON snapshot.id = products.last_snapshot_id
+                    """
+                )
+                indexed += cursor.rowcount
+        return indexed
+
+    def snapshots_at_run(self, run_id: int) -> List[sqlite3.Row]:
+        month = month_of_id(run_id)
+        if not self.partition_path(month).exists():
+            return []
+        with self._on_partition(month):
+            return super().snapshots_at_run(run_id)
+
+    def snapshots_between(
+        self,
+        since: str,
+        until: Optional[str] = None,
+        *,
+        category: Optional[str] = None,
+        newest_first: bool = False,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page:
+        size = page_size(limit)
+        months = self._months_between(since, until)
+        if after:
+            cursor_month = str(decode_cursor(after, 2)[0])[:7]
+            months = [month for month in months if (month <= cursor_month if newest_first else month >= cursor_month)]
+        if newest_first:
+            months.reverse()
+
+        rows: List[sqlite3.Row] = []
+        for index, month in enumerate(months):
+            with self._on_partition(month):
+                page = super().snapshots_between(
+                    since,
+                    until,
+                    category=category,
+                    newest_first=newest_first,
+                    after=after,
+                    limit=size - len(rows),
+                )
+            rows.extend(page.rows)
+            if len(rows) >= size:
+                has_more = page.next_cursor is not None or index < len(months) - 1
+                next_cursor = encode_cursor([rows[-1]["observed_at"], rows[-1]["snapshot_id"]]) if has_more else None
+                return Page(rows=rows, next_cursor=next_cursor)
+        return Page(rows=rows, next_cursor=None)
+
+    def _with_snapshot_details(self, rows: Sequence[sqlite3.Row]) -> List[Dict[str, object]]:
+        by_month: Dict[str, List[int]] = {}
+        for row in rows:
+            if row["last_snapshot_id"] is not None:
+                by_month.setdefault(month_of_id(row["last_snapshot_id"]), []).append(row["last_snapshot_id"])
+
+        details: Dict[int, sqlite3.Row] = {}
+        for month, snapshot_ids in by_month.items():
+            if not self.partition_path(month).exists():
+                continue
+            placeholders = ", ".join("?" for _ in snapshot_ids)
+            with self._on_partition(month), self._connect() as conn:
+                for detail in conn.execute(
+                    f"""
+                    SELECT id, run_id, description, category, event_date, observed_at,
+                        COALESCE(last_seen_run_id, run_id) AS last_seen_run_id
+                    FROM product_snapshots
+                    WHERE id IN ({placeholders})
+                    """,
+                    snapshot_ids,
+                ):
+                    details[detail["id"]] = detail
+
+        merged: List[Dict[str, object]] = []
+        for row in rows:
+            detail = details.get(row["last_snapshot_id"])
+            record = {key: row[key] for key in row.keys()}
+            record.update({column: detail[column] if detail else None for column in SNAPSHOT_DETAIL_COLUMNS})
+            record["snapshot_id"] = row["last_snapshot_id"] if detail else None
+            merged.append(record)
+        return merged
+
+    def _catalog_page(self, sql: str, params: Sequence[object], limit: int, cursor_columns: Sequence[str]) -> Page:
+        with self._connect() as conn:
+            page = fetch_page(conn, (sql, (*params, page_size(limit) + 1)), limit, cursor_columns)
+        return Page(rows=self._with_snapshot_details(page.rows), next_cursor=page.next_cursor)
+
+    def latest_snapshots(self, *, after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+        (after_id,) = decode_cursor(after, 1) if after else (0,)
+        return self._catalog_page(
+            """
+            SELECT id AS product_id, canonical_key, name, url, last_snapshot_id
+            FROM products
+            WHERE id > ? AND last_snapshot_id IS NOT NULL
+            ORDER BY id
+            LIMIT ?
+            """,
+            (after_id,),
+            limit,
+            ("product_id",),
+        )
+
+    def new_since_run(self, run_id: int, *, after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+        clauses = ["first_seen_run_id > ?"]
+        params: List[object] = [run_id]
+        if after:
+            clauses.append("(first_seen_run_id, id) > (?, ?)")
+            params.extend(decode_cursor(after, 2))
+        return self._catalog_page(
+            f"""
+            SELECT id AS product_id, canonical_key, name, url, first_seen_run_id, last_snapshot_id
+            FROM products
+            WHERE {" AND ".join(clauses)}
+            ORDER BY first_seen_run_id, id
+            LIMIT ?
+            """,
+            params,
+            limit,
+            ("first_seen_run_id", "product_id"),
+        )
+
+    def iter_snapshots(
+        self,
+        *,
+        since_run: Optional[int] = None,
+        since: Optional[str] = None,
+        batch_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[sqlite3.Row]:
+        first_month = max(filter(None, [since[:7] if since else None, month_of_id(since_run) if since_run else None]), default=None)
+        for month in self._months_between(first_month, None):
+            after_id = 0
+            while True:
+                query = snapshot_export_query(after_id, since_run=since_run, since=since, limit=batch_size)
+                with self._on_partition(month), self._connect() as conn:
+                    rows = conn.execute(*query).fetchall()
+                yield from rows
+                if len(rows) < max(1, batch_size):
+                    break
+                after_id = rows[-1]["snapshot_id"]
+
+    def run_timestamps(self, source: str) -> Set[str]:
+        timestamps: Set[str] = set()
+        for month in self.partitions():
+            with self._on_partition(month):
+                timestamps |= super().run_timestamps(source)
+        return timestamps
+
+    def fetch_latest_run(self) -> Optional[sqlite3.Row]:
+        for month in reversed(self.partitions()):
+            with self._on_partition(month):
+                row = super().fetch_latest_run()
+            if row is not None:
+                return row
+        return None
+
+    def count_rows(self, table_name: str) -> int:
+        if table_name not in PARTITIONED_TABLES:
+            return super().count_rows(table_name)
+        total = 0
+        for month in self.partitions():
+            with self._on_partition(month):
+                total += super().count_rows(table_name)
+        return total
+
+    def _release_catalog_rows(self, month: str) -> int:
+        low, high = month_offset(month), month_offset(month) + (1 << MONTH_ID_BITS)
+        with self._connect() as conn:
+            stale = [
+                row["id"]
+                for row in conn.execute(
+                    "SELECT id FROM products WHERE last_snapshot_id >= ? AND last_snapshot_id < ?", (low, high)
+                )
+            ]
+            for start in range(0, len(stale), SQLITE_MAX_PARAMS):
+                chunk = stale[start : start + SQLITE_MAX_PARAMS]
+                placeholders = ", ".join("?" for _ in chunk)
+                conn.execute(f"UPDATE products SET last_snapshot_id = NULL WHERE id IN ({placeholders})", chunk)
+                if self._has_search_index(conn):
+                    conn.execute(f"DELETE FROM article_search WHERE rowid IN ({placeholders})", chunk)
+            conn.execute(
+                "UPDATE products SET first_seen_run_id = NULL WHERE first_seen_run_id >= ? AND first_seen_run_id < ?",
+                (low, high),
+            )
+        return len(stale)
+
+    def drop_partitions_before(self, month: str) -> List[str]:
+        current = month_key(self._clock())
+        dropped = []
+        for candidate in self.partitions():
+            if candidate >= month or candidate >= current:
+                continue
+            self._release_catalog_rows(candidate)
+            path = self.partition_path(candidate)
+            for suffix in ("", "-wal", "-shm", "-journal"):
+                Path(f"{path}{suffix}").unlink(missing_ok=True)
+            dropped.append(candidate)
+        return dropped
+
+
+def open_store(config: PipelineConfig, db_path: Optional[str] = None) -> SQLiteArticleStore:
+    options = {
+        "tuning": SQLiteTuning.from_config(config),
+        "near_duplicates": NearDuplicatePolicy.from_config(config),
+        "url_rules": UrlRules.from_config(config),
+        "product_cache_size": config.db_product_cache_size,
+    }
+    if config.db_partition_dir and not db_path:
+        return PartitionedArticleStore(config.db_partition_dir, **options)
+    persistent = config.db_journal_mode.lower() == "wal"
+    return SQLiteArticleStore(db_path or config.db_path, persistent=persistent, **options)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Protocol, runtime_checkable
+from typing import Dict, Iterable, List, Optional, Protocol, Set, runtime_checkable
 
 
 @runtime_checkable
@@ -9,6 +9,12 @@ class ArticleScraper(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncArticleScraper(Protocol):
+    async def get_articles_async(self) -> List[Dict[str, str]]:
+        ...
+
+
 @runtime_checkable
 class ArticleStore(Protocol):
     def init_schema(self) -> None:
@@ -29,12 +35,49 @@ class ArticleStore(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingArticleStore(Protocol):
+    def init_schema(self) -> None:
+        ...
+
+    def persist_run_streaming(
+        self,
+        *,
+        source: str,
+        fetched_at: str,
+        search_term: str,
+        record_limit: int,
+        status: str,
+        attempts: int,
+        error: str,
+        articles: Iterable[Dict[str, str]],
+        chunk_size: int = ...,
+    ) -> object:
+        ...
+
+
+@runtime_checkable
+class ArticleUrlIndex(Protocol):
+    def known_urls(self, urls: Iterable[str]) -> Set[str]:
+        ...
+
+
+@runtime_checkable
+class RunHistory(Protocol):
+    def run_timestamps(self, source: str) -> Set[str]:
+        ...
+
+
 @runtime_checkable
 class HttpResponse(Protocol):
     @property
     def text(self) -> str:
         ...
 
+    @property
+    def not_modified(self) -> bool:
+        ...
+
     def raise_for_status(self) -> None:
         ...
 
@@ -49,3 +92,15 @@ class HttpClient(Protocol):
         timeout: int,
     ) -> HttpResponse:
         ...
+
+
+@runtime_checkable
+class AsyncHttpClient(Protocol):
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        timeout: int,
+    ) -> HttpResponse:
+        ...
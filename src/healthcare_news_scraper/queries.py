@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+SNAPSHOT_READ_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_snapshots_observed ON product_snapshots(observed_at);
+CREATE INDEX IF NOT EXISTS idx_snapshots_category_observed ON product_snapshots(category, observed_at);
+"""
+PRODUCT_READ_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_products_first_seen ON products(first_seen_run_id);
+"""
+READ_INDEX_SQL = SNAPSHOT_READ_INDEX_SQL + PRODUCT_READ_INDEX_SQL
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+Query = Tuple[str, Tuple[object, ...]]
+
+
+@dataclass(frozen=True)
+class Page:
+    rows: List[sqlite3.Row]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[object]) -> str:
+    payload = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[object]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    return values
+
+
+def page_size(limit: int) -> int:
+    return min(max(1, limit), MAX_PAGE_SIZE)
+
+
+def latest_snapshots_query(after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Query:
+    (after_id,) = decode_cursor(after, 1) if after else (0,)
+    sql = """
+        SELECT
+            products.id AS product_id,
+            products.canonical_key,
+            products.name,
+            products.url,
+            snapshot.id AS snapshot_id,
+            snapshot.run_id,
+            snapshot.description,
+            snapshot.category,
+            snapshot.event_date,
+            snapshot.observed_at,
+            COALESCE(snapshot.last_seen_run_id, snapshot.run_id) AS last_seen_run_id
+        FROM products
+        JOIN product_snapshots AS snapshot ON snapshot.id = products.last_snapshot_id
+        WHERE products.id > ?
+        ORDER BY products.id
+        LIMIT ?
+    """
+    return sql, (after_id, page_size(limit) + 1)
+
+
+def snapshots_between_query(
+    since: str,
+    until: Optional[str] = None,
+    *,
+    category: Optional[str] = None,
+    newest_first: bool = False,
+    after: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Query:
+    clauses = ["snapshot.observed_at >= ?"]
+    params: List[object] = [since]
+    if category is not None:
+        clauses.insert(0, "snapshot.category = ?")
+        params.insert(0, category)
+    if until:
+        clauses.append("snapshot.observed_at < ?")
+        params.append(until)
+    if after:
+        clauses.append(f"(snapshot.observed_at, snapshot.id) {'<' if newest_first else '>'} (?, ?)")
+        params.extend(decode_cursor(after, 2))
+    direction = "DESC" if newest_first else "ASC"
+    sql = f"""
+        SELECT
+            snapshot.id AS snapshot_id,
+            snapshot.run_id,
+            snapshot.product_id,
+            products.name,
+            products.url,
+            snapshot.description,
+            snapshot.category,
+            snapshot.event_date,
+            snapshot.observed_at
+        FROM product_snapshots AS snapshot
+        JOIN products ON products.id = snapshot.product_id
+        WHERE {" AND ".join(clauses)}
+        ORDER BY snapshot.observed_at {direction}, snapshot.id {direction}
+        LIMIT ?
+    """
+    return sql, (*params, page_size(limit) + 1)
+
+
+def new_since_run_query(run_id: int, after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Query:
+    clauses = ["products.first_seen_run_id > ?"]
+    params: List[object] = [run_id]
+    if after:
+        clauses.append("(products.first_seen_run_id, products.id) > (?, ?)")
+        params.extend(decode_cursor(after, 2))
+    sql = f"""
+        SELECT
+            products.id AS product_id,
+            products.canonical_key,
+            products.name,
+            products.url,
+            products.first_seen_run_id,
+            snapshot.description,
+            snapshot.category,
+            snapshot.event_date,
+            snapshot.observed_at
+        FROM products
+        LEFT JOIN product_snapshots AS snapshot ON snapshot.id = products.last_snapshot_id
+        WHERE {" AND ".join(clauses)}
+        ORDER BY products.first_seen_run_id, products.id
+        LIMIT ?
+    """
+    return sql, (*params, page_size(limit) + 1)
+
+
+def snapshot_export_query(
+    after_id: int = 0,
+    *,
+    since_run: Optional[int] = None,
+    since: Optional[str] = None,
+    limit: int = MAX_PAGE_SIZE,
+) -> Query:
+    clauses = ["snapshot.id > ?"]
+    params: List[object] = [after_id]
+    if since_run is not None:
+        clauses.append("snapshot.id >= (SELECT MIN(id) FROM product_snapshots INDEXED BY idx_snapshots_run_id WHERE run_id > ?)")
+        clauses.append("snapshot.run_id > ?")
+        params.extend([since_run, since_run])
+    if since:
+        clauses.append("snapshot.observed_at >= ?")
+        params.append(since)
+    sql = f"""
+        SELECT
+            snapshot.id AS snapshot_id,
+            snapshot.run_id,
+            COALESCE(snapshot.last_seen_run_id, snapshot.run_id) AS last_seen_run_id,
+            snapshot.product_id,
+            products.canonical_key,
+            products.name,
+            products.url,
+            snapshot.description,
+            snapshot.category,
+            snapshot.event_date,
+            snapshot.observed_at,
+            products.body,
+            products.tags
+        FROM product_snapshots AS snapshot
+        JOIN products ON products.id = snapshot.product_id
+        WHERE {" AND ".join(clauses)}
+        ORDER BY snapshot.id
+        LIMIT ?
+    """
+    return sql, (*params, max(1, limit))
+
+
+def fetch_page(conn: sqlite3.Connection, query: Query, limit: int, cursor_columns: Sequence[str]) -> Page:
+    sql, params = query
+    rows = conn.execute(sql, params).fetchall()
+    size = page_size(limit)
+    if len(rows) <= size:
+        return Page(rows=rows, next_cursor=None)
+    rows = rows[:size]
+    return Page(rows=rows, next_cursor=encode_cursor([rows[-1][column] for column in cursor_columns]))
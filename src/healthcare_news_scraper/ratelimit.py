@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int = 1, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate_per_second)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+
+class HostRateLimiter:
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int = 1,
+        max_concurrent: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.max_concurrent = max(0, max_concurrent)
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay_seconds: float) -> "HostRateLimiter":
+        if delay_seconds <= 0:
+            return cls(rate_per_second=0)
+        return cls(rate_per_second=1.0 / delay_seconds, burst=1)
+
+    def _host(self, url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_per_second, self.burst, clock=self._clock)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _semaphore(self, host: str) -> Optional[threading.BoundedSemaphore]:
+        if not self.max_concurrent:
+            return None
+        with self._lock:
+            return self._semaphores.setdefault(host, threading.BoundedSemaphore(self.max_concurrent))
+
+    def _async_semaphore(self, host: str) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrent:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._async_semaphores.get(host)
+            if entry is None or entry[0] is not loop:
+                entry = (loop, asyncio.Semaphore(self.max_concurrent))
+                self._async_semaphores[host] = entry
+            return entry[1]
+
+    def reserve(self, url: str) -> float:
+        if self.rate_per_second <= 0:
+            return 0.0
+        return self._bucket(self._host(url)).reserve()
+
+    @contextmanager
+    def acquire(self, url: str) -> Iterator[None]:
+        semaphore = self._semaphore(self._host(url))
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            wait_seconds = self.reserve(url)
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    @asynccontextmanager
+    async def acquire_async(self, url: str) -> AsyncIterator[None]:
+        semaphore = self._async_semaphore(self._host(url))
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            wait_seconds = self.reserve(url)
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
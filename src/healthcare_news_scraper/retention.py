@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import argparse
+import bisect
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Optional, Set
+
+from .config import PipelineConfig, load_config_from_env
+
+if TYPE_CHECKING:
+    from .storage import SQLiteArticleStore
+
+
+logger = logging.getLogger("healthcare_news_scraper.retention")
+
+ROLLUP_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS snapshot_rollups (
+    day TEXT NOT NULL,
+    category TEXT NOT NULL,
+    snapshots INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, category)
+);
+
+CREATE TABLE IF NOT EXISTS run_rollups (
+    day TEXT NOT NULL,
+    source TEXT NOT NULL,
+    status TEXT NOT NULL,
+    runs INTEGER NOT NULL DEFAULT 0,
+    fetched INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, source, status)
+);
+"""
+
+VACUUM_STEP_PAGES = 1024
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    max_age_days: int = 0
+    max_runs: int = 0
+    batch_size: int = 500
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> "RetentionPolicy":
+        return cls(
+            max_age_days=config.retention_max_age_days,
+            max_runs=config.retention_max_runs,
+            batch_size=config.retention_batch_size,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_days > 0 or self.max_runs > 0
+
+
+@dataclass(frozen=True)
+class RetentionReport:
+    runs_deleted: int = 0
+    snapshots_deleted: int = 0
+    snapshots_rebased: int = 0
+    pages_vacuumed: int = 0
+    partitions_dropped: int = 0
+
+
+def _expired_runs(conn: sqlite3.Connection, policy: RetentionPolicy, now: datetime) -> List[int]:
+    latest = conn.execute("SELECT MAX(id) AS id FROM runs").fetchone()["id"]
+    if latest is None:
+        return []
+
+    expired: Set[int] = set()
+    if policy.max_runs > 0:
+        row = conn.execute("SELECT id FROM runs ORDER BY id DESC LIMIT 1 OFFSET ?", (policy.max_runs - 1,)).fetchone()
+        if row is not None:
+            expired.update(row["id"] for row in conn.execute("SELECT id FROM runs WHERE id < ?", (row["id"],)))
+    if policy.max_age_days > 0:
+        cutoff = (now - timedelta(days=policy.max_age_days)).isoformat()
+        expired.update(row["id"] for row in conn.execute("SELECT id FROM runs WHERE fetched_at < ?", (cutoff,)))
+    expired.discard(latest)
+    return sorted(expired)
+
+
+def _rebase_live_snapshots(conn: sqlite3.Connection, run_id: int, target: int, batch_size: int) -> int:
+    cursor = conn.execute(
+        """
+        UPDATE product_snapshots
+        SET run_id = ?
+        WHERE id IN (
+            SELECT id FROM product_snapshots
+            WHERE run_id = ? AND COALESCE(last_seen_run_id, run_id) >= ?
+            LIMIT ?
+        )
+        """,
+        (target, run_id, target, batch_size),
+    )
+    return cursor.rowcount
+
+
+def _rollup_and_delete_snapshots(conn: sqlite3.Connection, run_id: int, batch_size: int) -> int:
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS retention_batch (id INTEGER PRIMARY KEY)")
+    conn.execute("DELETE FROM retention_batch")
+    conn.execute(
+        "INSERT INTO retention_batch (id) SELECT id FROM product_snapshots WHERE run_id = ? LIMIT ?",
+        (run_id, batch_size),
+    )
+    conn.execute(
+        """
+        INSERT INTO snapshot_rollups (day, category, snapshots)
+        SELECT substr(runs.fetched_at, 1, 10), COALESCE(snapshot.category, ''), COUNT(*)
+        FROM product_snapshots AS snapshot
+        JOIN runs ON runs.id = snapshot.run_id
+        WHERE snapshot.id IN (SELECT id FROM retention_batch)
+        GROUP BY 1, 2
+        ON CONFLICT(day, category) DO UPDATE SET snapshots = snapshots + excluded.snapshots
+        """
+    )
+    cursor = conn.execute("DELETE FROM product_snapshots WHERE id IN (SELECT id FROM retention_batch)")
+    return cursor.rowcount
+
+
+def _rollup_and_delete_run(conn: sqlite3.Connection, run_id: int) -> None:
+    conn.execute(
+        """
+        INSERT INTO run_rollups (day, source, status, runs, fetched)
+        SELECT substr(fetched_at, 1, 10), source, status, 1, fetched_count
+        FROM runs
+        WHERE id = ?
+        ON CONFLICT(day, source, status) DO UPDATE SET
+            runs = runs + excluded.runs,
+            fetched = fetched + excluded.fetched
+        """,
+        (run_id,),
+    )
+    conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
+
+
+def incremental_vacuum(store: "SQLiteArticleStore", step_pages: int = VACUUM_STEP_PAGES, max_pages: int = 0) -> int:
+    with store.transaction() as conn:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return 0
+        budget = max_pages or conn.execute("PRAGMA freelist_count").fetchone()[0]
+    reclaimed = 0
+    while reclaimed < budget:
+        with store.transaction() as conn:
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            step = min(free_pages, max(1, step_pages), budget - reclaimed)
+            if step <= 0:
+                break
+            conn.execute(f"PRAGMA incremental_vacuum({step})").fetchall()
+            freed = free_pages - conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if freed <= 0:
+            break
+        reclaimed += freed
+    return reclaimed
+
+
+def apply_retention(
+    store: "SQLiteArticleStore",
+    policy: RetentionPolicy,
+    now: Optional[datetime] = None,
+) -> RetentionReport:
+    if not policy.enabled:
+        return RetentionReport()
+
+    from .partitioned import PartitionedArticleStore, month_key
+
+    if isinstance(store, PartitionedArticleStore):
+        if policy.max_age_days <= 0:
+            logger.warning("Partitioned stores only support RETENTION_MAX_AGE_DAYS; RETENTION_MAX_RUNS is ignored")
+            return RetentionReport()
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=policy.max_age_days)
+        return RetentionReport(partitions_dropped=len(store.drop_partitions_before(month_key(cutoff))))
+
+    batch_size = max(1, policy.batch_size)
+    with store.transaction() as conn:
+        conn.executescript(ROLLUP_SCHEMA_SQL)
+        run_ids = _expired_runs(conn, policy, now or datetime.now(timezone.utc))
+        expired = set(run_ids)
+        kept = [row["id"] for row in conn.execute("SELECT id FROM runs ORDER BY id") if row["id"] not in expired]
+
+    runs_deleted = snapshots_deleted = snapshots_rebased = 0
+    for run_id in run_ids:
+        target = kept[bisect.bisect_right(kept, run_id)]
+        while True:
+            with store.transaction() as conn:
+                rebased = _rebase_live_snapshots(conn, run_id, target, batch_size)
+            snapshots_rebased += rebased
+            if rebased < batch_size:
+                break
+        while True:
+            with store.transaction() as conn:
+                deleted = _rollup_and_delete_snapshots(conn, run_id, batch_size)
+            snapshots_deleted += deleted
+            if deleted < batch_size:
+                break
+        with store.transaction() as conn:
+            _rollup_and_delete_run(conn, run_id)
+        runs_deleted += 1
+
+    return RetentionReport(
+        runs_deleted=runs_deleted,
+        snapshots_deleted=snapshots_deleted,
+        snapshots_rebased=snapshots_rebased,
+        pages_vacuumed=incremental_vacuum(store) if runs_deleted else 0,
+    )
+
+
+def enable_incremental_vacuum(store: "SQLiteArticleStore") -> bool:
+    with store.transaction() as conn:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+    with store.transaction() as conn:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Prune old runs and snapshots into daily rollups and reclaim space")
+    parser.add_argument("--db-path", help="Override DB path")
+    parser.add_argument("--max-age-days", type=int, help="Drop runs older than this many days (RETENTION_MAX_AGE_DAYS)")
+    parser.add_argument("--max-runs", type=int, help="Keep at most this many recent runs (RETENTION_MAX_RUNS)")
+    parser.add_argument("--batch-size", type=int, help="Rows changed per transaction (RETENTION_BATCH_SIZE)")
+    parser.add_argument(
+        "--enable-auto-vacuum",
+        action="store_true",
+        help="Convert an existing database to incremental auto-vacuum with a one-off full VACUUM",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from .partitioned import open_store
+
+    cfg = load_config_from_env()
+    defaults = RetentionPolicy.from_config(cfg)
+    policy = RetentionPolicy(
+        max_age_days=defaults.max_age_days if args.max_age_days is None else args.max_age_days,
+        max_runs=defaults.max_runs if args.max_runs is None else args.max_runs,
+        batch_size=defaults.batch_size if args.batch_size is None else args.batch_size,
+    )
+    if not policy.enabled and not args.enable_auto_vacuum:
+        parser.error("set --max-age-days/--max-runs (or RETENTION_MAX_AGE_DAYS/RETENTION_MAX_RUNS)")
+
+    with open_store(cfg, args.db_path) as store:
+        store.init_schema()
+        if args.enable_auto_vacuum and enable_incremental_vacuum(store):
+            logger.info("Converted database to incremental auto-vacuum")
+        started = time.perf_counter()
+        report = apply_retention(store, policy)
+
+    logger.info(
+        "Retention removed %s runs and %s snapshots, rebased %s live snapshots, reclaimed %s pages in %.1fs",
+        report.runs_deleted,
+        report.snapshots_deleted,
+        report.snapshots_rebased,
+        report.pages_vacuumed,
+        time.perf_counter() - started,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
+import sqlite3
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Dict, List, Optional
+from pathlib import Path
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from .alerts import evaluate_alerts
+from .archive import RawHtmlArchive
+from .classifier import KeywordClassifier
 from .config import PipelineConfig, load_config_from_env
-from .exceptions import ScraperNetworkError
-from .filters import filter_articles_by_keyword
-from .protocols import ArticleScraper, ArticleStore
+from .exceptions import PartialPersistError, ScraperNetworkError, StorageError
+from .filters import article_matches_keyword, filter_articles_by_keyword
+from .protocols import ArticleStore, ArticleUrlIndex, StreamingArticleStore
+from .ratelimit import HostRateLimiter
+from .retention import RetentionPolicy, apply_retention
 from .scheduler import backoff_seconds, is_transient_error as scheduler_is_transient_error
+if TYPE_CHECKING:
+    from .scraper import HealthcareNewsScraper
+    from .storage import SQLiteArticleStore
 
 
 logger = logging.getLogger("healthcare_news_scraper.runner")
@@ -39,10 +52,92 @@ def is_transient_error(exc: Exception) -> bool:
 
 
 
-def _default_scraper(_config: PipelineConfig) -> ArticleScraper:
+def _default_rate_limiter(config: PipelineConfig) -> HostRateLimiter:
+    return HostRateLimiter(
+        rate_per_second=config.rate_limit_per_second,
+        burst=config.rate_limit_burst,
+        max_concurrent=config.max_concurrent_per_host,
+    )
+
+
+
+def _default_archive(config: PipelineConfig) -> Optional[RawHtmlArchive]:
+    if not config.archive_dir:
+        return None
+    return RawHtmlArchive(config.archive_dir)
+
+
+
+def _default_category_classifier(config: PipelineConfig) -> Optional[KeywordClassifier]:
+    if not config.category_keywords_path:
+        return None
+    return KeywordClassifier.from_file(config.category_keywords_path, default="general")
+
+
+
+@contextmanager
+def _default_scraper(config: PipelineConfig) -> Iterator["HealthcareNewsScraper"]:
+    from .cache import JsonFileCache
+    from .http import SessionHttpClient
+    from .scraper import HealthcareNewsScraper
+
+    cache_dir = Path(config.http_cache_dir) if config.http_cache_dir else None
+    with SessionHttpClient(
+        pool_connections=config.http_pool_size,
+        pool_maxsize=max(config.http_pool_size, config.scraper_max_workers),
+        max_response_bytes=config.http_max_response_bytes,
+        validator_cache=JsonFileCache(str(cache_dir / "http_validators.json")) if cache_dir else None,
+    ) as http_client, HealthcareNewsScraper(
+        http_client=http_client,
+        max_pages=config.scraper_max_pages,
+        max_workers=config.scraper_max_workers,
+        parsed_cache=JsonFileCache(str(cache_dir / "parsed_pages.json")) if cache_dir else None,
+        rate_limiter=_default_rate_limiter(config),
+        archive=_default_archive(config),
+        parser_backend=config.parser_backend,
+        use_strainer=config.parser_strainer,
+        category_classifier=_default_category_classifier(config),
+    ) as scraper:
+        yield scraper
+
+
+async def _scrape_async(config: PipelineConfig) -> List[Dict[str, str]]:
+    from .async_http import AiohttpHttpClient
+    from .cache import JsonFileCache
     from .scraper import HealthcareNewsScraper
 
-    return HealthcareNewsScraper()
+    cache_dir = Path(config.http_cache_dir) if config.http_cache_dir else None
+    async with AiohttpHttpClient(
+        per_host_limit=max(config.http_pool_size, config.scraper_max_workers),
+        max_response_bytes=config.http_max_response_bytes,
+        validator_cache=JsonFileCache(str(cache_dir / "http_validators.json")) if cache_dir else None,
+    ) as client:
+        with HealthcareNewsScraper(
+            async_http_client=client,
+            max_pages=config.scraper_max_pages,
+            max_workers=config.scraper_max_workers,
+            parsed_cache=JsonFileCache(str(cache_dir / "parsed_pages.json")) if cache_dir else None,
+            rate_limiter=_default_rate_limiter(config),
+            archive=_default_archive(config),
+            parser_backend=config.parser_backend,
+            use_strainer=config.parser_strainer,
+            category_classifier=_default_category_classifier(config),
+        ) as scraper:
+            return await scraper.get_articles_async()
+
+
+
+def _iter_scrape(config: PipelineConfig) -> Iterator[Dict[str, str]]:
+    if config.scraper_strategy != "web":
+        raise ValueError(f"Unsupported SCRAPER_STRATEGY: {config.scraper_strategy}")
+
+    with _default_scraper(config) as scraper:
+        articles: Iterable[Dict[str, str]] = scraper.iter_articles()
+        if config.scraper_search_term:
+            articles = (article for article in articles if article_matches_keyword(article, config.scraper_search_term))
+        if config.scraper_limit > 0:
+            articles = islice(articles, config.scraper_limit)
+        yield from articles
 
 
 
@@ -50,8 +145,11 @@ def _run_scrape(config: PipelineConfig) -> List[Dict[str, str]]:
     if config.scraper_strategy != "web":
         raise ValueError(f"Unsupported SCRAPER_STRATEGY: {config.scraper_strategy}")
 
-    scraper = _default_scraper(config)
-    articles = scraper.get_articles()
+    if config.scraper_async:
+        articles = asyncio.run(_scrape_async(config))
+    else:
+        with _default_scraper(config) as scraper:
+            articles = scraper.get_articles()
 
     if config.scraper_search_term:
         articles = filter_articles_by_keyword(articles, config.scraper_search_term)
@@ -63,18 +161,137 @@ def _run_scrape(config: PipelineConfig) -> List[Dict[str, str]]:
 
 
 
+def _enrich_articles(
+    config: PipelineConfig,
+    store: ArticleStore,
+    articles: List[Dict[str, str]],
+) -> List[Dict[str, str]]:
+    from .enrichment import ArticleEnricher
+    from .http import SessionHttpClient
+
+    urls = [article.get("url", "") for article in articles]
+    skip_urls = store.known_urls(urls) if isinstance(store, ArticleUrlIndex) else set()
+    with SessionHttpClient(
+        pool_maxsize=max(config.http_pool_size, config.enrich_max_workers),
+        max_response_bytes=config.http_max_response_bytes,
+    ) as http_client:
+        enricher = ArticleEnricher(
+            http_client=http_client,
+            rate_limiter=_default_rate_limiter(config),
+            max_workers=config.enrich_max_workers,
+        )
+        return enricher.enrich(articles, skip_urls=skip_urls)
+
+
+
 def run_once(
     config: Optional[PipelineConfig] = None,
     scrape_func: Optional[Callable[[PipelineConfig], List[Dict[str, str]]]] = None,
     store: Optional[ArticleStore] = None,
 ) -> RunSummary:
     cfg = config or load_config_from_env()
-    scrape = scrape_func or _run_scrape
-    article_store = store or _default_store(cfg)
+    if store is not None:
+        return _dispatch_run(cfg, scrape_func, store)
+
+    default_store = _default_store(cfg)
+    if cfg.db_write_queue:
+        from .writer import QueuedArticleStore
+
+        writer = QueuedArticleStore.from_config(default_store, cfg)
+        try:
+            summary = _dispatch_run(cfg, scrape_func, writer)
+            writer.execute(lambda: _after_run(cfg, default_store))
+            return summary
+        finally:
+            writer.close()
+
+    try:
+        summary = _dispatch_run(cfg, scrape_func, default_store)
+        _after_run(cfg, default_store)
+        return summary
+    finally:
+        default_store.close()
+
+
+def _after_run(cfg: PipelineConfig, store: "SQLiteArticleStore") -> None:
+    _evaluate_alerts(cfg, store)
+    _apply_retention(cfg, store)
+
+
+def _evaluate_alerts(cfg: PipelineConfig, store: "SQLiteArticleStore") -> None:
+    if not cfg.alerts_enabled:
+        return
+    try:
+        report = evaluate_alerts(store)
+    except (sqlite3.Error, StorageError):
+        logger.exception("Alert evaluation failed; new articles will be matched on the next run")
+        return
+    logger.info(
+        "alerts rules=%s articles_scanned=%s matches=%s elapsed_ms=%.1f",
+        report.rules,
+        report.articles_scanned,
+        report.matches,
+        report.elapsed_seconds * 1000,
+    )
+
+
+def _apply_retention(cfg: PipelineConfig, store: "SQLiteArticleStore") -> None:
+    policy = RetentionPolicy.from_config(cfg)
+    if not policy.enabled:
+        return
+    try:
+        report = apply_retention(store, policy)
+    except (sqlite3.Error, StorageError):
+        logger.exception("Retention pass failed; keeping all data until the next run")
+        return
+    logger.info(
+        "retention runs_deleted=%s snapshots_deleted=%s snapshots_rebased=%s pages_vacuumed=%s partitions_dropped=%s",
+        report.runs_deleted,
+        report.snapshots_deleted,
+        report.snapshots_rebased,
+        report.pages_vacuumed,
+        report.partitions_dropped,
+    )
+
+
+def _dispatch_run(
+    cfg: PipelineConfig,
+    scrape_func: Optional[Callable[[PipelineConfig], List[Dict[str, str]]]],
+    article_store: ArticleStore,
+) -> RunSummary:
+    if cfg.persist_chunk_size > 0 and isinstance(article_store, StreamingArticleStore):
+        return _run_streaming(cfg, scrape_func or _iter_scrape, article_store)
+    return _run_with_store(cfg, scrape_func or _run_scrape, article_store)
+
+
+def _run_with_store(
+    cfg: PipelineConfig,
+    scrape: Callable[[PipelineConfig], List[Dict[str, str]]],
+    article_store: ArticleStore,
+) -> RunSummary:
     article_store.init_schema()
+    articles, attempts, error_message = _scrape_with_retries(cfg, scrape)
+
+    if cfg.enrich_articles and articles:
+        articles = _enrich_articles(cfg, article_store, articles)
+
+    status = _run_status(bool(articles), error_message)
+    run_record = article_store.persist_run(
+        source=cfg.scraper_strategy,
+        fetched_at=datetime.now(timezone.utc).isoformat(),
+        search_term=cfg.scraper_search_term,
+        record_limit=cfg.scraper_limit,
+        status=status,
+        attempts=attempts,
+        error=error_message,
+        articles=articles,
+    )
+    return _summarize(cfg, run_record)
+
 
+def _scrape_with_retries(cfg: PipelineConfig, scrape: Callable[[PipelineConfig], Any]) -> Tuple[Any, int, str]:
     attempts = 0
-    articles: List[Dict[str, str]] = []
+    articles: Any = []
     error_message = ""
 
     while attempts < max(1, cfg.retry_attempts):
@@ -95,26 +312,78 @@ def run_once(
             logger.warning("Transient error on attempt %s: %s. Retrying in %ss", attempts, exc, sleep_seconds)
             time.sleep(sleep_seconds)
 
-    if articles and error_message:
-        status = "partial"
-    elif articles and not error_message:
-        status = "success"
-    elif not articles and error_message:
-        status = "failure"
-    else:
-        status = "success"
-
-    run_record = article_store.persist_run(
-        source=cfg.scraper_strategy,
-        fetched_at=datetime.now(timezone.utc).isoformat(),
-        search_term=cfg.scraper_search_term,
-        record_limit=cfg.scraper_limit,
-        status=status,
-        attempts=attempts,
-        error=error_message,
-        articles=articles,
-    )
-
+    return articles, attempts, error_message
+
+
+def _run_status(has_articles: bool, error_message: str) -> str:
+    if has_articles and error_message:
+        return "partial"
+    if error_message:
+        return "failure"
+    return "success"
+
+
+def _primed_scrape(
+    scrape: Callable[[PipelineConfig], Iterable[Dict[str, str]]],
+) -> Callable[[PipelineConfig], Iterable[Dict[str, str]]]:
+    def start(cfg: PipelineConfig) -> Iterable[Dict[str, str]]:
+        articles = iter(scrape(cfg))
+        first = next(articles, None)
+        return [] if first is None else chain([first], articles)
+
+    return start
+
+
+def _enrich_stream(
+    cfg: PipelineConfig,
+    store: ArticleStore,
+    articles: Iterable[Dict[str, str]],
+) -> Iterator[Dict[str, str]]:
+    pending: List[Dict[str, str]] = []
+    try:
+        for article in articles:
+            pending.append(article)
+            if len(pending) >= max(1, cfg.persist_chunk_size):
+                chunk, pending = pending, []
+                yield from _enrich_articles(cfg, store, chunk)
+    except Exception:
+        if pending:
+            yield from _enrich_articles(cfg, store, pending)
+        raise
+    if pending:
+        yield from _enrich_articles(cfg, store, pending)
+
+
+def _run_streaming(
+    cfg: PipelineConfig,
+    scrape: Callable[[PipelineConfig], Iterable[Dict[str, str]]],
+    article_store: StreamingArticleStore,
+) -> RunSummary:
+    article_store.init_schema()
+    articles, attempts, error_message = _scrape_with_retries(cfg, _primed_scrape(scrape))
+    status = _run_status(bool(articles), error_message)
+    if cfg.enrich_articles:
+        articles = _enrich_stream(cfg, article_store, articles)
+
+    try:
+        run_record = article_store.persist_run_streaming(
+            source=cfg.scraper_strategy,
+            fetched_at=datetime.now(timezone.utc).isoformat(),
+            search_term=cfg.scraper_search_term,
+            record_limit=cfg.scraper_limit,
+            status=status,
+            attempts=attempts,
+            error=error_message,
+            articles=articles,
+            chunk_size=cfg.persist_chunk_size,
+        )
+    except PartialPersistError as exc:
+        logger.warning("Streaming run interrupted: %s", exc.cause or exc)
+        run_record = exc.run_record
+    return _summarize(cfg, run_record)
+
+
+def _summarize(cfg: PipelineConfig, run_record: Any) -> RunSummary:
     summary = RunSummary(
         run_id=run_record.run_id,
         status=run_record.status,
@@ -137,10 +406,10 @@ def run_once(
     return summary
 
 
-def _default_store(config: PipelineConfig) -> ArticleStore:
-    from .storage import SQLiteArticleStore
+def _default_store(config: PipelineConfig) -> "SQLiteArticleStore":
+    from .partitioned import open_store
 
-    return SQLiteArticleStore(config.db_path)
+    return open_store(config)
 
 
 
@@ -149,6 +418,8 @@ def main() -> int:
     parser.add_argument("--db-path", help="Override DB path for one-shot runs")
     parser.add_argument("--search-term", help="Override search term")
     parser.add_argument("--limit", type=int, help="Override article limit")
+    parser.add_argument("--max-pages", type=int, help="Override number of listing pages to crawl")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Drive the scrape with the asyncio engine")
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -160,6 +431,10 @@ def main() -> int:
         cfg = PipelineConfig(**{**cfg.__dict__, "scraper_search_term": args.search_term})
     if args.limit is not None:
         cfg = PipelineConfig(**{**cfg.__dict__, "scraper_limit": args.limit})
+    if args.max_pages is not None:
+        cfg = PipelineConfig(**{**cfg.__dict__, "scraper_max_pages": args.max_pages})
+    if args.use_async:
+        cfg = PipelineConfig(**{**cfg.__dict__, "scraper_async": True})
 
     run_once(config=cfg)
     return 0
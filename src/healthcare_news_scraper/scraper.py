@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
-from typing import Dict, Iterable, List, Optional, Tuple
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
 
 from bs4 import BeautifulSoup, Tag
 
+from .archive import RawHtmlArchive
+from .cache import JsonFileCache
+from .classifier import KeywordClassifier, KeywordRule
 from .exceptions import ScraperNetworkError
-from .http import RequestsHttpClient
+from .http import SessionHttpClient
 from .models import HealthcareArticle
-from .protocols import HttpClient
+from .parsing import CONTAINER_TAGS, HTML_PARSER, anchor_strainer, listing_strainer, make_soup, resolve_backend
+from .protocols import AsyncHttpClient, HttpClient, HttpResponse
+from .ratelimit import HostRateLimiter
+
+
+logger = logging.getLogger("healthcare_news_scraper.scraper")
 
 
 DEFAULT_USER_AGENT = (
@@ -20,19 +31,33 @@ DEFAULT_USER_AGENT = (
 )
 
 NEWS_LINK_FRAGMENT = "/news/"
+PAGE_QUERY_PARAM = "page"
 CATEGORY_KEYWORDS = {
-    "research": ["study", "research", "clinical", "trial"],
-    "policy": ["policy", "regulation", "law", "mandate"],
-    "outbreak": ["outbreak", "epidemic", "pandemic", "disease"],
-    "public_health": ["health", "vaccination", "prevention", "screening"],
+    "research": ["study", "studies", "research*", "clinical", "trial", "trials"],
+    "policy": ["policy", "policies", "regulation*", "law", "laws", "mandate*"],
+    "outbreak": ["outbreak*", "epidemic*", "pandemic*", "disease*"],
+    "public_health": ["health*", "vaccin*", "prevention", "screening*"],
 }
 DATE_TOKENS = [
     "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun",
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday",
     "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+    "Jul", "Aug", "Sep", "Sept", "Oct", "Nov", "Dec",
+    "January", "February", "March", "April", "June",
+    "July", "August", "September", "October", "November", "December",
 ]
 
 
+@lru_cache(maxsize=1)
+def default_category_classifier() -> KeywordClassifier:
+    return KeywordClassifier.from_mapping(CATEGORY_KEYWORDS, default="general")
+
+
+@lru_cache(maxsize=1)
+def default_date_detector() -> KeywordClassifier:
+    return KeywordClassifier([KeywordRule("date", tuple(DATE_TOKENS))], case_sensitive=True)
+
+
 class HealthcareNewsScraper:
     BASE_URL = "https://www.who.int/news"
 
@@ -42,11 +67,44 @@ class HealthcareNewsScraper:
         user_agent: str = DEFAULT_USER_AGENT,
         timeout_seconds: int = 10,
         http_client: Optional[HttpClient] = None,
+        max_pages: int = 1,
+        max_workers: int = 4,
+        parsed_cache: Optional[JsonFileCache] = None,
+        async_http_client: Optional[AsyncHttpClient] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        archive: Optional[RawHtmlArchive] = None,
+        parser_backend: str = HTML_PARSER,
+        use_strainer: bool = False,
+        category_classifier: Optional[KeywordClassifier] = None,
+        date_detector: Optional[KeywordClassifier] = None,
     ) -> None:
         self.delay_seconds = delay_seconds
         self.user_agent = user_agent
         self.timeout_seconds = timeout_seconds
-        self._http = http_client or RequestsHttpClient()
+        self.max_pages = max(1, max_pages)
+        self.max_workers = max(1, max_workers)
+        self._owned_http = None if http_client is not None else SessionHttpClient(pool_maxsize=self.max_workers)
+        self._http = http_client or self._owned_http
+        self._parsed_cache = parsed_cache
+        self._async_http = async_http_client
+        self._rate_limiter = rate_limiter or HostRateLimiter.from_delay(delay_seconds)
+        self._archive = archive
+        self.parser_backend = resolve_backend(parser_backend)
+        self.use_strainer = use_strainer
+        self._category_classifier = category_classifier or default_category_classifier()
+        self._date_detector = date_detector or default_date_detector()
+
+    def close(self) -> None:
+        if self._parsed_cache is not None:
+            self._parsed_cache.flush()
+        if self._owned_http is not None:
+            self._owned_http.close()
+
+    def __enter__(self) -> "HealthcareNewsScraper":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
 
     def _headers(self) -> Dict[str, str]:
         return {
@@ -54,38 +112,50 @@ class HealthcareNewsScraper:
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
 
-    def _fetch_html(self, url: str) -> str:
-        time.sleep(self.delay_seconds)
+    def _archive_response(self, url: str, response: HttpResponse) -> None:
+        if self._archive is not None and not response.not_modified:
+            self._archive.store(url, response.text)
+
+    def _fetch(self, url: str) -> HttpResponse:
         try:
-            response = self._http.get(url, headers=self._headers(), timeout=self.timeout_seconds)
+            with self._rate_limiter.acquire(url):
+                response = self._http.get(url, headers=self._headers(), timeout=self.timeout_seconds)
             response.raise_for_status()
-            return response.text
+            self._archive_response(url, response)
+            return response
         except ScraperNetworkError:
             raise
 
+    def _fetch_html(self, url: str) -> str:
+        return self._fetch(url).text
+
     def _clean(self, value: Optional[str]) -> str:
         return value.strip() if value else ""
 
     def _normalize_url(self, href: str) -> str:
         return urljoin(self.BASE_URL, href)
 
-    def _extract_category(self, text: str) -> str:
-        normalized = " ".join(text.split()).lower()
+    def _normalize_text(self, text: str) -> str:
+        return " ".join(text.split())
+
+    def _category_from_normalized(self, normalized: str) -> str:
         if not normalized:
             return "general"
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            if any(keyword in normalized for keyword in keywords):
-                return category
-        return "general"
+        return self._category_classifier.classify(normalized) or "general"
 
-    def _extract_date(self, text: str) -> str:
-        normalized = " ".join(text.split())
+    def _date_from_normalized(self, normalized: str) -> str:
         if not normalized:
             return ""
-        if any(token in normalized for token in DATE_TOKENS):
+        if self._date_detector.matches(normalized):
             return normalized
         return ""
 
+    def _extract_category(self, text: str) -> str:
+        return self._category_from_normalized(self._normalize_text(text))
+
+    def _extract_date(self, text: str) -> str:
+        return self._date_from_normalized(self._normalize_text(text))
+
     def _extract_anchor(self, element: Tag) -> Optional[Tuple[str, str]]:
         link = element.find("a", href=True)
         if not link:
@@ -116,11 +186,14 @@ class HealthcareNewsScraper:
             date = self._extract_date_from_table_row(cells)
             category = self._extract_category_from_table_row(cells)
 
-        text_blob = self._clean(element.get_text(" "))
+        if date and category:
+            return date, category
+
+        text_blob = self._normalize_text(element.get_text(" "))
         if not date:
-            date = self._extract_date(text_blob)
+            date = self._date_from_normalized(text_blob)
         if not category:
-            category = self._extract_category(text_blob)
+            category = self._category_from_normalized(text_blob)
         return date, category
 
     def _extract_article_from_element(self, element: Tag) -> Optional[HealthcareArticle]:
@@ -134,15 +207,19 @@ class HealthcareNewsScraper:
         return HealthcareArticle(title=title, date=date, category=category, url=url, source="healthcare_web")
 
     def _candidate_elements(self, soup: BeautifulSoup) -> Iterable[Tag]:
-        for link in soup.select("a[href]"):
-            href = link.get("href", "")
-            if NEWS_LINK_FRAGMENT not in href:
+        seen: Set[int] = set()
+        for link in soup.find_all("a", href=True):
+            if NEWS_LINK_FRAGMENT not in link["href"]:
+                continue
+            container = link.find_parent(CONTAINER_TAGS)
+            element = container if container else link
+            if id(element) in seen:
                 continue
-            container = link.find_parent(["tr", "li", "div", "article"])
-            yield container if container else link
+            seen.add(id(element))
+            yield element
 
     def parse_articles(self, html: str) -> List[Dict[str, str]]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html, self.parser_backend, listing_strainer() if self.use_strainer else None)
         articles: List[HealthcareArticle] = []
 
         for element in self._candidate_elements(soup):
@@ -150,17 +227,155 @@ class HealthcareNewsScraper:
             if article:
                 articles.append(article)
 
-        unique = {}
-        for article in articles:
-            key = (article.title, article.url)
-            unique[key] = article
+        return merge_article_pages([[asdict(article) for article in articles]])
+
+    def _page_number(self, url: str) -> Optional[int]:
+        values = parse_qs(urlparse(url).query).get(PAGE_QUERY_PARAM)
+        if not values:
+            return None
+        try:
+            return int(values[0])
+        except ValueError:
+            return None
+
+    def _listing_page_urls(self, html: str) -> List[str]:
+        soup = make_soup(html, self.parser_backend, anchor_strainer() if self.use_strainer else None)
+        base_path = urlparse(self.BASE_URL).path
+        pages: Dict[int, str] = {}
+
+        for link in soup.select("a[href]"):
+            url = self._normalize_url(self._clean(link.get("href")))
+            if urlparse(url).path != base_path:
+                continue
+            number = self._page_number(url)
+            if number is None or number < 2 or number in pages:
+                continue
+            pages[number] = url
 
-        return [asdict(article) for article in unique.values()]
+        return [pages[number] for number in sorted(pages)]
+
+    def discover_page_urls(self, html: str) -> List[str]:
+        return self._listing_page_urls(html)[: self.max_pages - 1]
+
+    def _parse_listing(self, html: str, discover: bool) -> Dict[str, Any]:
+        return {
+            "articles": self.parse_articles(html),
+            "page_urls": self._listing_page_urls(html) if discover else [],
+            "discovered": discover,
+        }
+
+    def _listing_from_response(self, url: str, response: HttpResponse, discover: bool) -> Dict[str, Any]:
+        if response.not_modified and self._parsed_cache is not None:
+            cached = self._parsed_cache.get(url)
+            if cached is not None and (cached["discovered"] or not discover):
+                return cached
+
+        parsed = self._parse_listing(response.text, discover)
+        if self._parsed_cache is not None:
+            self._parsed_cache.set(url, parsed)
+        return parsed
+
+    def _fetch_listing(self, url: str, discover: bool = False) -> Dict[str, Any]:
+        return self._listing_from_response(url, self._fetch(url), discover)
+
+    def _fetch_follow_up(self, url: str) -> Dict[str, Any]:
+        try:
+            return self._fetch_listing(url, discover=True)
+        except ScraperNetworkError as exc:
+            return self._skipped_listing(url, exc)
+
+    def _skipped_listing(self, url: str, exc: ScraperNetworkError) -> Dict[str, Any]:
+        logger.warning("Skipping listing page %s: %s", url, exc)
+        return {"articles": [], "page_urls": [], "discovered": True}
+
+    def _next_wave(self, listings: Iterable[Dict[str, Any]], visited: Set[int]) -> List[str]:
+        wave: Dict[int, str] = {}
+        for listing in listings:
+            for url in listing["page_urls"]:
+                number = self._page_number(url)
+                if number is not None and number not in visited:
+                    wave.setdefault(number, url)
+        numbers = sorted(wave)[: max(0, self.max_pages - len(visited))]
+        visited.update(numbers)
+        return [wave[number] for number in numbers]
+
+    def iter_articles(self) -> Iterator[Dict[str, str]]:
+        first = self._fetch_listing(self.BASE_URL, discover=self.max_pages > 1)
+        visited: Set[int] = {1}
+        seen: Set[Tuple[str, str]] = set()
+
+        def unseen(articles: List[Dict[str, str]]) -> Iterator[Dict[str, str]]:
+            for article in articles:
+                key = (article["title"], article["url"])
+                if key not in seen:
+                    seen.add(key)
+                    yield article
+
+        yield from unseen(first["articles"])
+        wave = self._next_wave([first], visited)
+        if not wave:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while wave:
+                listings = []
+                for listing in executor.map(self._fetch_follow_up, wave):
+                    listings.append(listing)
+                    yield from unseen(listing["articles"])
+                wave = self._next_wave(listings, visited)
 
     def get_articles(self) -> List[Dict[str, str]]:
-        html = self._fetch_html(self.BASE_URL)
-        return self.parse_articles(html)
+        return list(self.iter_articles())
+
+    async def _fetch_async(self, client: AsyncHttpClient, url: str) -> HttpResponse:
+        async with self._rate_limiter.acquire_async(url):
+            response = await client.get(url, headers=self._headers(), timeout=self.timeout_seconds)
+        response.raise_for_status()
+        self._archive_response(url, response)
+        return response
+
+    async def _fetch_listing_async(self, client: AsyncHttpClient, url: str, discover: bool = False) -> Dict[str, Any]:
+        response = await self._fetch_async(client, url)
+        return self._listing_from_response(url, response, discover)
+
+    async def _crawl_async(self, client: AsyncHttpClient) -> List[Dict[str, str]]:
+        first = await self._fetch_listing_async(client, self.BASE_URL, discover=self.max_pages > 1)
+        visited: Set[int] = {1}
+        pages = [first["articles"]]
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch_page(url: str) -> Dict[str, Any]:
+            try:
+                async with semaphore:
+                    return await self._fetch_listing_async(client, url, discover=True)
+            except ScraperNetworkError as exc:
+                return self._skipped_listing(url, exc)
+
+        wave = self._next_wave([first], visited)
+        while wave:
+            listings = await asyncio.gather(*(fetch_page(url) for url in wave))
+            pages.extend(listing["articles"] for listing in listings)
+            wave = self._next_wave(listings, visited)
+        return merge_article_pages(pages)
+
+    async def get_articles_async(self) -> List[Dict[str, str]]:
+        if self._async_http is not None:
+            return await self._crawl_async(self._async_http)
+
+        from .async_http import AiohttpHttpClient
+
+        async with AiohttpHttpClient(per_host_limit=self.max_workers) as client:
+            return await self._crawl_async(client)
+
+
+def merge_article_pages(pages: Iterable[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    unique: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for articles in pages:
+        for article in articles:
+            unique.setdefault((article["title"], article["url"]), article)
+    return list(unique.values())
 
 
-def scrape_default_healthcare_news(delay_seconds: float = 1.5) -> List[Dict[str, str]]:
-    return HealthcareNewsScraper(delay_seconds=delay_seconds).get_articles()
+def scrape_default_healthcare_news(delay_seconds: float = 1.5, max_pages: int = 1) -> List[Dict[str, str]]:
+    with HealthcareNewsScraper(delay_seconds=delay_seconds, max_pages=max_pages) as scraper:
+        return scraper.get_articles()
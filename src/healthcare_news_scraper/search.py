@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List
+
+from .config import load_config_from_env
+from .exceptions import StorageError
+
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def match_expression(query: str, *, phrase: bool = False, any_term: bool = False) -> str:
+    terms = query.split()
+    if not terms:
+        raise ValueError("Search query must not be empty")
+    if phrase:
+        return _quote(" ".join(terms))
+    return (" OR " if any_term else " AND ").join(_quote(term) for term in terms)
+
+
+def format_hit(row) -> str:
+    parts: List[str] = [f"{row['score']:8.3f}", row["category"] or "-", row["observed_at"][:10], row["name"]]
+    if row["url"]:
+        parts.append(row["url"])
+    return "  ".join(parts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Full-text search over stored healthcare news articles")
+    parser.add_argument("query", help="Search terms; all terms must match unless --any is given")
+    parser.add_argument("--db-path", help="Override DB path")
+    parser.add_argument("--phrase", action="store_true", help="Match the terms as one exact phrase")
+    parser.add_argument("--any", dest="any_term", action="store_true", help="Match articles containing any term")
+    parser.add_argument("--raw", action="store_true", help="Pass the query to FTS5 unchanged (NEAR, prefix*, column:)")
+    parser.add_argument("--category", help="Only return articles in this category")
+    parser.add_argument("--since", help="Only return articles observed at or after this ISO date")
+    parser.add_argument("--until", help="Only return articles observed before this ISO date")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of results")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the search index from stored articles first")
+    args = parser.parse_args()
+
+    from .partitioned import open_store
+
+    cfg = load_config_from_env()
+    match = args.query if args.raw else match_expression(args.query, phrase=args.phrase, any_term=args.any_term)
+    with open_store(cfg, args.db_path) as store:
+        store.init_schema()
+        if args.rebuild:
+            store.rebuild_search_index()
+        started = time.perf_counter()
+        try:
+            rows = store.search(match, category=args.category, since=args.since, until=args.until, limit=args.limit)
+        except StorageError as exc:
+            parser.exit(2, f"{exc}\n")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    for row in rows:
+        print(format_hit(row))
+    print(f"{len(rows)} results in {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
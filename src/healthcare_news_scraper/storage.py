@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import sqlite3
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from .config import PipelineConfig
+from .dedup import NearDuplicatePolicy, NearDuplicateResolver, backfill_fingerprints, ensure_dedup_schema
+from .exceptions import PartialPersistError, StorageError
+from .queries import (
+    DEFAULT_PAGE_SIZE,
+    READ_INDEX_SQL,
+    Page,
+    fetch_page,
+    latest_snapshots_query,
+    new_since_run_query,
+    snapshot_export_query,
+    snapshots_between_query,
+)
+from .urls import UrlRules
 
-SCHEMA_SQL = """
-PRAGMA foreign_keys = ON;
 
+RUNS_SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS runs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     source TEXT NOT NULL,
@@ -25,15 +41,32 @@ CREATE TABLE IF NOT EXISTS runs (
     updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_runs_fetched_at ON runs(fetched_at);
+"""
+
+PRODUCTS_SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS products (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     canonical_key TEXT NOT NULL UNIQUE,
     name TEXT NOT NULL,
     url TEXT,
+    body TEXT,
+    tags TEXT,
+    content_hash TEXT,
+    last_snapshot_id INTEGER,
+    first_seen_run_id INTEGER,
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_products_canonical_key ON products(canonical_key);
+"""
+
+SCHEMA_SQL = (
+    "PRAGMA foreign_keys = ON;\n"
+    + RUNS_SCHEMA_SQL
+    + PRODUCTS_SCHEMA_SQL
+    + """
 CREATE TABLE IF NOT EXISTS product_snapshots (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     run_id INTEGER NOT NULL,
@@ -44,17 +77,196 @@ CREATE TABLE IF NOT EXISTS product_snapshots (
     category TEXT,
     event_date TEXT,
     observed_at TEXT NOT NULL,
+    content_hash TEXT,
+    last_seen_run_id INTEGER,
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY(run_id) REFERENCES runs(id) ON DELETE CASCADE,
     FOREIGN KEY(product_id) REFERENCES products(id) ON DELETE CASCADE,
     UNIQUE(run_id, product_id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_runs_fetched_at ON runs(fetched_at);
-CREATE INDEX IF NOT EXISTS idx_products_canonical_key ON products(canonical_key);
 CREATE INDEX IF NOT EXISTS idx_snapshots_run_id ON product_snapshots(run_id);
 CREATE INDEX IF NOT EXISTS idx_snapshots_product_id ON product_snapshots(product_id);
 """
+)
+
+COLUMN_MIGRATIONS = {
+    "products": {
+        "body": "TEXT",
+        "tags": "TEXT",
+        "content_hash": "TEXT",
+        "last_snapshot_id": "INTEGER",
+        "first_seen_run_id": "INTEGER",
+    },
+    "product_snapshots": {"content_hash": "TEXT", "last_seen_run_id": "INTEGER"},
+}
+BACKFILL_SQL = """
+UPDATE products
+SET first_seen_run_id = (SELECT MIN(run_id) FROM product_snapshots WHERE product_id = products.id)
+WHERE first_seen_run_id IS NULL;
+
+UPDATE products
+SET last_snapshot_id = (SELECT MAX(id) FROM product_snapshots WHERE product_id = products.id)
+WHERE last_snapshot_id IS NULL;
+"""
+
+SEARCH_SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS article_search USING fts5(
+    name,
+    description,
+    body,
+    category UNINDEXED,
+    event_date UNINDEXED,
+    observed_at UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+META_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS store_meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+SQLITE_MAX_PARAMS = 500
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_PRODUCT_CACHE_SIZE = 100000
+URL_KEY_PREFIX = "url:"
+
+STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS article_staging (
+    seq INTEGER PRIMARY KEY,
+    canonical_key TEXT NOT NULL UNIQUE,
+    product_id INTEGER,
+    cached INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT,
+    body TEXT,
+    tags TEXT,
+    description TEXT,
+    category TEXT,
+    event_date TEXT,
+    content_hash TEXT NOT NULL
+)
+"""
+
+
+JOURNAL_MODES = {"delete", "truncate", "persist", "memory", "wal", "off"}
+SYNCHRONOUS_LEVELS = {"off", "normal", "full", "extra"}
+
+
+@dataclass(frozen=True)
+class SQLiteTuning:
+    journal_mode: str = ""
+    synchronous: str = ""
+    cache_size_kib: int = 16384
+    mmap_size_bytes: int = 0
+    busy_timeout_ms: int = 5000
+
+    def __post_init__(self) -> None:
+        if self.journal_mode and self.journal_mode.lower() not in JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal_mode: {self.journal_mode}")
+        if self.synchronous and self.synchronous.lower() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unsupported synchronous level: {self.synchronous}")
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> "SQLiteTuning":
+        return cls(
+            journal_mode=config.db_journal_mode,
+            synchronous=config.db_synchronous,
+            cache_size_kib=config.db_cache_size_kib,
+            mmap_size_bytes=config.db_mmap_size_bytes,
+            busy_timeout_ms=config.db_busy_timeout_ms,
+        )
+
+    def pragmas(self) -> List[str]:
+        pragmas = []
+        if self.journal_mode:
+            pragmas.append(f"PRAGMA journal_mode = {self.journal_mode.lower()};")
+        if self.synchronous:
+            pragmas.append(f"PRAGMA synchronous = {self.synchronous.lower()};")
+        return pragmas + [
+            f"PRAGMA cache_size = -{int(self.cache_size_kib)};",
+            f"PRAGMA mmap_size = {int(self.mmap_size_bytes)};",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)};",
+        ]
+
+
+ProductFields = Tuple[Optional[int], ...]
+StreamWrite = Callable[[Callable[[], Any]], Any]
+
+
+def fetch_moment(fetched_at: object) -> Optional[datetime]:
+    try:
+        moment = datetime.fromisoformat(str(fetched_at))
+    except ValueError:
+        return None
+    return moment.astimezone(timezone.utc) if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _covers(known: ProductFields, staged: ProductFields) -> bool:
+    return known[0] == staged[0] and all(value is None or value == seen for value, seen in zip(staged[1:], known[1:]))
+
+
+class ProductIdCache:
+    def __init__(self, capacity: int = DEFAULT_PRODUCT_CACHE_SIZE) -> None:
+        self.capacity = max(0, capacity)
+        self._entries: "OrderedDict[str, Tuple[int, ProductFields]]" = OrderedDict()
+        self._misses: Dict[int, Dict[str, ProductFields]] = {}
+        self._pending: Dict[int, List[Tuple[str, int, ProductFields]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, fields: Dict[str, ProductFields], conn: Optional[sqlite3.Connection] = None) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        misses: Dict[str, ProductFields] = {}
+        with self._lock:
+            for key, staged in fields.items():
+                entry = self._entries.get(key)
+                if entry is None:
+                    misses[key] = staged
+                elif _covers(entry[1], staged):
+                    self._entries.move_to_end(key)
+                    found[key] = entry[0]
+                else:
+                    misses[key] = tuple(seen if value is None else value for value, seen in zip(staged, entry[1]))
+            if conn is not None:
+                self._misses[id(conn)] = misses
+        return found
+
+    def put(self, entries: Iterable[Tuple[str, int, ProductFields]]) -> None:
+        if not self.capacity:
+            return
+        with self._lock:
+            for key, product_id, fields in entries:
+                self._entries[key] = (product_id, fields)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def stage(self, conn: sqlite3.Connection, product_ids: Iterable[Tuple[str, int]]) -> None:
+        with self._lock:
+            misses = self._misses.pop(id(conn), {})
+            self._pending.setdefault(id(conn), []).extend(
+                (key, product_id, misses[key]) for key, product_id in product_ids if key in misses
+            )
+
+    def settle(self, conn: sqlite3.Connection, committed: bool) -> None:
+        with self._lock:
+            self._misses.pop(id(conn), None)
+            pending = self._pending.pop(id(conn), [])
+        if committed:
+            self.put(pending)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._misses.clear()
+            self._pending.clear()
 
 
 @dataclass(frozen=True)
@@ -67,59 +279,473 @@ class RunRecord:
 
 
 class SQLiteArticleStore:
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        persistent: bool = False,
+        tuning: Optional[SQLiteTuning] = None,
+        near_duplicates: Optional[NearDuplicatePolicy] = None,
+        url_rules: Optional[UrlRules] = None,
+        product_cache_size: int = DEFAULT_PRODUCT_CACHE_SIZE,
+    ) -> None:
         self.db_path = db_path
+        self.persistent = persistent
+        self.tuning = tuning
+        self.near_duplicates = near_duplicates if near_duplicates is not None and near_duplicates.enabled else None
+        self.url_rules = url_rules or UrlRules()
+        self.product_ids = ProductIdCache(product_cache_size)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._search_enabled: Optional[bool] = None
+        self._lock = threading.RLock()
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    def _open_connection(self) -> sqlite3.Connection:
+        timeout = self.tuning.busy_timeout_ms / 1000 if self.tuning else 5.0
+        connection = sqlite3.connect(self.db_path, timeout=timeout, check_same_thread=not self.persistent)
+        connection.row_factory = sqlite3.Row
+        if connection.execute("PRAGMA page_count").fetchone()[0] == 0:
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+        connection.execute("PRAGMA foreign_keys = ON;")
+        if self.tuning:
+            for pragma in self.tuning.pragmas():
+                connection.execute(pragma)
+        return connection
+
     @contextmanager
     def _connect(self):
-        connection = sqlite3.connect(self.db_path)
+        if self.persistent:
+            with self._lock:
+                if self._connection is None:
+                    self._connection = self._open_connection()
+                connection = self._connection
+                committed = False
+                try:
+                    yield connection
+                    connection.commit()
+                    committed = True
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    self.product_ids.settle(connection, committed)
+            return
+
+        connection = self._open_connection()
+        committed = False
         try:
-            connection.row_factory = sqlite3.Row
-            connection.execute("PRAGMA foreign_keys = ON;")
             yield connection
             connection.commit()
+            committed = True
         except Exception:
             connection.rollback()
             raise
         finally:
+            self.product_ids.settle(connection, committed)
             connection.close()
 
+    def transaction(self):
+        return self._connect()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self) -> "SQLiteArticleStore":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def _migrate_columns(self, conn: sqlite3.Connection) -> None:
+        for table, columns in COLUMN_MIGRATIONS.items():
+            existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for name, declaration in columns.items():
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {declaration}")
+
     def init_schema(self) -> None:
         with self._connect() as conn:
             conn.executescript(SCHEMA_SQL)
+            self._migrate_columns(conn)
+            conn.executescript(BACKFILL_SQL)
+            conn.executescript(READ_INDEX_SQL)
+            self._rekey_products(conn)
+            self._create_dedup_index(conn)
+            needs_rebuild = self._create_search_index(conn) and conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM products) AND NOT EXISTS(SELECT 1 FROM article_search) AS pending"
+            ).fetchone()["pending"]
+        self.warm_product_cache()
+        if needs_rebuild:
+            self.rebuild_search_index()
 
-    def _canonical_key(self, article: Dict[str, str]) -> str:
-        url = (article.get("url") or "").strip()
+    def _rekey_products(self, conn: sqlite3.Connection) -> int:
+        conn.executescript(META_SCHEMA_SQL)
+        rules = repr(self.url_rules)
+        row = conn.execute("SELECT value FROM store_meta WHERE name = 'url_rules'").fetchone()
+        if row is not None and row["value"] == rules:
+            return 0
+        rows = conn.execute("SELECT id, canonical_key FROM products ORDER BY id").fetchall()
+        moves: Dict[int, Tuple[str, str]] = {}
+        for row in rows:
+            if not row["canonical_key"].startswith(URL_KEY_PREFIX):
+                continue
+            url = self.url_rules.canonicalize(row["canonical_key"][len(URL_KEY_PREFIX) :])
+            if URL_KEY_PREFIX + url != row["canonical_key"]:
+                moves[row["id"]] = (URL_KEY_PREFIX + url, url)
+        owners = {row["canonical_key"]: row["id"] for row in rows if row["id"] not in moves}
+        updates, merges = [], []
+        for product_id, (key, url) in moves.items():
+            survivor = owners.setdefault(key, product_id)
+            if survivor == product_id:
+                updates.append((key, url, product_id))
+            else:
+                merges.append((product_id, survivor))
+        for loser, survivor in merges:
+            self._merge_product(conn, loser, survivor)
+        conn.executemany("UPDATE products SET canonical_key = 'rekey:' || id WHERE id = ?", [(update[2],) for update in updates])
+        conn.executemany("UPDATE products SET canonical_key = ?, url = ? WHERE id = ?", updates)
+        conn.execute("INSERT OR REPLACE INTO store_meta (name, value) VALUES ('url_rules', ?)", (rules,))
+        self.product_ids.clear()
+        return len(updates) + len(merges)
+
+    def _last_seen_run(self, conn: sqlite3.Connection, snapshot_id: Optional[int]) -> int:
+        row = conn.execute(
+            "SELECT COALESCE(last_seen_run_id, run_id) FROM product_snapshots WHERE id = ?", (snapshot_id,)
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def _move_snapshots(self, conn: sqlite3.Connection, loser: int, survivor: int) -> None:
+        conn.execute(
+            """
+            DELETE FROM product_snapshots
+            WHERE product_id = ? AND run_id IN (SELECT run_id FROM product_snapshots WHERE product_id = ?)
+            """,
+            (loser, survivor),
+        )
+        conn.execute("UPDATE product_snapshots SET product_id = ? WHERE product_id = ?", (survivor, loser))
+
+    def _merge_product(self, conn: sqlite3.Connection, loser: int, survivor: int) -> None:
+        latest = {
+            row["id"]: self._last_seen_run(conn, row["last_snapshot_id"])
+            for row in conn.execute("SELECT id, last_snapshot_id FROM products WHERE id IN (?, ?)", (loser, survivor))
+        }
+        self._move_snapshots(conn, loser, survivor)
+        if latest[loser] > latest[survivor]:
+            conn.execute(
+                """
+                UPDATE products
+                SET (name, body, tags, content_hash, last_snapshot_id) = (
+                    SELECT name, body, tags, content_hash, last_snapshot_id FROM products WHERE id = ?
+                )
+                WHERE id = ?
+                """,
+                (loser, survivor),
+            )
+        conn.execute(
+            """
+            UPDATE products
+            SET first_seen_run_id = (
+                SELECT MIN(first_seen_run_id) FROM products WHERE id IN (?, ?)
+            )
+            WHERE id = ?
+            """,
+            (loser, survivor, survivor),
+        )
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if "alert_matches" in tables:
+            conn.execute("UPDATE OR IGNORE alert_matches SET product_id = ? WHERE product_id = ?", (survivor, loser))
+            conn.execute("DELETE FROM alert_matches WHERE product_id = ?", (loser,))
+        if "product_aliases" in tables:
+            conn.execute("UPDATE product_aliases SET product_id = ? WHERE product_id = ?", (survivor, loser))
+            conn.execute("DELETE FROM fingerprint_bands WHERE product_id = ?", (loser,))
+            conn.execute("DELETE FROM product_fingerprints WHERE product_id = ?", (loser,))
+        if self._has_search_index(conn):
+            if latest[loser] > latest[survivor]:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO article_search (rowid, name, description, body, category, event_date, observed_at)
+                    SELECT ?, name, description, body, category, event_date, observed_at
+                    FROM article_search WHERE rowid = ?
+                    """,
+                    (survivor, loser),
+                )
+            conn.execute("DELETE FROM article_search WHERE rowid = ?", (loser,))
+        conn.execute("DELETE FROM products WHERE id = ?", (loser,))
+
+    def warm_product_cache(self) -> int:
+        if not self.product_ids.capacity:
+            return 0
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, canonical_key, name, url, body, tags FROM products ORDER BY id DESC LIMIT ?",
+                (self.product_ids.capacity,),
+            ).fetchall()
+        self.product_ids.put(
+            (row["canonical_key"], row["id"], self._product_fields(tuple(row)[2:])) for row in reversed(rows)
+        )
+        return len(rows)
+
+    def _create_dedup_index(self, conn: sqlite3.Connection) -> None:
+        if self.near_duplicates is None:
+            return
+        ensure_dedup_schema(conn)
+        backfill_fingerprints(conn, self.near_duplicates)
+
+    def _create_search_index(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.executescript(SEARCH_SCHEMA_SQL)
+        except sqlite3.OperationalError:
+            self._search_enabled = False
+            return False
+        self._search_enabled = True
+        return True
+
+    def _has_search_index(self, conn: sqlite3.Connection) -> bool:
+        if self._search_enabled is None:
+            row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'article_search'").fetchone()
+            self._search_enabled = row is not None
+        return self._search_enabled
+
+    def _canonical_key(self, article: Dict[str, str], url: Optional[str] = None) -> str:
+        url = self.url_rules.canonicalize(article.get("url")) if url is None else url
         title = (article.get("title") or "").strip().lower()
         if url:
-            return f"url:{url}"
+            return f"{URL_KEY_PREFIX}{url}"
         return f"name:{title}"
 
-    def _upsert_product(self, conn: sqlite3.Connection, article: Dict[str, str]) -> int:
-        key = self._canonical_key(article)
+    def _product_row(self, article: Dict[str, str]) -> Tuple[str, str, Optional[str], Optional[str], Optional[str]]:
+        url = self.url_rules.canonicalize(article.get("url"))
+        key = self._canonical_key(article, url)
         name = (article.get("title") or "").strip() or "Untitled"
-        url = (article.get("url") or "").strip() or None
+        url = url or None
+        body = article.get("body") or None
+        tags = article.get("tags") or None
+        return key, name, url, body, tags
+
+    def _product_fields(self, values: Tuple[Optional[str], ...]) -> ProductFields:
+        return tuple(None if value is None else hash(value) for value in values)
 
+    def _content_hash(self, description: str, category: str, event_date: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\x1f".join((description, category, event_date)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _stage_articles(self, conn: sqlite3.Connection, articles: List[Dict[str, str]]) -> Optional[NearDuplicateResolver]:
+        product_rows = [self._product_row(article) for article in articles]
+        resolved_rows = product_rows
+        resolver = None
+        if self.near_duplicates is not None:
+            resolver = NearDuplicateResolver(conn, self.near_duplicates)
+            resolved_rows = resolver.resolve(product_rows, [article.get("date", "") for article in articles])
+
+        staged: Dict[str, Tuple] = {}
+        for article, product_row, resolved_row in zip(articles, product_rows, resolved_rows):
+            description = article.get("title", "")
+            if resolved_row is not product_row:
+                if resolved_row[0] in staged:
+                    continue
+                description = resolved_row[1]
+            product_row = resolved_row
+            category = article.get("category", "general")
+            event_date = article.get("date", "")
+            staged[product_row[0]] = product_row + (
+                description,
+                category,
+                event_date,
+                self._content_hash(description, category, event_date),
+            )
+
+        cached = self.product_ids.lookup({key: self._product_fields(row[1:5]) for key, row in staged.items()}, conn)
+        conn.execute(STAGING_SQL)
+        conn.execute("DELETE FROM article_staging")
+        conn.executemany(
+            """
+            INSERT INTO article_staging (
+                product_id,
+                cached,
+                canonical_key,
+                name,
+                url,
+                body,
+                tags,
+                description,
+                category,
+                event_date,
+                content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [(cached.get(key), key in cached) + row for key, row in staged.items()],
+        )
+        return resolver
+
+    def _upsert_staged_products(self, conn: sqlite3.Connection, run_id: int) -> None:
+        if conn.execute("SELECT 1 FROM article_staging WHERE NOT cached LIMIT 1").fetchone() is None:
+            return
         conn.execute(
             """
-            INSERT INTO products (canonical_key, name, url)
-            VALUES (?, ?, ?)
+            INSERT INTO products (canonical_key, name, url, body, tags, first_seen_run_id)
+            SELECT canonical_key, name, url, body, tags, ?
+            FROM article_staging
+            WHERE NOT cached
+            ORDER BY seq
             ON CONFLICT(canonical_key) DO UPDATE SET
                 name=excluded.name,
                 url=COALESCE(excluded.url, products.url),
+                body=COALESCE(excluded.body, products.body),
+                tags=COALESCE(excluded.tags, products.tags),
                 updated_at=CURRENT_TIMESTAMP
+            WHERE products.name IS NOT excluded.name
+                OR COALESCE(excluded.url, products.url) IS NOT products.url
+                OR COALESCE(excluded.body, products.body) IS NOT products.body
+                OR COALESCE(excluded.tags, products.tags) IS NOT products.tags
             """,
-            (key, name, url),
+            (run_id,),
+        )
+        conn.execute(
+            """
+            UPDATE article_staging
+            SET product_id = (SELECT id FROM products WHERE products.canonical_key = article_staging.canonical_key)
+            WHERE NOT cached
+            """
+        )
+        self.product_ids.stage(
+            conn,
+            conn.execute("SELECT canonical_key, product_id FROM article_staging WHERE NOT cached").fetchall(),
         )
 
-        row = conn.execute("SELECT id FROM products WHERE canonical_key = ?", (key,)).fetchone()
-        if row is None:
-            raise RuntimeError("Failed to resolve product id after upsert")
-        return int(row["id"])
+    def _observed_at(self, fetched_at: object) -> str:
+        return (fetch_moment(fetched_at) or datetime.now(timezone.utc)).isoformat()
 
-    def persist_run(
+    def _previous_run_id(self, conn: sqlite3.Connection, run_id: int) -> int:
+        row = conn.execute(
+            "SELECT MAX(id) AS run_id FROM runs WHERE id < ? AND status != 'failure'",
+            (run_id,),
+        ).fetchone()
+        return int(row["run_id"]) if row and row["run_id"] is not None else 0
+
+    def _insert_staged_snapshots(self, conn: sqlite3.Connection, run_id: int, search_term: str) -> None:
+        previous_run_id = self._previous_run_id(conn, run_id)
+        fetched_at = conn.execute("SELECT fetched_at FROM runs WHERE id = ?", (run_id,)).fetchone()[0]
+        conn.execute(
+            """
+            UPDATE product_snapshots
+            SET last_seen_run_id = ?
+            WHERE id IN (
+                SELECT snapshot.id
+                FROM article_staging AS staged
+                JOIN products ON products.id = staged.product_id
+                JOIN product_snapshots AS snapshot ON snapshot.id = products.last_snapshot_id
+                WHERE products.content_hash = staged.content_hash
+                    AND COALESCE(snapshot.last_seen_run_id, snapshot.run_id) >= ?
+            )
+            """,
+            (run_id, previous_run_id),
+        )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO product_snapshots (
+                run_id,
+                product_id,
+                votes,
+                description,
+                topics,
+                category,
+                event_date,
+                observed_at,
+                content_hash,
+                last_seen_run_id
+            )
+            SELECT ?, products.id, NULL, staged.description, ?, staged.category, staged.event_date, ?, staged.content_hash, ?
+            FROM article_staging AS staged
+            JOIN products ON products.id = staged.product_id
+            LEFT JOIN product_snapshots AS snapshot ON snapshot.id = products.last_snapshot_id
+            WHERE snapshot.id IS NULL
+                OR products.content_hash IS NOT staged.content_hash
+                OR COALESCE(snapshot.last_seen_run_id, snapshot.run_id) < ?
+            ORDER BY staged.seq
+            """,
+            (run_id, search_term, self._observed_at(fetched_at), run_id, previous_run_id),
+        )
+        conn.execute(
+            """
+            UPDATE products
+            SET content_hash = (
+                    SELECT staged.content_hash FROM article_staging AS staged
+                    WHERE staged.canonical_key = products.canonical_key
+                ),
+                last_snapshot_id = (
+                    SELECT snapshot.id FROM product_snapshots AS snapshot
+                    WHERE snapshot.run_id = ? AND snapshot.product_id = products.id
+                )
+            WHERE id IN (
+                SELECT snapshot.product_id
+                FROM article_staging AS staged
+                JOIN product_snapshots AS snapshot
+                    ON snapshot.run_id = ? AND snapshot.product_id = staged.product_id
+            )
+            """,
+            (run_id, run_id),
+        )
+
+    def _index_staged_products(self, conn: sqlite3.Connection, run_id: int) -> None:
+        if not self._has_search_index(conn):
+            return
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO article_search (rowid, name, description, body, category, event_date, observed_at)
+            SELECT
+                products.id,
+                products.name,
+                snapshot.description,
+                COALESCE(products.body, ''),
+                snapshot.category,
+                snapshot.event_date,
+                snapshot.observed_at
+            FROM article_staging AS staged
+            JOIN products ON products.id = staged.product_id
+            JOIN product_snapshots AS snapshot ON snapshot.id = products.last_snapshot_id
+            WHERE snapshot.run_id = ?
+                OR NOT EXISTS (
+                    SELECT 1 FROM article_search AS indexed
+                    WHERE indexed.rowid = products.id
+                        AND indexed.name IS products.name
+                        AND indexed.body IS COALESCE(products.body, '')
+                )
+            """,
+            (run_id,),
+        )
+
+    def rebuild_search_index(self) -> int:
+        with self._connect() as conn:
+            if not self._has_search_index(conn):
+                raise StorageError("Full-text search requires SQLite built with FTS5")
+            conn.execute("DELETE FROM article_search")
+            cursor = conn.execute(
+                """
+                INSERT INTO article_search (rowid, name, description, body, category, event_date, observed_at)
+                SELECT
+                    products.id,
+                    products.name,
+                    snapshot.description,
+                    COALESCE(products.body, ''),
+                    snapshot.category,
+                    snapshot.event_date,
+                    snapshot.observed_at
+                FROM products
+                JOIN product_snapshots AS snapshot ON snapshot.id = COALESCE(
+                    products.last_snapshot_id,
+                    (SELECT MAX(id) FROM product_snapshots WHERE product_id = products.id)
+                )
+                """
+            )
+            return cursor.rowcount
+
+    def _write_run(
         self,
+        conn: sqlite3.Connection,
         *,
         source: str,
         fetched_at: str,
@@ -131,71 +757,351 @@ class SQLiteArticleStore:
         articles: Iterable[Dict[str, str]],
     ) -> RunRecord:
         article_list: List[Dict[str, str]] = list(articles)
+        cursor = conn.execute(
+            """
+            INSERT INTO runs (
+                source,
+                fetched_at,
+                search_term,
+                record_limit,
+                status,
+                fetched_count,
+                attempts,
+                error,
+                updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+            (
+                source,
+                fetched_at,
+                search_term,
+                record_limit,
+                status,
+                len(article_list),
+                attempts,
+                error or "",
+            ),
+        )
+        run_id = int(cursor.lastrowid)
+
+        if article_list:
+            resolver = self._stage_articles(conn, article_list)
+            self._upsert_staged_products(conn, run_id)
+            if resolver is not None:
+                resolver.link()
+            self._insert_staged_snapshots(conn, run_id, search_term)
+            self._index_staged_products(conn, run_id)
+
+        return RunRecord(
+            run_id=run_id,
+            status=status,
+            fetched_count=len(article_list),
+            attempts=attempts,
+            error=error or "",
+        )
+
+    def persist_run(
+        self,
+        *,
+        source: str,
+        fetched_at: str,
+        search_term: str,
+        record_limit: int,
+        status: str,
+        attempts: int,
+        error: str,
+        articles: Iterable[Dict[str, str]],
+    ) -> RunRecord:
+        return self.persist_runs(
+            [
+                {
+                    "source": source,
+                    "fetched_at": fetched_at,
+                    "search_term": search_term,
+                    "record_limit": record_limit,
+                    "status": status,
+                    "attempts": attempts,
+                    "error": error,
+                    "articles": articles,
+                }
+            ]
+        )[0]
+
+    def persist_runs(self, runs: Iterable[Dict[str, object]]) -> List[RunRecord]:
         with self._connect() as conn:
             conn.execute("BEGIN")
+            return [self._write_run(conn, **fields) for fields in runs]
+
+    def _write_chunk(self, conn: sqlite3.Connection, run_id: int, search_term: str, chunk: List[Dict[str, str]]) -> None:
+        resolver = self._stage_articles(conn, chunk)
+        self._upsert_staged_products(conn, run_id)
+        if resolver is not None:
+            resolver.link()
+        self._insert_staged_snapshots(conn, run_id, search_term)
+        self._index_staged_products(conn, run_id)
+        conn.execute(
+            "UPDATE runs SET fetched_count = fetched_count + ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (len(chunk), run_id),
+        )
+
+    def _commit_chunk(self, run_id: int, search_term: str, chunk: List[Dict[str, str]]) -> None:
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            self._write_chunk(conn, run_id, search_term, chunk)
+
+    def _salvage_chunk(self, write: "StreamWrite", run_id: int, search_term: str, chunk: List[Dict[str, str]]) -> int:
+        if not chunk:
+            return 0
+        try:
+            write(lambda: self._commit_chunk(run_id, search_term, chunk))
+        except Exception:
+            return 0
+        return len(chunk)
+
+    def _start_run(self, source: str, fetched_at: str, search_term: str, record_limit: int, attempts: int) -> int:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """
-                INSERT INTO runs (
-                    source,
-                    fetched_at,
-                    search_term,
-                    record_limit,
-                    status,
-                    fetched_count,
-                    attempts,
-                    error,
-                    updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                INSERT INTO runs (source, fetched_at, search_term, record_limit, status, fetched_count, attempts, error)
+                VALUES (?, ?, ?, ?, 'partial', 0, ?, '')
                 """,
-                (
-                    source,
-                    fetched_at,
-                    search_term,
-                    record_limit,
-                    status,
-                    len(article_list),
-                    attempts,
-                    error or "",
-                ),
+                (source, fetched_at, search_term, record_limit, attempts),
             )
-            run_id = int(cursor.lastrowid)
+            return int(cursor.lastrowid)
 
-            observed_at = datetime.now(timezone.utc).isoformat()
-            for article in article_list:
-                product_id = self._upsert_product(conn, article)
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO product_snapshots (
-                        run_id,
-                        product_id,
-                        votes,
-                        description,
-                        topics,
-                        category,
-                        event_date,
-                        observed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        run_id,
-                        product_id,
-                        None,
-                        article.get("title", ""),
-                        search_term,
-                        article.get("category", "general"),
-                        article.get("date", ""),
-                        observed_at,
-                    ),
-                )
+    def _finish_run(self, run_id: int, status: str, error: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE runs SET status = ?, error = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (status, error, run_id),
+            )
+
+    def persist_run_streaming(
+        self,
+        *,
+        source: str,
+        fetched_at: str,
+        search_term: str,
+        record_limit: int,
+        status: str,
+        attempts: int,
+        error: str,
+        articles: Iterable[Dict[str, str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> RunRecord:
+        return self._stream_run(
+            lambda call: call(),
+            source=source,
+            fetched_at=fetched_at,
+            search_term=search_term,
+            record_limit=record_limit,
+            status=status,
+            attempts=attempts,
+            error=error,
+            articles=articles,
+            chunk_size=chunk_size,
+        )
+
+    def _stream_run(
+        self,
+        write: "StreamWrite",
+        *,
+        source: str,
+        fetched_at: str,
+        search_term: str,
+        record_limit: int,
+        status: str,
+        attempts: int,
+        error: str,
+        articles: Iterable[Dict[str, str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> RunRecord:
+        run_id = write(lambda: self._start_run(source, fetched_at, search_term, record_limit, attempts))
 
+        fetched_count = 0
+        pending: List[Dict[str, str]] = []
+        try:
+            try:
+                for article in articles:
+                    pending.append(article)
+                    if len(pending) >= max(1, chunk_size):
+                        chunk, pending = pending, []
+                        write(lambda: self._commit_chunk(run_id, search_term, chunk))
+                        fetched_count += len(chunk)
+            except BaseException:
+                fetched_count += self._salvage_chunk(write, run_id, search_term, pending)
+                raise
+            if pending:
+                write(lambda: self._commit_chunk(run_id, search_term, pending))
+                fetched_count += len(pending)
+        except BaseException as exc:
+            interrupted_status = "partial" if fetched_count else "failure"
+            message = str(exc) or type(exc).__name__
+            write(lambda: self._finish_run(run_id, interrupted_status, message))
+            record = RunRecord(
+                run_id=run_id,
+                status=interrupted_status,
+                fetched_count=fetched_count,
+                attempts=attempts,
+                error=message,
+            )
+            if not isinstance(exc, Exception):
+                raise
+            raise PartialPersistError(f"Run {run_id} interrupted after {fetched_count} articles", record, cause=exc) from exc
+
+        write(lambda: self._finish_run(run_id, status, error or ""))
         return RunRecord(
             run_id=run_id,
             status=status,
-            fetched_count=len(article_list),
+            fetched_count=fetched_count,
             attempts=attempts,
             error=error or "",
         )
 
+    def known_urls(self, urls: Iterable[str]) -> Set[str]:
+        requested: Dict[str, List[str]] = {}
+        for url in urls:
+            if url and url.strip():
+                requested.setdefault(self.url_rules.canonicalize(url), []).append(url)
+        candidates = sorted(requested)
+        known: Set[str] = set()
+        with self._connect() as conn:
+            for start in range(0, len(candidates), SQLITE_MAX_PARAMS):
+                chunk = candidates[start : start + SQLITE_MAX_PARAMS]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(f"SELECT url FROM products WHERE url IN ({placeholders})", chunk).fetchall()
+                known.update(row["url"] for row in rows)
+                if self.near_duplicates is not None:
+                    rows = conn.execute(
+                        f"SELECT alias_key FROM product_aliases WHERE alias_key IN ({placeholders})",
+                        [f"{URL_KEY_PREFIX}{url}" for url in chunk],
+                    ).fetchall()
+                    known.update(row["alias_key"][len(URL_KEY_PREFIX) :] for row in rows)
+        return {url for canonical in known for url in requested[canonical]}
+
+    def snapshots_at_run(self, run_id: int) -> List[sqlite3.Row]:
+        with self._connect() as conn:
+            run = conn.execute("SELECT status FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if run is None or run["status"] == "failure":
+                return []
+            return conn.execute(
+                """
+                SELECT
+                    products.id AS product_id,
+                    products.canonical_key,
+                    products.name,
+                    products.url,
+                    snapshot.description,
+                    snapshot.category,
+                    snapshot.event_date,
+                    snapshot.run_id AS first_seen_run_id,
+                    COALESCE(snapshot.last_seen_run_id, snapshot.run_id) AS last_seen_run_id
+                FROM product_snapshots AS snapshot
+                JOIN products ON products.id = snapshot.product_id
+                WHERE snapshot.run_id <= ? AND COALESCE(snapshot.last_seen_run_id, snapshot.run_id) >= ?
+                ORDER BY products.id
+                """,
+                (run_id, run_id),
+            ).fetchall()
+
+    def search(
+        self,
+        match: str,
+        *,
+        category: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[sqlite3.Row]:
+        clauses = ["article_search MATCH ?"]
+        params: List[object] = [match]
+        if category:
+            clauses.append("article_search.category = ?")
+            params.append(category)
+        if since:
+            clauses.append("article_search.observed_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("article_search.observed_at < ?")
+            params.append(until)
+        clauses.append("article_search.rank MATCH ?")
+        params.append(f"bm25({', '.join(str(weight) for weight in SEARCH_WEIGHTS)})")
+        with self._connect() as conn:
+            if not self._has_search_index(conn):
+                raise StorageError("Full-text search requires SQLite built with FTS5")
+            try:
+                return conn.execute(
+                    f"""
+                    SELECT
+                        article_search.rowid AS product_id,
+                        article_search.name,
+                        products.url,
+                        article_search.category,
+                        article_search.event_date,
+                        article_search.observed_at,
+                        snippet(article_search, -1, '[', ']', '...', 12) AS snippet,
+                        article_search.rank AS score
+                    FROM article_search
+                    JOIN products ON products.id = article_search.rowid
+                    WHERE {" AND ".join(clauses)}
+                    ORDER BY article_search.rank
+                    LIMIT ?
+                    """,
+                    (*params, max(1, limit)),
+                ).fetchall()
+            except sqlite3.OperationalError as exc:
+                raise StorageError(f"Invalid search query {match!r}: {exc}") from exc
+
+    def latest_snapshots(self, *, after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+        with self._connect() as conn:
+            return fetch_page(conn, latest_snapshots_query(after, limit), limit, ("product_id",))
+
+    def snapshots_between(
+        self,
+        since: str,
+        until: Optional[str] = None,
+        *,
+        category: Optional[str] = None,
+        newest_first: bool = False,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page:
+        query = snapshots_between_query(
+            since,
+            until,
+            category=category,
+            newest_first=newest_first,
+            after=after,
+            limit=limit,
+        )
+        with self._connect() as conn:
+            return fetch_page(conn, query, limit, ("observed_at", "snapshot_id"))
+
+    def new_since_run(self, run_id: int, *, after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+        with self._connect() as conn:
+            return fetch_page(conn, new_since_run_query(run_id, after, limit), limit, ("first_seen_run_id", "product_id"))
+
+    def iter_snapshots(
+        self,
+        *,
+        since_run: Optional[int] = None,
+        since: Optional[str] = None,
+        batch_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[sqlite3.Row]:
+        after_id = 0
+        while True:
+            query = snapshot_export_query(after_id, since_run=since_run, since=since, limit=batch_size)
+            with self._connect() as conn:
+                rows = conn.execute(*query).fetchall()
+            yield from rows
+            if len(rows) < max(1, batch_size):
+                return
+            after_id = rows[-1]["snapshot_id"]
+
+    def run_timestamps(self, source: str) -> Set[str]:
+        with self._connect() as conn:
+            return {row["fetched_at"] for row in conn.execute("SELECT fetched_at FROM runs WHERE source = ?", (source,))}
+
     def fetch_latest_run(self) -> Optional[sqlite3.Row]:
         with self._connect() as conn:
             return conn.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .config import PipelineConfig
+
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _patterns(value: str) -> Tuple[str, ...]:
+    return tuple(pattern.strip().lower() for pattern in value.split(",") if pattern.strip())
+
+
+@dataclass(frozen=True)
+class UrlRules:
+    enabled: bool = True
+    force_https: bool = True
+    strip_www: bool = False
+    strip_trailing_slash: bool = True
+    drop_fragment: bool = True
+    sort_query: bool = True
+    strip_params: Tuple[str, ...] = _patterns(PipelineConfig.url_strip_params)
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> "UrlRules":
+        return cls(
+            enabled=config.url_canonicalize,
+            force_https=config.url_force_https,
+            strip_www=config.url_strip_www,
+            strip_params=_patterns(config.url_strip_params),
+        )
+
+    @cached_property
+    def _already_canonical(self) -> Callable[[str], Optional["re.Match[str]"]]:
+        scheme = "https" if self.force_https else "https?"
+        host = r"(?!www\.)" if self.strip_www else ""
+        path = r"/(?:[^?#\s]*[^/?#\s])?" if self.strip_trailing_slash else r"/[^?#\s]*"
+        return re.compile(rf"{scheme}://{host}[a-z0-9-]+(?:\.[a-z0-9-]+)*{path}").fullmatch
+
+    def _stripped(self, name: str) -> bool:
+        lowered = name.lower()
+        return any(fnmatch.fnmatchcase(lowered, pattern) for pattern in self.strip_params)
+
+    def _netloc(self, scheme: str, netloc: str) -> Optional[str]:
+        netloc = netloc.rpartition("@")[2].lower()
+        host, port = netloc, ""
+        if not netloc.endswith("]") and ":" in netloc:
+            host, _, port = netloc.rpartition(":")
+            if port and not port.isdigit():
+                return None
+        host = host.rstrip(".")
+        if not host:
+            return None
+        if self.strip_www and host.startswith("www."):
+            host = host[len("www.") :]
+        if port and port.lstrip("0") != DEFAULT_PORTS[scheme]:
+            host = f"{host}:{port}"
+        return host
+
+    def canonicalize(self, url: Optional[str]) -> str:
+        url = (url or "").strip()
+        if not self.enabled or not url or self._already_canonical(url):
+            return url
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS:
+            return url
+        netloc = self._netloc(scheme, parts.netloc)
+        if netloc is None:
+            return url
+        if self.force_https:
+            scheme = "https"
+
+        path = parts.path or "/"
+        if self.strip_trailing_slash and len(path) > 1:
+            path = path.rstrip("/") or "/"
+
+        query = parts.query
+        if query and (self.strip_params or self.sort_query):
+            params = [(name, value) for name, value in parse_qsl(query, keep_blank_values=True) if not self._stripped(name)]
+            if self.sort_query:
+                params.sort()
+            query = urlencode(params)
+
+        fragment = "" if self.drop_fragment else parts.fragment
+        return urlunsplit((scheme, netloc, path, query, fragment))
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, TypeVar
+
+from .config import PipelineConfig
+from .exceptions import StorageError
+from .storage import DEFAULT_CHUNK_SIZE
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to SQLite's busy timeout
+    fcntl = None
+
+if TYPE_CHECKING:
+    from .storage import RunRecord, SQLiteArticleStore
+
+
+logger = logging.getLogger("healthcare_news_scraper.writer")
+
+DEFAULT_MAX_PENDING = PipelineConfig.db_write_queue_size
+DEFAULT_MAX_BATCH = PipelineConfig.db_write_batch_size
+DEFAULT_GROUP_COMMIT_SECONDS = PipelineConfig.db_group_commit_ms / 1000
+
+T = TypeVar("T")
+
+
+@dataclass
+class _WriteJob:
+    future: Future
+    run: Optional[Dict[str, object]] = None
+    call: Optional[Callable[[], object]] = None
+
+
+@dataclass
+class WriterStats:
+    runs_committed: int = 0
+    commits: int = 0
+    largest_batch: int = 0
+    failed_runs: int = 0
+
+
+_STOP = object()
+
+
+class QueuedArticleStore:
+    def __init__(
+        self,
+        store: "SQLiteArticleStore",
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        group_commit_seconds: float = DEFAULT_GROUP_COMMIT_SECONDS,
+        enqueue_timeout: Optional[float] = None,
+        lock_path: Optional[str] = None,
+    ) -> None:
+        self.store = store
+        self.max_batch = max(1, max_batch)
+        self.group_commit_seconds = max(0.0, group_commit_seconds)
+        self.enqueue_timeout = enqueue_timeout
+        self.lock_path = lock_path if lock_path is not None else f"{store.db_path}.writer.lock"
+        self.stats = WriterStats()
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max(1, max_pending))
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, store: "SQLiteArticleStore", config: PipelineConfig) -> "QueuedArticleStore":
+        return cls(
+            store,
+            max_pending=config.db_write_queue_size,
+            max_batch=config.db_write_batch_size,
+            group_commit_seconds=config.db_group_commit_ms / 1000,
+            enqueue_timeout=config.db_write_queue_timeout_seconds or None,
+        )
+
+    def _submit(self, job: _WriteJob) -> object:
+        if self._closed:
+            raise StorageError("Write queue is closed")
+        try:
+            self._queue.put(job, timeout=self.enqueue_timeout)
+        except queue.Full as exc:
+            raise StorageError(f"Write queue stayed full for {self.enqueue_timeout}s") from exc
+        return job.future.result()
+
+    def execute(self, func: Callable[[], T]) -> T:
+        return self._submit(_WriteJob(future=Future(), call=func))
+
+    def init_schema(self) -> None:
+        self.execute(self.store.init_schema)
+
+    def persist_run(
+        self,
+        *,
+        source: str,
+        fetched_at: str,
+        search_term: str,
+        record_limit: int,
+        status: str,
+        attempts: int,
+        error: str,
+        articles: Iterable[Dict[str, str]],
+    ) -> "RunRecord":
+        run = {
+            "source": source,
+            "fetched_at": fetched_at,
+            "search_term": search_term,
+            "record_limit": record_limit,
+            "status": status,
+            "attempts": attempts,
+            "error": error,
+            "articles": list(articles),
+        }
+        return self._submit(_WriteJob(future=Future(), run=run))
+
+    def persist_run_streaming(
+        self,
+        *,
+        source: str,
+        fetched_at: str,
+        search_term: str,
+        record_limit: int,
+        status: str,
+        attempts: int,
+        error: str,
+        articles: Iterable[Dict[str, str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "RunRecord":
+        return self.store._stream_run(
+            self.execute,
+            source=source,
+            fetched_at=fetched_at,
+            search_term=search_term,
+            record_limit=record_limit,
+            status=status,
+            attempts=attempts,
+            error=error,
+            articles=articles,
+            chunk_size=chunk_size,
+        )
+
+    def known_urls(self, urls: Iterable[str]) -> Set[str]:
+        return self.store.known_urls(urls)
+
+    @contextmanager
+    def _writer_lock(self):
+        if fcntl is None or not self.lock_path:
+            yield
+            return
+        with open(self.lock_path, "a+") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _next_batch(self, first: _WriteJob) -> tuple:
+        batch = [first]
+        deadline = time.monotonic() + self.group_commit_seconds
+        while len(batch) < self.max_batch:
+            try:
+                remaining = deadline - time.monotonic()
+                job = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is _STOP or job.call is not None:
+                return batch, job
+            batch.append(job)
+        return batch, None
+
+    def _execute_call(self, job: _WriteJob) -> None:
+        try:
+            with self._writer_lock():
+                job.future.set_result(job.call())
+        except BaseException as exc:
+            job.future.set_exception(exc)
+
+    def _commit(self, batch: List[_WriteJob]) -> None:
+        try:
+            with self._writer_lock():
+                records = self.store.persist_runs([job.run for job in batch])
+        except Exception as exc:
+            if len(batch) == 1:
+                self.stats.failed_runs += 1
+                batch[0].future.set_exception(exc)
+                return
+            logger.warning("Group commit of %s runs failed (%s); retrying them one by one", len(batch), exc)
+            for job in batch:
+                self._commit([job])
+            return
+
+        self.stats.commits += 1
+        self.stats.runs_committed += len(batch)
+        self.stats.largest_batch = max(self.stats.largest_batch, len(batch))
+        for job, record in zip(batch, records):
+            job.future.set_result(record)
+
+    def _run(self) -> None:
+        job = None
+        while True:
+            if job is None:
+                job = self._queue.get()
+            if job is _STOP:
+                return
+            if job.call is not None:
+                self._execute_call(job)
+                job = None
+                continue
+            batch, job = self._next_batch(job)
+            self._commit(batch)
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self.store.close()
+
+    def __enter__(self) -> "QueuedArticleStore":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional
 
 from healthcare_news_scraper.exceptions import ScraperNetworkError
 
 
 class StubHttpResponse:
-    def __init__(self, text: str, status_code: int = 200) -> None:
+    def __init__(self, text: str, status_code: int = 200, not_modified: bool = False) -> None:
         self._text = text
         self.status_code = status_code
+        self._not_modified = not_modified
 
     @property
     def text(self) -> str:
         return self._text
 
+    @property
+    def not_modified(self) -> bool:
+        return self._not_modified
+
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
             raise ScraperNetworkError(f"HTTP {self.status_code}")
@@ -37,3 +43,35 @@ class FailingHttpClient:
 
     def get(self, url: str, *, headers: dict, timeout: int):
         raise self.exc
+
+
+class RoutingHttpClient:
+    def __init__(self, pages: Dict[str, str]) -> None:
+        self._pages = dict(pages)
+        self.requested: List[str] = []
+
+    def get(self, url: str, *, headers: dict, timeout: int) -> StubHttpResponse:
+        self.requested.append(url)
+        if url not in self._pages:
+            return StubHttpResponse("", status_code=404)
+        return StubHttpResponse(self._pages[url])
+
+
+class AsyncRoutingHttpClient:
+    def __init__(self, pages: Dict[str, str]) -> None:
+        self._sync = RoutingHttpClient(pages)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def requested(self) -> List[str]:
+        return self._sync.requested
+
+    async def get(self, url: str, *, headers: dict, timeout: int) -> StubHttpResponse:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return self._sync.get(url, headers=headers, timeout=timeout)
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+FETCHED_AT = "2026-02-17T00:00:00+00:00"
+
+
+def make_article(index: int, category: str = "general", *, title: Optional[str] = None) -> Dict[str, str]:
+    return {
+        "title": f"Article {index}" if title is None else title,
+        "url": f"https://www.who.int/news/item/{index}",
+        "category": category,
+        "date": "",
+    }
+
+
+def make_articles(start: int, stop: int, category: str = "general") -> List[Dict[str, str]]:
+    return [make_article(index, category) for index in range(start, stop)]
+
+
+def run_fields(
+    articles: Iterable[Dict[str, str]],
+    *,
+    fetched_at: str = FETCHED_AT,
+    source: str = "web",
+    status: str = "success",
+) -> Dict[str, Any]:
+    return {
+        "source": source,
+        "fetched_at": fetched_at,
+        "search_term": "",
+        "record_limit": 0,
+        "status": status,
+        "attempts": 1,
+        "error": "",
+        "articles": articles,
+    }
+
+
+def persist(store: Any, articles: Iterable[Dict[str, str]], fetched_at: str = FETCHED_AT, **fields: str) -> Any:
+    return store.persist_run(**run_fields(articles, fetched_at=fetched_at, **fields))
@@ -0,0 +1,123 @@
+import pytest
+
+from healthcare_news_scraper.alerts import (
+    AlertMatcher,
+    AlertRule,
+    add_rule,
+    evaluate_alerts,
+    list_rules,
+    poll_alerts,
+    remove_rule,
+)
+from healthcare_news_scraper.config import PipelineConfig
+from healthcare_news_scraper.runner_once import run_once
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.store_helpers import make_article, persist
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "news.db"))
+    store.init_schema()
+    return store
+
+
+def test_matcher_compiles_all_rules_into_one_pass():
+    rules = [AlertRule(f"country-{index}", (f"country{index}",)) for index in range(2000)]
+    rules.append(AlertRule("cholera", ("cholera", "vibrio*")))
+    rules.append(AlertRule("drc-outbreaks", ("Democratic Republic of the Congo",), categories=("outbreak",)))
+    matcher = AlertMatcher(rules)
+
+    found = matcher.match_many(
+        [
+            "Vibrionaceae spread in country17 and country1999",
+            "Cholera in the Democratic Republic of the Congo",
+            "Democratic Republic of the Congo health budget",
+            "Country170s market",
+        ],
+        ["outbreak", "outbreak", "policy", "general"],
+    )
+
+    names = [[rules[index].name for index in indexes] for indexes in found]
+    assert names == [
+        ["country-17", "country-1999", "cholera"],
+        ["cholera", "drc-outbreaks"],
+        [],
+        [],
+    ]
+    assert [rule.name for rule in matcher.match("cholera update")] == ["cholera"]
+
+
+def test_matcher_fires_rules_whose_keywords_overlap():
+    rules = [
+        AlertRule("ph", ("public health",)),
+        AlertRule("he", ("health emergency",)),
+        AlertRule("bird", ("bird flu",)),
+        AlertRule("flu", ("flu vaccine",)),
+    ]
+    matcher = AlertMatcher(rules)
+
+    found = matcher.match_many(["WHO declares public health emergency", "bird flu vaccine trial"], ["", ""])
+
+    assert [[rules[index].name for index in indexes] for indexes in found] == [["ph", "he"], ["bird", "flu"]]
+
+
+def test_evaluation_only_scans_articles_new_since_last_run(store):
+    persist(store, [make_article(1, "outbreak", title="Cholera outbreak in Yemen")])
+    add_rule(store, AlertRule("cholera", ("cholera",), team="emergencies"))
+    add_rule(store, AlertRule("measles", ("measles",), team="immunization"))
+
+    first = evaluate_alerts(store)
+    assert (first.articles_scanned, first.matches) == (1, 1)
+
+    persist(store, [make_article(1, "outbreak", title="Cholera outbreak in Yemen"), make_article(2, title="Measles cases rise")])
+    second = evaluate_alerts(store)
+    assert (second.articles_scanned, second.matches) == (1, 1)
+    assert evaluate_alerts(store).articles_scanned == 0
+
+    persist(store, [make_article(1, "outbreak", title="Cholera outbreak in Yemen spreads")])
+    assert evaluate_alerts(store).matches == 0
+
+
+def test_matches_are_pollable_with_a_resume_cursor(store):
+    add_rule(store, AlertRule("cholera", ("cholera",), team="emergencies"))
+    add_rule(store, AlertRule("vaccines", ("vaccin*",), team="immunization"))
+    persist(store, [make_article(index, title=f"Cholera vaccine drive {index}") for index in range(3)])
+    assert evaluate_alerts(store).matches == 6
+
+    page = poll_alerts(store, team="emergencies", limit=2)
+    assert [row["name"] for row in page.rows] == ["Cholera vaccine drive 0", "Cholera vaccine drive 1"]
+    page = poll_alerts(store, team="emergencies", after=page.next_cursor, limit=2)
+    assert [row["rule"] for row in page.rows] == ["cholera"]
+    resume = page.next_cursor
+    assert poll_alerts(store, team="emergencies", after=resume).rows == []
+
+    persist(store, [make_article(10, title="Cholera vaccine stockpile")])
+    evaluate_alerts(store)
+    assert [row["name"] for row in poll_alerts(store, team="emergencies", after=resume).rows] == ["Cholera vaccine stockpile"]
+
+
+def test_rules_are_replaced_by_name_and_removed_with_their_matches(store):
+    add_rule(store, AlertRule("outbreaks", ("ebola",)))
+    add_rule(store, AlertRule("outbreaks", ("mpox",), categories=("outbreak",), team="emergencies"))
+    assert list_rules(store) == [AlertRule("outbreaks", ("mpox",), ("outbreak",), "emergencies")]
+
+    persist(store, [make_article(1, "outbreak", title="Mpox update")])
+    evaluate_alerts(store)
+    assert remove_rule(store, "outbreaks")
+    assert not remove_rule(store, "outbreaks")
+    assert poll_alerts(store).rows == []
+    with pytest.raises(ValueError):
+        add_rule(store, AlertRule("empty", ("*",)))
+
+
+def test_run_once_evaluates_alerts_when_enabled(tmp_path):
+    cfg = PipelineConfig(db_path=str(tmp_path / "news.db"), alerts_enabled=True)
+    with SQLiteArticleStore(cfg.db_path) as store:
+        store.init_schema()
+        add_rule(store, AlertRule("cholera", ("cholera",)))
+
+    run_once(cfg, scrape_func=lambda _cfg: [make_article(1, "outbreak", title="Cholera in Sudan")])
+
+    with SQLiteArticleStore(cfg.db_path) as store:
+        assert [row["name"] for row in poll_alerts(store).rows] == ["Cholera in Sudan"]
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+
+from healthcare_news_scraper.archive import RawHtmlArchive
+from healthcare_news_scraper.backfill import backfill_archive
+from healthcare_news_scraper.partitioned import PartitionedArticleStore
+from healthcare_news_scraper.scraper import HealthcareNewsScraper
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.http_doubles import StubHttpClient, StubHttpResponse
+
+
+def test_archive_deduplicates_identical_payloads(tmp_path):
+    archive = RawHtmlArchive(str(tmp_path / "archive"))
+
+    first = archive.store("https://www.who.int/news", "<html>same</html>", fetched_at="2026-02-17T00:00:00+00:00")
+    second = archive.store("https://www.who.int/news", "<html>same</html>", fetched_at="2026-02-17T06:00:00+00:00")
+
+    fetches = list(archive.iter_fetches())
+    assert first == second
+    assert [fetch.fetched_at for fetch in fetches] == ["2026-02-17T00:00:00+00:00", "2026-02-17T06:00:00+00:00"]
+    assert len(list((tmp_path / "archive" / "blobs").rglob("*.gz"))) == 1
+    assert archive.load(first) == "<html>same</html>"
+
+
+def test_iter_fetches_filters_by_since(tmp_path):
+    archive = RawHtmlArchive(str(tmp_path / "archive"))
+    archive.store("https://www.who.int/news", "a", fetched_at="2026-01-01T00:00:00+00:00")
+    archive.store("https://www.who.int/news", "b", fetched_at="2026-02-01T00:00:00+00:00")
+
+    assert [fetch.size for fetch in archive.iter_fetches(since="2026-01-15")] == [1]
+
+
+def test_scraper_writes_fetches_into_archive(tmp_path):
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    archive = RawHtmlArchive(str(tmp_path / "archive"))
+    client = StubHttpClient([StubHttpResponse(text=html)])
+
+    HealthcareNewsScraper(delay_seconds=0, http_client=client, archive=archive).get_articles()
+
+    fetches = list(archive.iter_fetches())
+    assert [fetch.url for fetch in fetches] == [HealthcareNewsScraper.BASE_URL]
+    assert archive.load(fetches[0].digest) == html
+
+
+def test_backfill_replays_archive_into_store(tmp_path):
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    archive = RawHtmlArchive(str(tmp_path / "archive"))
+    archive.store(HealthcareNewsScraper.BASE_URL, html, fetched_at="2026-02-17T00:00:00+00:00")
+    archive.store(HealthcareNewsScraper.BASE_URL, html, fetched_at="2026-02-17T06:00:00+00:00")
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+
+    replayed = backfill_archive(archive, store, workers=2)
+
+    latest = store.fetch_latest_run()
+    assert replayed == 2
+    assert latest["source"] == "backfill"
+    assert latest["fetched_at"] == "2026-02-17T06:00:00+00:00"
+    assert store.count_rows("products") == 2
+    assert store.count_rows("product_snapshots") == 2
+
+
+def test_backfill_groups_paginated_fetches_into_one_run_and_skips_replayed_crawls(tmp_path):
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    base = HealthcareNewsScraper.BASE_URL
+    archive = RawHtmlArchive(str(tmp_path / "archive"))
+    archive.store(base, html, fetched_at="2026-02-17T00:00:00+00:00")
+    archive.store(f"{base}?page=2", html, fetched_at="2026-02-17T00:00:01+00:00")
+    archive.store(f"{base}?page=3", "<html></html>", fetched_at="2026-02-17T00:00:02+00:00")
+    archive.store(base, html, fetched_at="2026-02-17T06:00:00+00:00")
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+
+    assert backfill_archive(archive, store, workers=1) == 2
+    assert store.count_rows("runs") == 2
+    assert store.run_timestamps("backfill") == {"2026-02-17T00:00:00+00:00", "2026-02-17T06:00:00+00:00"}
+
+    archive.store(base, html, fetched_at="2026-02-18T00:00:00+00:00")
+    assert backfill_archive(archive, store, workers=1) == 1
+    assert store.count_rows("runs") == 3
+
+
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_backfilled_snapshots_are_observed_at_their_fetch_time(tmp_path, partitioned):
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    archive = RawHtmlArchive(str(tmp_path / "archive"))
+    archive.store(HealthcareNewsScraper.BASE_URL, html, fetched_at="2025-11-02T08:00:00+00:00")
+    if partitioned:
+        store = PartitionedArticleStore(str(tmp_path / "partitions"))
+    else:
+        store = SQLiteArticleStore(str(tmp_path / "events.db"))
+
+    assert backfill_archive(archive, store, workers=1) == 1
+
+    rows = store.snapshots_between("2025-01-01").rows
+    assert len(rows) == 2
+    assert {row["observed_at"] for row in rows} == {"2025-11-02T08:00:00+00:00"}
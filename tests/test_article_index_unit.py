@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from healthcare_news_scraper.article_index import ArticleIndex
+from healthcare_news_scraper.filters import article_matches_keyword, filter_articles_by_keyword
+from healthcare_news_scraper.formatters import get_articles_category_views
+
+ARTICLES = [
+    {"title": "New Research on Cancer Treatment", "category": "research"},
+    {"title": "Cholera vaccine rollout in Yemen", "category": "outbreak"},
+    {"title": "Vaccination policy update", "category": "policy"},
+    {"title": "COVID-19 vaccine research results", "category": "research"},
+    {"title": "World Health Assembly closes", "category": "general"},
+]
+
+
+@pytest.fixture
+def index():
+    return ArticleIndex(ARTICLES)
+
+
+def _titles(articles):
+    return [article["title"] for article in articles]
+
+
+def test_boolean_queries_combine_terms(index):
+    assert _titles(index.search("vaccine research")) == ["COVID-19 vaccine research results"]
+    assert _titles(index.search("cholera OR cancer")) == ["New Research on Cancer Treatment", "Cholera vaccine rollout in Yemen"]
+    assert _titles(index.search("vaccine AND NOT covid")) == ["Cholera vaccine rollout in Yemen"]
+    assert _titles(index.search("vaccin* -category:outbreak")) == [
+        "Vaccination policy update",
+        "COVID-19 vaccine research results",
+    ]
+    assert _titles(index.search("(cholera OR cancer) research")) == ["New Research on Cancer Treatment"]
+
+
+def test_phrases_fields_and_category_facets(index):
+    assert _titles(index.search('"vaccine research"')) == ["COVID-19 vaccine research results"]
+    assert _titles(index.search("covid-19")) == ["COVID-19 vaccine research results"]
+    assert _titles(index.search("title:research")) == ["New Research on Cancer Treatment", "COVID-19 vaccine research results"]
+    assert _titles(index.search("research", categories=["research"], limit=1)) == ["New Research on Cancer Treatment"]
+    assert _titles(index.search("", categories=["policy", "general"])) == [
+        "Vaccination policy update",
+        "World Health Assembly closes",
+    ]
+    assert index.facet_counts("vaccin*") == {"outbreak": 1, "policy": 1, "research": 1}
+    assert index.facet_counts()["research"] == 2
+
+
+@pytest.mark.parametrize("query", ["vaccine AND", "(cholera", "OR cancer", "cholera )", 'title:""'])
+def test_malformed_queries_raise_value_error(index, query):
+    with pytest.raises(ValueError):
+        index.search(query)
+
+
+def test_substring_lookup_matches_linear_filter():
+    rng = random.Random(7)
+    words = ["cholera", "vaccine", "research", "policy", "covid-19", "mpox", "health", "outbreak", "update"]
+    articles = [
+        {"title": " ".join(rng.choice(words) for _ in range(4)).title(), "category": rng.choice(words[:4])}
+        for _ in range(300)
+    ]
+    index = ArticleIndex(articles)
+    for needle in ["search", "ID-1", "a va", "-", "health update", "Research", "nothing", "olera vacc"]:
+        expected = [article for article in articles if article_matches_keyword(article, needle)]
+        assert index.contains(needle) == expected
+        assert filter_articles_by_keyword(articles, needle, index=index) == expected
+
+
+def test_filter_without_index_keeps_linear_scan(monkeypatch):
+    def unexpected(*args, **kwargs):
+        raise AssertionError("filter built an index")
+
+    monkeypatch.setattr(ArticleIndex, "__init__", unexpected)
+    assert filter_articles_by_keyword(ARTICLES, "research") == [
+        article for article in ARTICLES if article_matches_keyword(article, "research")
+    ]
+
+
+def test_category_views_share_one_index():
+    views = get_articles_category_views(ARTICLES, ["research", "policy"])
+    assert set(views) == {"research", "policy"}
+    assert "Cancer Treatment" in views["research"]
+    assert "Cancer Treatment" not in views["policy"]
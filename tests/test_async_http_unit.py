@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from healthcare_news_scraper.cache import JsonFileCache
+from healthcare_news_scraper.exceptions import ResponseTooLargeError, ScraperNetworkError
+from healthcare_news_scraper.protocols import AsyncHttpClient
+
+pytest.importorskip("aiohttp")
+
+from healthcare_news_scraper.async_http import AiohttpHttpClient  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"<html>WHO news</html>"
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        return
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_aiohttp_client_satisfies_async_http_client_protocol():
+    assert isinstance(AiohttpHttpClient(), AsyncHttpClient)
+
+
+def test_aiohttp_client_fetches_text(base_url):
+    async def fetch():
+        async with AiohttpHttpClient() as client:
+            return await client.get(f"{base_url}/news", headers={}, timeout=5)
+
+    response = asyncio.run(fetch())
+    response.raise_for_status()
+    assert response.text == "<html>WHO news</html>"
+    assert response.not_modified is False
+
+
+def test_aiohttp_client_reports_not_modified_from_validator_cache(base_url, tmp_path):
+    cache = JsonFileCache(str(tmp_path / "validators.json"))
+
+    async def fetch_twice():
+        async with AiohttpHttpClient(validator_cache=cache) as client:
+            await client.get(f"{base_url}/news", headers={}, timeout=5)
+            return await client.get(f"{base_url}/news", headers={}, timeout=5)
+
+    response = asyncio.run(fetch_twice())
+    assert response.not_modified is True
+    assert response.text == "<html>WHO news</html>"
+
+
+def test_aiohttp_client_enforces_response_size_cap(base_url):
+    async def fetch():
+        async with AiohttpHttpClient(max_response_bytes=4) as client:
+            await client.get(f"{base_url}/news", headers={}, timeout=5)
+
+    with pytest.raises(ResponseTooLargeError):
+        asyncio.run(fetch())
+
+
+def test_aiohttp_client_http_error_raises_network_error(base_url):
+    async def fetch():
+        async with AiohttpHttpClient() as client:
+            return await client.get(f"{base_url}/missing", headers={}, timeout=5)
+
+    response = asyncio.run(fetch())
+    with pytest.raises(ScraperNetworkError):
+        response.raise_for_status()
@@ -0,0 +1,70 @@
+import json
+
+from healthcare_news_scraper.classifier import KeywordClassifier, KeywordRule
+from healthcare_news_scraper.scraper import HealthcareNewsScraper, default_date_detector
+
+
+def test_classifier_respects_word_boundaries():
+    classifier = KeywordClassifier.from_mapping({"outbreak": ["flu"]}, default="general")
+    assert classifier.classify("Seasonal flu update") == "outbreak"
+    assert classifier.classify("Influential report") == "general"
+
+
+def test_classifier_supports_prefix_wildcards():
+    classifier = KeywordClassifier.from_mapping({"public_health": ["vaccin*"]})
+    assert classifier.classify("New vaccination campaign") == "public_health"
+    assert classifier.classify("Vaccines delivered") == "public_health"
+
+
+def test_classifier_uses_priority_over_match_order():
+    classifier = KeywordClassifier(
+        [KeywordRule("public_health", ("health",), priority=5), KeywordRule("policy", ("policy",), priority=1)],
+        default="general",
+    )
+    assert classifier.classify("Health policy update") == "policy"
+    assert classifier.labels("Health policy update") == ["policy", "public_health"]
+
+
+def test_classifier_matches_overlapping_multi_word_keywords():
+    classifier = KeywordClassifier.from_mapping({"a": ["public"], "b": ["public health"]})
+    assert classifier.labels("public health news") == ["a", "b"]
+
+
+def test_classifier_keeps_higher_priority_rule_starting_inside_another_match():
+    classifier = KeywordClassifier(
+        [KeywordRule("emergency", ("health emergency",), priority=0), KeywordRule("generic", ("public health",), priority=5)],
+        default="general",
+    )
+    assert classifier.classify("public health emergency declared") == "emergency"
+    assert classifier.labels("public health emergency declared") == ["emergency", "generic"]
+    assert classifier.classify_many(["public health emergency declared"]) == ["emergency"]
+
+
+def test_classify_many_matches_individual_calls():
+    classifier = KeywordClassifier.from_mapping(
+        {"research": ["study"], "outbreak": ["outbreak*"]},
+        default="general",
+    )
+    texts = ["Cholera outbreaks reported", "", "New study published", "Budget report"]
+    assert classifier.classify_many(texts) == [classifier.classify(text) for text in texts]
+
+
+def test_classifier_loads_rules_from_file(tmp_path):
+    path = tmp_path / "categories.json"
+    path.write_text(json.dumps([{"label": "respiratory", "keywords": ["influenza", "rsv"], "priority": 0}]))
+    classifier = KeywordClassifier.from_file(str(path), default="general")
+    assert classifier.classify("RSV season begins") == "respiratory"
+
+
+def test_date_detector_ignores_tokens_inside_words():
+    detector = default_date_detector()
+    assert detector.matches("Thu Feb 06")
+    assert detector.matches("12 March 2026")
+    assert not detector.matches("Health market outlook")
+
+
+def test_scraper_accepts_custom_category_classifier():
+    classifier = KeywordClassifier.from_mapping({"respiratory": ["influenza"]}, default="general")
+    scraper = HealthcareNewsScraper(delay_seconds=0, category_classifier=classifier)
+    assert scraper._extract_category("Avian influenza update") == "respiratory"
+    assert scraper._extract_category("Clinical study") == "general"
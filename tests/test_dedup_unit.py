@@ -0,0 +1,126 @@
+import pytest
+
+from healthcare_news_scraper.config import PipelineConfig
+from healthcare_news_scraper.dedup import NearDuplicatePolicy, date_key, minhash_signature, similarity
+from healthcare_news_scraper.partitioned import open_store
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.store_helpers import persist
+
+POLICY = NearDuplicatePolicy(min_similarity=0.7)
+
+
+def _products(store):
+    with store._connect() as conn:
+        return [tuple(row) for row in conn.execute("SELECT name, url FROM products ORDER BY id")]
+
+
+WEBSITE = {
+    "title": "WHO reports rising cholera cases in Sudan and Chad",
+    "url": "https://www.who.int/news/item/cholera-sudan",
+    "date": "Tue Feb 17",
+    "category": "outbreak",
+}
+NEWSLETTER = {
+    "title": "WHO reports rising cholera cases across Sudan and Chad",
+    "url": "https://newsletter.who.int/p/cholera-sudan-chad",
+    "date": "Tue Feb 17",
+    "category": "outbreak",
+}
+UNRELATED = {
+    "title": "New guidance on hospital hand hygiene published",
+    "url": "https://www.who.int/news/item/hand-hygiene",
+    "category": "policy",
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "news.db"), near_duplicates=POLICY)
+    store.init_schema()
+    return store
+
+
+def test_signatures_estimate_title_similarity():
+    website = minhash_signature(WEBSITE["title"])
+    assert similarity(website, minhash_signature(NEWSLETTER["title"])) >= 0.7
+    assert similarity(website, minhash_signature(UNRELATED["title"])) < 0.3
+    assert minhash_signature("Cholera update", min_tokens=4) is None
+    assert date_key("Tue Feb 17") == date_key("17 February 2026") == date_key("2026-02-17") == "02-17"
+
+
+def test_variants_in_one_run_share_a_product(store):
+    persist(store, [WEBSITE, NEWSLETTER, UNRELATED])
+
+    assert _products(store) == [(WEBSITE["title"], WEBSITE["url"]), (UNRELATED["title"], UNRELATED["url"])]
+    assert store.count_rows("product_snapshots") == 2
+    assert store.count_rows("product_aliases") == 1
+
+
+def test_variants_across_runs_resolve_through_aliases(store):
+    persist(store, [WEBSITE])
+    persist(store, [NEWSLETTER])
+    persist(store, [NEWSLETTER, WEBSITE])
+
+    assert _products(store) == [(WEBSITE["title"], WEBSITE["url"])]
+    assert store.count_rows("product_snapshots") == 1
+    assert store.known_urls([NEWSLETTER["url"], "https://example.org/x"]) == {NEWSLETTER["url"]}
+
+
+def _briefing(day):
+    return {
+        "title": f"WHO Director-General's opening remarks at the media briefing - {day} March 2026",
+        "url": f"https://www.who.int/news-room/speeches/item/media-briefing-{day}-march-2026",
+        "date": f"{day} March 2026",
+    }
+
+
+def test_formulaic_titles_for_different_events_stay_separate(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "news.db"), near_duplicates=NearDuplicatePolicy(min_similarity=0.8))
+    store.init_schema()
+    persist(store, [_briefing(12)])
+    persist(store, [_briefing(19)])
+
+    assert similarity(minhash_signature(_briefing(12)["title"]), minhash_signature(_briefing(19)["title"])) >= 0.8
+    assert [url for _, url in _products(store)] == [_briefing(12)["url"], _briefing(19)["url"]]
+    assert store.count_rows("product_aliases") == 0
+
+
+def test_title_similarity_alone_does_not_merge(store):
+    undated = {key: value for key, value in NEWSLETTER.items() if key != "date"}
+    other_day = dict(NEWSLETTER, url="https://newsletter.who.int/p/cholera-chad", date="18 February 2026")
+    same_source = dict(NEWSLETTER, url="https://www.who.int/news/item/cholera-sudan-chad")
+    persist(store, [WEBSITE, undated])
+    persist(store, [other_day])
+    persist(store, [same_source])
+
+    assert len(_products(store)) == 4
+    assert store.count_rows("product_aliases") == 0
+
+
+def test_short_titles_are_never_merged(store):
+    persist(store, [{"title": "Cholera update", "url": "https://a"}, {"title": "Cholera update!", "url": "https://b"}])
+    assert len(_products(store)) == 2
+
+
+def test_existing_products_are_backfilled(tmp_path):
+    path = str(tmp_path / "news.db")
+    plain = SQLiteArticleStore(path)
+    plain.init_schema()
+    persist(plain, [WEBSITE])
+
+    store = SQLiteArticleStore(path, near_duplicates=POLICY)
+    store.init_schema()
+    assert store.count_rows("product_fingerprints") == 1
+    persist(store, [NEWSLETTER])
+    assert _products(store) == [(WEBSITE["title"], WEBSITE["url"])]
+
+
+def test_detection_is_disabled_by_default(tmp_path):
+    store = open_store(PipelineConfig(), str(tmp_path / "news.db"))
+    store.init_schema()
+    persist(store, [WEBSITE, NEWSLETTER])
+    assert len(_products(store)) == 2
+    store.close()
+
+    with pytest.raises(ValueError):
+        NearDuplicatePolicy(min_similarity=1.5)
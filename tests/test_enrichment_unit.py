@@ -0,0 +1,81 @@
+from healthcare_news_scraper.config import PipelineConfig
+from healthcare_news_scraper.enrichment import ArticleEnricher, parse_article_detail
+from healthcare_news_scraper.runner_once import run_once
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.http_doubles import RoutingHttpClient
+
+DETAIL_HTML = """
+<html>
+  <head>
+    <meta property="article:published_time" content="2026-02-17T09:00:00Z">
+    <meta name="keywords" content="Measles, Vaccination">
+  </head>
+  <body>
+    <nav><p>Menu</p></nav>
+    <article>
+      <p>First   paragraph.</p>
+      <p>Second paragraph.</p>
+      <div class="tags"><a href="/tags/measles">Measles</a><a href="/tags/africa">Africa</a></div>
+    </article>
+  </body>
+</html>
+"""
+
+
+def _article(article_id: str, date: str = "") -> dict:
+    return {
+        "title": f"Article {article_id}",
+        "date": date,
+        "category": "general",
+        "url": f"https://www.who.int/news/item/{article_id}",
+        "source": "healthcare_web",
+    }
+
+
+def test_parse_article_detail_extracts_date_body_and_tags():
+    detail = parse_article_detail(DETAIL_HTML)
+    assert detail["date"] == "2026-02-17T09:00:00Z"
+    assert detail["body"] == "First paragraph.\nSecond paragraph."
+    assert detail["tags"] == "Measles, Vaccination, Africa"
+
+
+def test_parse_article_detail_falls_back_to_time_tag():
+    detail = parse_article_detail("<main><time datetime='2026-02-18'>18 February</time><p>Text</p></main>")
+    assert detail["date"] == "2026-02-18"
+    assert detail["body"] == "Text"
+    assert detail["tags"] == ""
+
+
+def test_enricher_skips_known_urls_and_preserves_order():
+    client = RoutingHttpClient({"https://www.who.int/news/item/2": DETAIL_HTML})
+    enricher = ArticleEnricher(http_client=client, max_workers=2)
+    articles = [_article("1", date="Mon Feb 16"), _article("2")]
+
+    enriched = enricher.enrich(articles, skip_urls={"https://www.who.int/news/item/1"})
+
+    assert client.requested == ["https://www.who.int/news/item/2"]
+    assert enriched[0] == articles[0]
+    assert enriched[1]["date"] == "2026-02-17T09:00:00Z"
+    assert enriched[1]["body"].startswith("First paragraph.")
+
+
+def test_enricher_keeps_article_when_detail_fetch_fails():
+    enricher = ArticleEnricher(http_client=RoutingHttpClient({}))
+    articles = [_article("3", date="Tue Feb 17")]
+    assert enricher.enrich(articles) == articles
+
+
+def test_run_once_closes_the_enrichment_session(tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr("healthcare_news_scraper.http.SessionHttpClient.close", lambda self: closed.append(self))
+    monkeypatch.setattr(ArticleEnricher, "enrich", lambda self, articles, skip_urls: articles)
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+
+    summary = run_once(
+        config=PipelineConfig(db_path=str(tmp_path / "events.db"), enrich_articles=True),
+        scrape_func=lambda _cfg: [_article("1")],
+        store=store,
+    )
+
+    assert summary.status == "success"
+    assert len(closed) == 1
@@ -0,0 +1,58 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from healthcare_news_scraper.export import export_snapshots, open_output
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.store_helpers import make_articles, persist
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    persist(store, make_articles(0, 7))
+    persist(store, make_articles(5, 10, category="outbreak"))
+    return store
+
+
+def test_ndjson_export_streams_every_snapshot_across_batches(store):
+    stream = io.StringIO()
+
+    report = export_snapshots(store, stream, batch_size=3)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert report.rows == len(records) == 12
+    assert report.last_run_id == 2
+    assert [record["snapshot_id"] for record in records] == sorted(record["snapshot_id"] for record in records)
+    assert records[-1]["category"] == "outbreak"
+
+
+def test_csv_export_with_since_run_cursor(store):
+    stream = io.StringIO()
+
+    report = export_snapshots(store, stream, fmt="csv", since_run=1)
+
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert report.rows == 5
+    assert [row["name"] for row in rows] == [f"Article {index}" for index in range(5, 10)]
+    assert {row["run_id"] for row in rows} == {"2"}
+
+
+def test_since_date_cursor_and_unknown_format(store):
+    assert export_snapshots(store, io.StringIO(), since="2999-01-01").rows == 0
+    with pytest.raises(ValueError):
+        export_snapshots(store, io.StringIO(), fmt="xml")
+
+
+def test_gzip_output_round_trips(store, tmp_path):
+    path = tmp_path / "snapshots.ndjson.gz"
+
+    with open_output(str(path), compress=True) as stream:
+        export_snapshots(store, stream)
+
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        assert sum(1 for _ in handle) == 12
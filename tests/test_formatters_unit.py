@@ -0,0 +1,64 @@
+import io
+import json
+
+import pytest
+
+from healthcare_news_scraper.formatters import (
+    available_encoders,
+    get_articles_category_json,
+    json_encoder,
+    write_articles,
+    write_articles_category,
+)
+
+ARTICLES = [
+    {"title": "Santé mondiale: research update", "category": "research", "url": "https://www.who.int/a"},
+    {"title": "Policy brief", "category": "policy", "url": "https://www.who.int/b"},
+    {"title": "Vaccine \"trial\" results", "category": "research", "url": "https://www.who.int/c"},
+    {"title": "Nested", "category": "research", "tags": ["a", "b"], "extra": {}, "score": 1.5, "draft": False},
+]
+
+
+def _write(articles, fmt, encoder="json"):
+    stream = io.StringIO()
+    count = write_articles(iter(articles), stream, fmt, encoder=encoder)
+    return count, stream.getvalue()
+
+
+@pytest.mark.parametrize("encoder", available_encoders())
+def test_streaming_formats_round_trip(encoder):
+    count, compact = _write(ARTICLES, "json", encoder)
+    assert count == 4
+    assert json.loads(compact) == ARTICLES
+    assert "\n" not in compact and "Santé" in compact
+
+    _, ndjson = _write(ARTICLES, "ndjson", encoder)
+    assert [json.loads(line) for line in ndjson.splitlines()] == ARTICLES
+
+    _, pretty = _write(ARTICLES, "pretty", encoder)
+    assert pretty == json.dumps(ARTICLES, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize("fmt, expected", [("json", "[]"), ("pretty", "[]"), ("ndjson", "")])
+def test_empty_input_writes_valid_output(fmt, expected):
+    assert _write([], fmt) == (0, expected)
+
+
+def test_large_inputs_are_written_in_batches():
+    articles = ({"title": f"Article {index}", "category": "general"} for index in range(2000))
+    count, text = _write(articles, "json")
+    assert count == 2000
+    assert len(json.loads(text)) == 2000
+
+
+def test_category_writer_matches_string_formatter():
+    stream = io.StringIO()
+    assert write_articles_category(ARTICLES, stream, "research") == 3
+    assert stream.getvalue() == get_articles_category_json(ARTICLES, "research")
+
+
+def test_unknown_format_or_encoder_is_rejected():
+    with pytest.raises(ValueError):
+        write_articles(ARTICLES, io.StringIO(), "yaml")
+    with pytest.raises(ValueError):
+        json_encoder("simdjson")
@@ -0,0 +1,147 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from healthcare_news_scraper.cache import JsonFileCache
+from healthcare_news_scraper.exceptions import ResponseTooLargeError
+from healthcare_news_scraper.http import RequestsHttpClient, SessionHttpClient
+
+
+class _GzipHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b"<html>" + b"x" * 4096 + b"</html>"
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        payload = gzip.compress(self.body)
+        self.server.accept_encodings.append(self.headers.get("Accept-Encoding", ""))
+        self.server.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        if self.path != "/chunked":
+            self.send_header("Content-Length", str(len(payload)))
+        else:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        return
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GzipHandler)
+    server.accept_encodings = []
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _response(status_code: int, text: str = "", headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    response.url = "https://www.who.int/news"
+    return response
+
+
+def test_json_file_cache_persists_between_instances(tmp_path):
+    path = tmp_path / "cache.json"
+    with JsonFileCache(str(path)) as cache:
+        cache.set("key", {"value": 1})
+    assert JsonFileCache(str(path)).get("key") == {"value": 1}
+
+
+def test_json_file_cache_batches_writes_and_drops_oldest_entries(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = JsonFileCache(str(path), flush_every=3, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert not path.exists()
+
+    cache.set("c", 3)
+    assert JsonFileCache(str(path)).get("a") is None
+    assert (JsonFileCache(str(path)).get("b"), JsonFileCache(str(path)).get("c")) == (2, 3)
+
+    cache.set("b", 4)
+    cache.set("d", 5)
+    cache.close()
+    reloaded = JsonFileCache(str(path))
+    assert (reloaded.get("c"), reloaded.get("b"), reloaded.get("d")) == (None, 4, 5)
+    assert not (tmp_path / "cache.json.tmp").exists()
+
+
+def test_json_file_cache_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    assert JsonFileCache(str(path)).get("key") is None
+
+
+def test_client_sends_validators_and_reuses_body_on_304(tmp_path, monkeypatch):
+    cache = JsonFileCache(str(tmp_path / "validators.json"))
+    sent_headers = []
+    responses = [
+        _response(200, "<html>v1</html>", {"ETag": '"abc"', "Last-Modified": "Tue, 17 Feb 2026 00:00:00 GMT"}),
+        _response(304),
+    ]
+
+    def fake_get(url, headers, timeout):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr("healthcare_news_scraper.http.requests.get", fake_get)
+    client = RequestsHttpClient(validator_cache=cache)
+
+    first = client.get("https://www.who.int/news", headers={}, timeout=5)
+    second = client.get("https://www.who.int/news", headers={}, timeout=5)
+
+    assert first.not_modified is False
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"abc"'
+    assert sent_headers[1]["If-Modified-Since"] == "Tue, 17 Feb 2026 00:00:00 GMT"
+    assert second.not_modified is True
+    assert second.text == "<html>v1</html>"
+
+
+def test_client_without_cache_never_reports_not_modified(monkeypatch):
+    monkeypatch.setattr(
+        "healthcare_news_scraper.http.requests.get",
+        lambda url, headers, timeout: _response(200, "ok", {"ETag": '"abc"'}),
+    )
+    response = RequestsHttpClient().get("https://www.who.int/news", headers={}, timeout=5)
+    assert response.not_modified is False
+    assert response.text == "ok"
+
+
+def test_session_client_negotiates_gzip_and_reuses_connection(stub_server):
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/news"
+    with SessionHttpClient() as client:
+        first = client.get(url, headers={}, timeout=5)
+        second = client.get(url, headers={}, timeout=5)
+
+    assert first.text == _GzipHandler.body.decode()
+    assert second.text == first.text
+    assert stub_server.accept_encodings == ["gzip, deflate", "gzip, deflate"]
+    assert len(stub_server.connections) == 1
+
+
+def test_session_client_rejects_declared_oversized_response(stub_server):
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/news"
+    with SessionHttpClient(max_response_bytes=16) as client:
+        with pytest.raises(ResponseTooLargeError):
+            client.get(url, headers={}, timeout=5)
+
+
+def test_session_client_rejects_oversized_decoded_stream(stub_server):
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/chunked"
+    with SessionHttpClient(max_response_bytes=1024) as client:
+        with pytest.raises(ResponseTooLargeError):
+            client.get(url, headers={}, timeout=5)
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from healthcare_news_scraper.newsletter_parser import parse_newsletter_html
+from healthcare_news_scraper.parsing import HTML_PARSER, available_backends, resolve_backend
+from healthcare_news_scraper.scraper import HealthcareNewsScraper
+
+BACKEND_VARIANTS = [(backend, strainer) for backend in available_backends() for strainer in (False, True)]
+
+NESTED_LISTING = """
+<html><body>
+  <nav><a href="/news?page=2">2</a></nav>
+  <ul>
+    <li><span>Mon Jan 6</span> <a href="/news/item/1">Outbreak response study</a></li>
+    <li><div><a href="/news/item/2">Policy briefing</a></div> research</li>
+  </ul>
+  <p><a href="/news/item/3">Bare anchor</a></p>
+</body></html>
+"""
+
+
+def test_resolve_backend_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        resolve_backend("html5lib")
+
+
+def test_resolve_backend_auto_picks_an_available_backend():
+    assert resolve_backend("auto") in available_backends()
+    assert HTML_PARSER in available_backends()
+
+
+@pytest.mark.parametrize("backend,strainer", BACKEND_VARIANTS)
+def test_backends_match_reference_on_events_fixture(backend, strainer):
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    reference = HealthcareNewsScraper(delay_seconds=0).parse_articles(html)
+    scraper = HealthcareNewsScraper(delay_seconds=0, parser_backend=backend, use_strainer=strainer)
+    assert scraper.parse_articles(html) == reference
+
+
+@pytest.mark.parametrize("backend,strainer", BACKEND_VARIANTS)
+def test_backends_match_reference_on_nested_listing(backend, strainer):
+    reference = HealthcareNewsScraper(delay_seconds=0, max_pages=3)
+    scraper = HealthcareNewsScraper(delay_seconds=0, max_pages=3, parser_backend=backend, use_strainer=strainer)
+    assert scraper.parse_articles(NESTED_LISTING) == reference.parse_articles(NESTED_LISTING)
+    assert scraper.discover_page_urls(NESTED_LISTING) == reference.discover_page_urls(NESTED_LISTING)
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_newsletter_backends_match_reference(backend):
+    html = Path("tests/fixtures/sample_newsletter.html").read_text()
+    assert parse_newsletter_html(html, parser_backend=backend) == parse_newsletter_html(html)
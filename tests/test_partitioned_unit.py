@@ -0,0 +1,150 @@
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from healthcare_news_scraper.config import PipelineConfig
+from healthcare_news_scraper.partitioned import PartitionedArticleStore, month_of_id, open_store
+from healthcare_news_scraper.protocols import ArticleStore, StreamingArticleStore
+from healthcare_news_scraper.retention import RetentionPolicy, apply_retention
+from healthcare_news_scraper.storage import SQLiteArticleStore, SQLiteTuning
+from tests.store_helpers import make_article, persist
+
+
+class SteppingClock:
+    def __init__(self):
+        self.now = datetime(2026, 1, 15, tzinfo=timezone.utc)
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return SteppingClock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    store = PartitionedArticleStore(str(tmp_path / "partitions"), clock=clock, tuning=SQLiteTuning(journal_mode="wal"))
+    store.init_schema()
+    return store
+
+
+def _three_months(store, clock):
+    runs = []
+    for month, articles in ((1, [make_article(1), make_article(2)]), (2, [make_article(1), make_article(3, "outbreak")]), (3, [make_article(3, "outbreak")])):
+        clock.now = datetime(2026, month, 15, tzinfo=timezone.utc)
+        runs.append(persist(store, articles, clock.now.isoformat()))
+    return runs
+
+
+def test_partitioned_store_satisfies_store_protocols(store):
+    assert isinstance(store, ArticleStore)
+    assert isinstance(store, StreamingArticleStore)
+
+
+def test_runs_and_snapshots_land_in_monthly_files_with_hot_catalog(store, clock, tmp_path):
+    runs = _three_months(store, clock)
+
+    assert store.partitions() == ["2026-01", "2026-02", "2026-03"]
+    assert [month_of_id(run.run_id) for run in runs] == ["2026-01", "2026-02", "2026-03"]
+    assert store.count_rows("products") == 3
+    assert store.count_rows("runs") == 3
+    assert store.count_rows("product_snapshots") == 5
+    assert store.fetch_latest_run()["id"] == runs[-1].run_id
+    with sqlite3.connect(tmp_path / "partitions" / "catalog.db") as conn:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert "products" in tables and "runs" not in tables and "product_snapshots" not in tables
+
+
+def test_old_months_are_sealed_into_single_files(store, clock, tmp_path):
+    _three_months(store, clock)
+
+    with sqlite3.connect(tmp_path / "partitions" / "runs-2026-03.db") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    for month in ("2026-01", "2026-02"):
+        assert not (tmp_path / "partitions" / f"runs-{month}.db-wal").exists()
+        with sqlite3.connect(tmp_path / "partitions" / f"runs-{month}.db") as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+
+def test_range_queries_only_attach_overlapping_partitions(store, clock, monkeypatch):
+    _three_months(store, clock)
+    attached = []
+    original = PartitionedArticleStore._open_connection
+
+    def recording_open(self):
+        attached.append(getattr(self._scope, "month", None))
+        return original(self)
+
+    monkeypatch.setattr(PartitionedArticleStore, "_open_connection", recording_open)
+    page = store.snapshots_between("2026-03-01", "2026-04-01")
+
+    assert [row["name"] for row in page.rows] == ["Article 3"]
+    assert [month for month in attached if month] == ["2026-03"]
+
+
+def test_range_query_pages_across_partitions(store, clock):
+    _three_months(store, clock)
+
+    rows, cursor = [], None
+    while True:
+        page = store.snapshots_between("2026-01-01", newest_first=True, after=cursor, limit=2)
+        rows.extend(page.rows)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert [row["observed_at"][:7] for row in rows] == ["2026-03", "2026-02", "2026-02", "2026-01", "2026-01"]
+
+
+def test_catalog_reads_merge_snapshot_details_and_state_at_run(store, clock):
+    runs = _three_months(store, clock)
+
+    latest = store.latest_snapshots().rows
+    assert [(row["name"], row["observed_at"][:7]) for row in latest] == [
+        ("Article 1", "2026-02"),
+        ("Article 2", "2026-01"),
+        ("Article 3", "2026-03"),
+    ]
+    assert [row["name"] for row in store.new_since_run(runs[0].run_id).rows] == ["Article 3"]
+    assert [row["name"] for row in store.snapshots_at_run(runs[1].run_id)] == ["Article 1", "Article 3"]
+    assert sum(1 for _ in store.iter_snapshots(since_run=runs[0].run_id)) == 3
+
+
+def test_age_retention_drops_whole_partitions(store, clock):
+    _three_months(store, clock)
+
+    report = apply_retention(store, RetentionPolicy(max_age_days=40), now=clock.now)
+
+    assert report.partitions_dropped == 1
+    assert store.partitions() == ["2026-02", "2026-03"]
+    assert store.count_rows("runs") == 2
+    assert [(row["name"], row["observed_at"][:7]) for row in store.latest_snapshots().rows] == [
+        ("Article 1", "2026-02"),
+        ("Article 3", "2026-03"),
+    ]
+    assert [row["name"] for row in store.search("article")] == ["Article 1", "Article 3"]
+    assert [row["name"] for row in store.new_since_run(0).rows] == ["Article 3"]
+
+
+def test_runs_land_in_the_partition_of_their_fetch_time(store, clock):
+    clock.now = datetime(2026, 3, 15, tzinfo=timezone.utc)
+    persist(store, [make_article(1)], "2026-03-10T00:00:00+00:00")
+    backfilled = persist(store, [make_article(2)], "2025-11-02T08:00:00+00:00")
+
+    assert store.partitions() == ["2025-11", "2026-03"]
+    assert month_of_id(backfilled.run_id) == "2025-11"
+    assert [row["name"] for row in store.snapshots_at_run(backfilled.run_id)] == ["Article 2"]
+    assert [row["observed_at"] for row in store.snapshots_between("2025-11-01", "2025-12-01").rows] == [
+        "2025-11-02T08:00:00+00:00"
+    ]
+
+
+def test_open_store_prefers_partition_dir_unless_db_path_given(tmp_path):
+    config = PipelineConfig(db_path=str(tmp_path / "single.db"), db_partition_dir=str(tmp_path / "parts"))
+
+    assert isinstance(open_store(config), PartitionedArticleStore)
+    single = open_store(config, str(tmp_path / "other.db"))
+    assert type(single) is SQLiteArticleStore
@@ -1,7 +1,7 @@
 from typing import Dict, Iterable, List
 
 from healthcare_news_scraper.http import RequestsHttpClient
-from healthcare_news_scraper.protocols import ArticleScraper, ArticleStore, HttpClient
+from healthcare_news_scraper.protocols import ArticleScraper, ArticleStore, AsyncArticleScraper, HttpClient
 from healthcare_news_scraper.runner_once import run_once
 from healthcare_news_scraper.scraper import HealthcareNewsScraper
 from healthcare_news_scraper.storage import SQLiteArticleStore
@@ -90,3 +90,7 @@ def test_run_once_accepts_stub_scraper(tmp_path):
 
     summary = run_once(config=cfg, scrape_func=lambda _cfg: scraper.get_events(), store=store)
     assert summary.fetched_count == 1
+
+
+def test_healthcare_news_scraper_satisfies_async_scraper_protocol():
+    assert isinstance(HealthcareNewsScraper(delay_seconds=0), AsyncArticleScraper)
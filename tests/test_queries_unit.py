@@ -0,0 +1,123 @@
+import sqlite3
+
+import pytest
+
+from healthcare_news_scraper.queries import (
+    decode_cursor,
+    encode_cursor,
+    latest_snapshots_query,
+    new_since_run_query,
+    snapshot_export_query,
+    snapshots_between_query,
+)
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.store_helpers import make_articles, persist
+
+
+def _collect(fetch):
+    rows, cursor, pages = [], None, 0
+    while True:
+        page = fetch(cursor)
+        rows.extend(page.rows)
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            return rows, pages
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    return store
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor(["2026-02-17T00:00:00+00:00", 42]), 2) == ["2026-02-17T00:00:00+00:00", 42]
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", 2)
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor([1]), 2)
+
+
+def test_latest_snapshots_pages_through_every_product(store):
+    persist(store, make_articles(0, 25))
+    persist(store, make_articles(0, 25, category="outbreak"))
+
+    rows, pages = _collect(lambda cursor: store.latest_snapshots(after=cursor, limit=10))
+
+    assert pages == 3
+    assert [row["product_id"] for row in rows] == list(range(1, 26))
+    assert {row["category"] for row in rows} == {"outbreak"}
+
+
+def test_snapshots_between_filters_category_and_orders_newest_first(store):
+    persist(store, make_articles(0, 5) + make_articles(5, 12, category="outbreak"))
+
+    rows, pages = _collect(
+        lambda cursor: store.snapshots_between("2000-01-01", "2999-01-01", category="outbreak", newest_first=True, after=cursor, limit=3)
+    )
+
+    assert pages == 3
+    assert [row["name"] for row in rows] == [f"Article {index}" for index in range(11, 4, -1)]
+    assert store.snapshots_between("2999-01-01").rows == []
+
+
+def test_new_since_run_returns_only_products_first_seen_later(store):
+    first = persist(store, make_articles(0, 5))
+    persist(store, make_articles(0, 8))
+    persist(store, make_articles(3, 12))
+
+    rows, _ = _collect(lambda cursor: store.new_since_run(first.run_id, after=cursor, limit=2))
+
+    assert [row["name"] for row in rows] == [f"Article {index}" for index in range(5, 12)]
+    assert [row["first_seen_run_id"] for row in rows] == [2, 2, 2, 3, 3, 3, 3]
+
+
+def test_init_schema_backfills_read_columns_for_existing_database(store, tmp_path):
+    persist(store, make_articles(0, 3))
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        conn.execute("UPDATE products SET first_seen_run_id = NULL, last_snapshot_id = NULL")
+
+    store.init_schema()
+
+    assert [row["first_seen_run_id"] for row in store.new_since_run(0).rows] == [1, 1, 1]
+    assert len(store.latest_snapshots().rows) == 3
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        latest_snapshots_query(),
+        latest_snapshots_query(after=encode_cursor([10])),
+        snapshots_between_query("2026-01-01"),
+        snapshots_between_query("2026-01-01", "2026-02-01", category="outbreak"),
+        snapshots_between_query("2026-01-01", category="outbreak", after=encode_cursor(["2026-01-05", 7])),
+        snapshots_between_query("2026-01-01", newest_first=True, after=encode_cursor(["2026-01-05", 7])),
+        new_since_run_query(3),
+        new_since_run_query(3, after=encode_cursor([4, 100])),
+    ],
+)
+def test_read_queries_use_indexes_instead_of_scans(store, tmp_path, query):
+    for run in range(3):
+        persist(store, make_articles(run * 50, run * 50 + 200, category=["general", "outbreak"][run % 2]))
+    sql, params = query
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        conn.execute("ANALYZE")
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+    assert not [step for step in plan if step.startswith("SCAN") or "TEMP B-TREE" in step], plan
+
+
+def test_incremental_export_seeks_to_the_first_new_snapshot(store, tmp_path):
+    for run in range(3):
+        persist(store, make_articles(run * 50, run * 50 + 200))
+    sql, params = snapshot_export_query(since_run=2)
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        first = conn.execute("SELECT MIN(id) FROM product_snapshots WHERE run_id > 2").fetchone()[0]
+        rows = conn.execute(sql, params).fetchall()
+
+    assert any("idx_snapshots_run_id (run_id>?)" in step for step in plan), plan
+    assert rows[0][0] == first
+    assert {row[1] for row in rows} == {3}
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+from healthcare_news_scraper.ratelimit import HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_second=2.0, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_second=1.0, burst=1, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    clock.now = 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_limiter_tracks_hosts_independently():
+    limiter = HostRateLimiter(rate_per_second=1.0, burst=1, clock=FakeClock())
+
+    assert limiter.reserve("https://www.who.int/news") == 0.0
+    assert limiter.reserve("https://example.org/news") == 0.0
+    assert limiter.reserve("https://WWW.WHO.INT/news?page=2") == 1.0
+
+
+def test_limiter_from_zero_delay_is_unlimited():
+    limiter = HostRateLimiter.from_delay(0)
+    assert all(limiter.reserve("https://www.who.int/news") == 0.0 for _ in range(10))
+
+
+def test_first_request_does_not_wait(monkeypatch):
+    slept = []
+    monkeypatch.setattr(time, "sleep", slept.append)
+    limiter = HostRateLimiter.from_delay(1.5)
+
+    with limiter.acquire("https://www.who.int/news"):
+        pass
+
+    assert slept == []
+
+
+def test_acquire_limits_concurrent_requests_per_host():
+    limiter = HostRateLimiter(rate_per_second=0, max_concurrent=2)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def worker():
+        with limiter.acquire("https://www.who.int/news"):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) <= 2
+
+
+def test_acquire_async_limits_concurrent_requests_per_host():
+    limiter = HostRateLimiter(rate_per_second=0, max_concurrent=2)
+    state = {"active": 0, "peak": 0}
+
+    async def worker():
+        async with limiter.acquire_async("https://www.who.int/news"):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0)
+            state["active"] -= 1
+
+    async def main():
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+    asyncio.run(main())
+    asyncio.run(main())
+    assert state["peak"] == 2
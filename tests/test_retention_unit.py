@@ -0,0 +1,142 @@
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from healthcare_news_scraper.config import PipelineConfig
+from healthcare_news_scraper.retention import RetentionPolicy, apply_retention, enable_incremental_vacuum, incremental_vacuum
+from healthcare_news_scraper.runner_once import run_once
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.store_helpers import make_article, persist
+
+
+def _store(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    return store
+
+
+def test_disabled_policy_keeps_everything(tmp_path):
+    store = _store(tmp_path)
+    persist(store, [make_article(1)], "2026-01-01T00:00:00+00:00")
+
+    assert apply_retention(store, RetentionPolicy()).runs_deleted == 0
+    assert store.count_rows("runs") == 1
+
+
+def test_count_policy_rolls_up_dead_snapshots_and_rebases_live_ones(tmp_path):
+    store = _store(tmp_path)
+    persist(store, [make_article(index) for index in range(10)], "2026-01-01T00:00:00+00:00")
+    persist(store, [make_article(index) for index in range(5)], "2026-01-02T00:00:00+00:00")
+    latest = persist(store, [make_article(index) for index in range(3)], "2026-01-03T00:00:00+00:00")
+
+    report = apply_retention(store, RetentionPolicy(max_runs=1, batch_size=2))
+
+    assert (report.runs_deleted, report.snapshots_deleted, report.snapshots_rebased) == (2, 7, 3)
+    assert store.count_rows("runs") == 1
+    assert [row["name"] for row in store.snapshots_at_run(latest.run_id)] == ["Article 0", "Article 1", "Article 2"]
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        assert conn.execute("SELECT day, category, snapshots FROM snapshot_rollups").fetchall() == [("2026-01-01", "general", 7)]
+        assert conn.execute("SELECT day, runs, fetched FROM run_rollups ORDER BY day").fetchall() == [
+            ("2026-01-01", 1, 10),
+            ("2026-01-02", 1, 5),
+        ]
+
+
+def test_age_policy_always_keeps_latest_run_and_reclaims_pages(tmp_path):
+    store = _store(tmp_path)
+    for day in range(1, 4):
+        persist(store, [make_article(day * 1000 + index) for index in range(300)], f"2026-01-0{day}T00:00:00+00:00")
+
+    report = apply_retention(
+        store,
+        RetentionPolicy(max_age_days=30, batch_size=100),
+        now=datetime(2026, 6, 1, tzinfo=timezone.utc),
+    )
+
+    assert report.runs_deleted == 2
+    assert report.pages_vacuumed > 0
+    assert store.count_rows("product_snapshots") == 300
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_age_policy_expires_backfilled_runs_by_fetch_time(tmp_path):
+    store = _store(tmp_path)
+    persist(store, [make_article(index) for index in range(3)], "2026-05-20T00:00:00+00:00")
+    persist(store, [make_article(index) for index in range(5)], "2025-11-02T00:00:00+00:00")
+    latest = persist(store, [make_article(index) for index in range(2)], "2026-05-31T00:00:00+00:00")
+
+    report = apply_retention(store, RetentionPolicy(max_age_days=30), now=datetime(2026, 6, 1, tzinfo=timezone.utc))
+
+    assert report.runs_deleted == 1
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        assert [row[0][:7] for row in conn.execute("SELECT fetched_at FROM runs")] == ["2026-05", "2026-05"]
+    assert [row["name"] for row in store.snapshots_at_run(latest.run_id)] == ["Article 0", "Article 1"]
+    assert store.count_rows("product_snapshots") == 3
+
+
+class FakeVacuumStore:
+    def __init__(self, stuck=False, refill=0):
+        self.free_pages = 8
+        self.stuck = stuck
+        self.refill = refill
+        self.steps = 0
+
+    @contextmanager
+    def transaction(self):
+        yield self
+        self.free_pages += self.refill
+
+    def execute(self, sql):
+        if sql.startswith("PRAGMA incremental_vacuum("):
+            self.steps += 1
+            if not self.stuck:
+                self.free_pages -= int(sql[len("PRAGMA incremental_vacuum(") : -1])
+        return FakeCursor(2 if sql == "PRAGMA auto_vacuum" else self.free_pages)
+
+
+class FakeCursor:
+    def __init__(self, value):
+        self.value = value
+
+    def fetchone(self):
+        return (self.value,)
+
+    def fetchall(self):
+        return [(self.value,)]
+
+
+def test_incremental_vacuum_stops_when_a_step_reclaims_nothing():
+    store = FakeVacuumStore(stuck=True)
+    assert incremental_vacuum(store, step_pages=2) == 0
+    assert store.steps == 1
+
+
+def test_incremental_vacuum_stops_at_its_page_budget_while_pages_keep_freeing():
+    store = FakeVacuumStore(refill=2)
+    assert incremental_vacuum(store, step_pages=2) == 8
+    assert store.steps == 4
+
+
+def test_enable_incremental_vacuum_converts_existing_database(tmp_path):
+    db_path = tmp_path / "events.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE legacy (id INTEGER PRIMARY KEY)")
+    store = _store(tmp_path)
+
+    assert enable_incremental_vacuum(store) is True
+    assert enable_incremental_vacuum(store) is False
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_run_once_applies_retention_to_default_store(tmp_path):
+    config = PipelineConfig(db_path=str(tmp_path / "events.db"), retention_max_runs=2, retry_attempts=1)
+
+    for _ in range(4):
+        run_once(config=config, scrape_func=lambda _config: [make_article(1)])
+
+    store = SQLiteArticleStore(config.db_path)
+    assert store.count_rows("runs") == 2
+    assert store.count_rows("product_snapshots") == 1
@@ -92,3 +92,77 @@ def test_partial_status_when_some_data_and_error(tmp_path):
     assert summary.status == "partial"
     assert summary.fetched_count == 1
     assert "upstream parse warning" in summary.error
+
+
+def test_run_once_streams_chunks_and_records_partial_run(tmp_path):
+    db_path = tmp_path / "events.db"
+    store = SQLiteArticleStore(str(db_path))
+
+    def streaming_scrape(_config):
+        for index in range(5):
+            yield {"title": f"Article {index}", "url": f"https://www.who.int/news/item/{index}", "category": "general", "date": ""}
+        raise ScraperNetworkError("connection reset")
+
+    summary = run_once(
+        config=PipelineConfig(db_path=str(db_path), persist_chunk_size=2),
+        scrape_func=streaming_scrape,
+        store=store,
+    )
+
+    assert summary.status == "partial"
+    assert summary.fetched_count == 5
+    assert summary.error == "connection reset"
+    assert store.count_rows("product_snapshots") == 5
+
+
+def test_streaming_run_retries_a_transient_first_page_failure(tmp_path, monkeypatch):
+    db_path = tmp_path / "events.db"
+    store = SQLiteArticleStore(str(db_path))
+
+    calls = {"count": 0}
+
+    def streaming_scrape(_config):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise ScraperNetworkError("temporary timeout")
+        for index in range(3):
+            yield {"title": f"Article {index}", "url": f"https://www.who.int/news/item/{index}", "category": "general", "date": ""}
+
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+
+    summary = run_once(
+        config=PipelineConfig(db_path=str(db_path), persist_chunk_size=2, retry_attempts=3, retry_backoff_seconds=0.01),
+        scrape_func=streaming_scrape,
+        store=store,
+    )
+
+    assert calls["count"] == 2
+    assert summary.status == "success"
+    assert summary.attempts == 2
+    assert summary.fetched_count == 3
+
+
+def test_streaming_run_records_failure_after_exhausting_retries(tmp_path, monkeypatch):
+    db_path = tmp_path / "events.db"
+    store = SQLiteArticleStore(str(db_path))
+
+    def streaming_scrape(_config):
+        raise ScraperNetworkError("temporary timeout")
+        yield
+
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+
+    summary = run_once(
+        config=PipelineConfig(db_path=str(db_path), persist_chunk_size=2, retry_attempts=2, retry_backoff_seconds=0.01),
+        scrape_func=streaming_scrape,
+        store=store,
+    )
+
+    assert summary.status == "failure"
+    assert summary.attempts == 2
+    assert summary.error == "temporary timeout"
+
+
+def test_streaming_cannot_be_combined_with_the_async_engine():
+    with pytest.raises(ValueError, match="SCRAPER_ASYNC"):
+        PipelineConfig(scraper_async=True, persist_chunk_size=100)
@@ -1,11 +1,13 @@
+import asyncio
 from pathlib import Path
 
 import pytest
 from bs4 import BeautifulSoup
 
+from healthcare_news_scraper.cache import JsonFileCache
 from healthcare_news_scraper.exceptions import ScraperNetworkError, ScraperTimeoutError
 from healthcare_news_scraper.scraper import HealthcareNewsScraper
-from tests.http_doubles import FailingHttpClient, StubHttpClient, StubHttpResponse
+from tests.http_doubles import AsyncRoutingHttpClient, FailingHttpClient, RoutingHttpClient, StubHttpClient, StubHttpResponse
 
 
 def _first_tag(html: str):
@@ -100,6 +102,16 @@ def test_scraper_uses_injected_http_client():
     assert len(articles) == 2
 
 
+def test_close_releases_only_the_default_session(monkeypatch):
+    closed = []
+    monkeypatch.setattr("healthcare_news_scraper.http.SessionHttpClient.close", lambda self: closed.append(self))
+    with HealthcareNewsScraper(delay_seconds=0) as scraper:
+        default_client = scraper._http
+    with HealthcareNewsScraper(delay_seconds=0, http_client=StubHttpClient([])):
+        pass
+    assert closed == [default_client]
+
+
 def test_fetch_html_raises_scraper_network_error_on_connection_error():
     scraper = HealthcareNewsScraper(delay_seconds=0, http_client=FailingHttpClient())
     with pytest.raises(ScraperNetworkError):
@@ -120,3 +132,148 @@ def test_fetch_html_raises_scraper_network_error_on_http_error():
     scraper = HealthcareNewsScraper(delay_seconds=0, http_client=client)
     with pytest.raises(ScraperNetworkError):
         scraper.get_articles()
+
+
+def _listing_page(article_id: str, page_links: str = "") -> str:
+    return f"<div><a href='/news/item/{article_id}'>Article {article_id}</a></div>{page_links}"
+
+
+def test_discover_page_urls_respects_page_cap():
+    scraper = HealthcareNewsScraper(delay_seconds=0, max_pages=3)
+    html = _listing_page("1", "<a href='/news?page=2'>2</a><a href='/news?page=3'>3</a><a href='/news?page=4'>4</a>")
+    assert scraper.discover_page_urls(html) == [
+        "https://www.who.int/news?page=2",
+        "https://www.who.int/news?page=3",
+    ]
+
+
+def test_get_articles_crawls_discovered_pages():
+    links = "<a href='/news?page=2'>2</a><a href='/news?page=3'>3</a>"
+    client = RoutingHttpClient(
+        {
+            HealthcareNewsScraper.BASE_URL: _listing_page("1", links),
+            "https://www.who.int/news?page=2": _listing_page("2", links),
+            "https://www.who.int/news?page=3": _listing_page("1", links),
+        }
+    )
+    scraper = HealthcareNewsScraper(delay_seconds=0, http_client=client, max_pages=5, max_workers=2)
+
+    articles = scraper.get_articles()
+
+    assert sorted(client.requested) == sorted([
+        HealthcareNewsScraper.BASE_URL,
+        "https://www.who.int/news?page=2",
+        "https://www.who.int/news?page=3",
+    ])
+    assert [article["title"] for article in articles] == ["Article 1", "Article 2"]
+
+
+def test_sliding_pager_is_followed_up_to_the_page_cap():
+    first_window = "<a href='/news?page=2'>2</a><a href='/news?page=3'>3</a>"
+    second_window = "<a href='/news?page=2'>2</a><a href='/news?page=4'>4</a><a href='/news?page=5'>5</a>"
+    pages = {
+        HealthcareNewsScraper.BASE_URL: _listing_page("1", first_window),
+        "https://www.who.int/news?page=2": _listing_page("2", first_window),
+        "https://www.who.int/news?page=3": _listing_page("3", second_window),
+        "https://www.who.int/news?page=4": _listing_page("4", second_window),
+        "https://www.who.int/news?page=5": _listing_page("5", second_window),
+    }
+    client = RoutingHttpClient(pages)
+    scraper = HealthcareNewsScraper(delay_seconds=0, http_client=client, max_pages=4, max_workers=2)
+    async_scraper = HealthcareNewsScraper(delay_seconds=0, async_http_client=AsyncRoutingHttpClient(pages), max_pages=5)
+
+    assert [article["title"] for article in scraper.get_articles()] == ["Article 1", "Article 2", "Article 3", "Article 4"]
+    assert len(client.requested) == 4
+    assert [article["title"] for article in asyncio.run(async_scraper.get_articles_async())] == [
+        "Article 1",
+        "Article 2",
+        "Article 3",
+        "Article 4",
+        "Article 5",
+    ]
+
+
+def test_repeated_article_keeps_its_first_occurrence():
+    scraper = HealthcareNewsScraper(delay_seconds=0)
+    html = "<div><a href='/news/item/1'>Same</a> Disease outbreak news</div><div><a href='/news/item/1'>Same</a></div>"
+    assert [article["category"] for article in scraper.parse_articles(html)] == ["outbreak"]
+
+
+def test_failed_follow_up_page_keeps_the_other_pages():
+    links = "<a href='/news?page=2'>2</a><a href='/news?page=3'>3</a>"
+    pages = {
+        HealthcareNewsScraper.BASE_URL: _listing_page("1", links),
+        "https://www.who.int/news?page=3": _listing_page("3", links),
+    }
+    scraper = HealthcareNewsScraper(delay_seconds=0, http_client=RoutingHttpClient(pages), max_pages=5, max_workers=2)
+    async_scraper = HealthcareNewsScraper(delay_seconds=0, async_http_client=AsyncRoutingHttpClient(pages), max_pages=5)
+
+    assert [article["title"] for article in scraper.get_articles()] == ["Article 1", "Article 3"]
+    assert [article["title"] for article in asyncio.run(async_scraper.get_articles_async())] == ["Article 1", "Article 3"]
+
+
+def test_get_articles_single_page_by_default():
+    client = RoutingHttpClient({HealthcareNewsScraper.BASE_URL: _listing_page("1", "<a href='/news?page=2'>2</a>")})
+    scraper = HealthcareNewsScraper(delay_seconds=0, http_client=client)
+    scraper.get_articles()
+    assert client.requested == [HealthcareNewsScraper.BASE_URL]
+
+
+def test_get_articles_reuses_parsed_result_when_not_modified(tmp_path, monkeypatch):
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    cache = JsonFileCache(str(tmp_path / "parsed.json"))
+    client = StubHttpClient([StubHttpResponse(text=html), StubHttpResponse(text=html, not_modified=True)])
+    scraper = HealthcareNewsScraper(delay_seconds=0, http_client=client, parsed_cache=cache)
+
+    first = scraper.get_articles()
+    monkeypatch.setattr(scraper, "parse_articles", lambda _html: pytest.fail("page should not be re-parsed"))
+    second = scraper.get_articles()
+
+    assert second == first
+    assert client.calls == 2
+
+
+def test_get_articles_async_matches_sync_path():
+    links = "<a href='/news?page=2'>2</a><a href='/news?page=3'>3</a>"
+    pages = {
+        HealthcareNewsScraper.BASE_URL: _listing_page("1", links),
+        "https://www.who.int/news?page=2": _listing_page("2", links),
+        "https://www.who.int/news?page=3": _listing_page("3", links),
+    }
+    async_client = AsyncRoutingHttpClient(pages)
+    async_scraper = HealthcareNewsScraper(delay_seconds=0, async_http_client=async_client, max_pages=3, max_workers=1)
+    sync_scraper = HealthcareNewsScraper(delay_seconds=0, http_client=RoutingHttpClient(pages), max_pages=3)
+
+    articles = asyncio.run(async_scraper.get_articles_async())
+
+    assert articles == sync_scraper.get_articles()
+    assert async_client.max_in_flight == 1
+
+
+def test_get_articles_async_raises_on_http_error():
+    client = AsyncRoutingHttpClient({})
+    scraper = HealthcareNewsScraper(delay_seconds=0, async_http_client=client)
+    with pytest.raises(ScraperNetworkError):
+        asyncio.run(scraper.get_articles_async())
+
+
+def test_candidate_elements_visits_each_container_once():
+    scraper = HealthcareNewsScraper(delay_seconds=0)
+    soup = BeautifulSoup(
+        "<div><a href='/news/1'>One</a><a href='/news/2'>Two</a></div><li><a href='/news/3'>Three</a></li>",
+        "html.parser",
+    )
+    assert [element.name for element in scraper._candidate_elements(soup)] == ["div", "li"]
+
+
+def test_parse_articles_extracts_shared_container_once(monkeypatch):
+    scraper = HealthcareNewsScraper(delay_seconds=0)
+    calls = []
+    original = scraper._extract_article_from_element
+    monkeypatch.setattr(scraper, "_extract_article_from_element", lambda element: calls.append(element) or original(element))
+    links = "".join(f"<a href='/news/{index}'>Story {index}</a>" for index in range(50))
+
+    articles = scraper.parse_articles(f"<div>{links}</div>")
+
+    assert len(calls) == 1
+    assert [article["title"] for article in articles] == ["Story 0"]
@@ -0,0 +1,73 @@
+import sqlite3
+
+import pytest
+
+from healthcare_news_scraper.exceptions import StorageError
+from healthcare_news_scraper.search import match_expression
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from tests.store_helpers import persist
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    persist(
+        store,
+        [
+            {"title": "Cholera outbreak in Sudan", "url": "https://www.who.int/news/item/1", "category": "outbreak", "date": ""},
+            {"title": "Vaccine research update", "url": "https://www.who.int/news/item/2", "category": "research", "date": ""},
+            {
+                "title": "Policy brief",
+                "url": "https://www.who.int/news/item/3",
+                "category": "policy",
+                "date": "",
+                "body": "Guidance on cholera vaccine stockpiles for outbreak response.",
+            },
+        ],
+    )
+    return store
+
+
+def test_match_expression_quotes_terms_and_phrases():
+    assert match_expression("cholera vaccine") == '"cholera" AND "vaccine"'
+    assert match_expression("cholera vaccine", any_term=True) == '"cholera" OR "vaccine"'
+    assert match_expression('say "hi"', phrase=True) == '"say ""hi"""'
+    with pytest.raises(ValueError):
+        match_expression("   ")
+
+
+def test_search_ranks_title_matches_above_body_matches(store):
+    rows = store.search(match_expression("cholera"))
+
+    assert [row["name"] for row in rows] == ["Cholera outbreak in Sudan", "Policy brief"]
+    assert "[cholera]" in rows[1]["snippet"].lower()
+
+
+def test_search_supports_phrase_and_category_filters(store):
+    assert [row["name"] for row in store.search(match_expression("vaccine stockpiles", phrase=True))] == ["Policy brief"]
+    assert store.search(match_expression("stockpiles vaccine", phrase=True)) == []
+    assert [row["name"] for row in store.search(match_expression("vaccine"), category="research")] == ["Vaccine research update"]
+    assert store.search(match_expression("vaccine"), since="2999-01-01") == []
+
+
+def test_search_index_follows_changed_articles(store):
+    persist(store, [{"title": "Measles outbreak in Sudan", "url": "https://www.who.int/news/item/1", "category": "outbreak", "date": ""}])
+
+    assert [row["name"] for row in store.search(match_expression("cholera"))] == ["Policy brief"]
+    assert [row["product_id"] for row in store.search(match_expression("measles"))] == [1]
+
+
+def test_init_schema_rebuilds_index_for_existing_database(store, tmp_path):
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        conn.execute("DROP TABLE article_search")
+
+    reopened = SQLiteArticleStore(str(tmp_path / "events.db"))
+    reopened.init_schema()
+
+    assert len(reopened.search(match_expression("cholera"))) == 2
+
+
+def test_search_rejects_malformed_raw_query(store):
+    with pytest.raises(StorageError):
+        store.search('"unterminated')
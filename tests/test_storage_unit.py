@@ -1,4 +1,12 @@
-from healthcare_news_scraper.storage import SQLiteArticleStore
+import sqlite3
+
+import pytest
+
+from healthcare_news_scraper.exceptions import PartialPersistError, ScraperNetworkError
+from healthcare_news_scraper.partitioned import PartitionedArticleStore
+from healthcare_news_scraper.storage import SQLiteArticleStore, SQLiteTuning
+from healthcare_news_scraper.urls import UrlRules
+from tests.store_helpers import persist, run_fields
 
 
 def test_schema_creation(tmp_path):
@@ -78,7 +86,67 @@ def test_dedupe_upsert_by_url(tmp_path):
 
     assert store.count_rows("runs") == 2
     assert store.count_rows("products") == 1
-    assert store.count_rows("product_snapshots") == 2
+    assert store.count_rows("product_snapshots") == 1
+
+
+def test_changed_content_adds_snapshot_and_unchanged_extends_it(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    stable = {"title": "Stable", "url": "https://www.who.int/news/item/1", "category": "general", "date": ""}
+    moving = {"title": "Moving", "url": "https://www.who.int/news/item/2", "category": "general", "date": ""}
+
+    first = persist(store, [stable, moving])
+    second = persist(store, [stable, {**moving, "category": "outbreak"}])
+    third = persist(store, [stable, {**moving, "category": "outbreak"}])
+
+    assert store.count_rows("product_snapshots") == 3
+    states = {run.run_id: store.snapshots_at_run(run.run_id) for run in (first, second, third)}
+    assert [(row["name"], row["category"]) for row in states[first.run_id]] == [("Stable", "general"), ("Moving", "general")]
+    assert [(row["name"], row["category"]) for row in states[third.run_id]] == [("Stable", "general"), ("Moving", "outbreak")]
+    assert states[third.run_id][0]["first_seen_run_id"] == first.run_id
+
+
+def test_snapshots_at_run_respects_gaps_between_sightings(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    event = {"title": "Returning", "url": "https://www.who.int/news/item/1", "category": "general", "date": ""}
+    other = {"title": "Other", "url": "https://www.who.int/news/item/2", "category": "general", "date": ""}
+
+    first = persist(store, [event])
+    failed = persist(store, [], status="failure")
+    gap = persist(store, [other])
+    back = persist(store, [event])
+
+    assert [row["name"] for row in store.snapshots_at_run(first.run_id)] == ["Returning"]
+    assert store.snapshots_at_run(failed.run_id) == []
+    assert [row["name"] for row in store.snapshots_at_run(gap.run_id)] == ["Other"]
+    assert [row["name"] for row in store.snapshots_at_run(back.run_id)] == ["Returning"]
+    assert store.count_rows("product_snapshots") == 3
+
+
+def test_persist_runs_commits_several_runs_in_one_transaction(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    run = {
+        "source": "web",
+        "fetched_at": "2026-02-17T00:00:00+00:00",
+        "search_term": "",
+        "record_limit": 0,
+        "status": "success",
+        "attempts": 1,
+        "error": "",
+    }
+    article = {"title": "Shared", "url": "https://www.who.int/news/item/1", "category": "general", "date": ""}
+
+    records = store.persist_runs([{**run, "articles": [article]}, {**run, "articles": [article]}])
+
+    assert [record.run_id for record in records] == [1, 2]
+    assert store.count_rows("runs") == 2
+    assert store.count_rows("product_snapshots") == 1
+
+    with pytest.raises(TypeError):
+        store.persist_runs([{**run, "articles": [article]}, {**run, "unknown": True}])
+    assert store.count_rows("runs") == 2
 
 
 def test_failed_run_persistence(tmp_path):
@@ -104,3 +172,299 @@ def test_failed_run_persistence(tmp_path):
     assert latest["error"] == "timeout"
     assert latest["attempts"] == 3
     assert store.count_rows("product_snapshots") == 0
+
+
+def test_known_urls_returns_stored_subset(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    store.persist_run(
+        source="web",
+        fetched_at="2026-02-17T00:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        articles=[{"title": "Stored", "url": "https://www.who.int/news/item/001", "body": "Body text", "tags": "Measles"}],
+    )
+
+    known = store.known_urls(["https://www.who.int/news/item/001", "https://www.who.int/news/item/002"])
+
+    assert known == {"https://www.who.int/news/item/001"}
+
+
+def test_init_schema_adds_enrichment_columns_to_existing_database(tmp_path):
+    db_path = tmp_path / "events.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE products (id INTEGER PRIMARY KEY, canonical_key TEXT UNIQUE, name TEXT, url TEXT)")
+
+    SQLiteArticleStore(str(db_path)).init_schema()
+
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(products)")}
+    assert {"body", "tags"} <= columns
+
+
+def test_persist_run_batches_large_runs_with_duplicate_keys(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    articles = [
+        {"title": f"Article {index}", "url": f"https://www.who.int/news/item/{index % 1200}", "category": "general", "date": ""}
+        for index in range(1500)
+    ]
+
+    run = store.persist_run(
+        source="web",
+        fetched_at="2026-02-17T00:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        articles=articles,
+    )
+
+    assert run.fetched_count == 1500
+    assert store.count_rows("products") == 1200
+    assert store.count_rows("product_snapshots") == 1200
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        name = conn.execute("SELECT name FROM products WHERE url = ?", ("https://www.who.int/news/item/0",)).fetchone()[0]
+    assert name == "Article 1200"
+
+
+def test_persistent_store_reuses_connection_and_enables_wal(tmp_path):
+    tuning = SQLiteTuning(journal_mode="wal", synchronous="normal", cache_size_kib=4096)
+    store = SQLiteArticleStore(str(tmp_path / "events.db"), persistent=True, tuning=tuning)
+    store.init_schema()
+
+    with store._connect() as first, store._connect() as second:
+        assert first is second
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert first.execute("PRAGMA cache_size").fetchone()[0] == -4096
+        assert first.execute("PRAGMA synchronous").fetchone()[0] == 1
+    store.close()
+
+
+def test_wal_reader_sees_committed_data_while_writer_holds_transaction(tmp_path):
+    db_path = str(tmp_path / "events.db")
+    with SQLiteArticleStore(db_path, persistent=True, tuning=SQLiteTuning(journal_mode="wal")) as writer:
+        writer.init_schema()
+        writer.persist_run(
+            source="web",
+            fetched_at="2026-02-17T00:00:00+00:00",
+            search_term="",
+            record_limit=0,
+            status="success",
+            attempts=1,
+            error="",
+            articles=[],
+        )
+        with writer._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT INTO runs (source, fetched_at, status) VALUES ('web', 'later', 'success')")
+            reader = SQLiteArticleStore(db_path, tuning=SQLiteTuning(busy_timeout_ms=100))
+            assert reader.count_rows("runs") == 1
+
+
+def test_default_tuning_keeps_the_rollback_journal(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"), tuning=SQLiteTuning())
+    store.init_schema()
+
+    with store._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert not (tmp_path / "events.db-wal").exists()
+
+
+def test_tuning_rejects_unknown_pragma_values():
+    with pytest.raises(ValueError):
+        SQLiteTuning(journal_mode="wal; DROP TABLE runs")
+
+
+def _streamed_articles(count: int, fail_after: int = -1):
+    for index in range(count):
+        if index == fail_after:
+            raise ScraperNetworkError("connection dropped")
+        yield {"title": f"Article {index}", "url": f"https://www.who.int/news/item/{index}", "category": "general", "date": ""}
+
+
+def test_persist_run_streaming_commits_in_chunks(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+
+    run = store.persist_run_streaming(
+        source="web",
+        fetched_at="2026-02-17T00:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        articles=_streamed_articles(25),
+        chunk_size=10,
+    )
+
+    latest = store.fetch_latest_run()
+    assert run.fetched_count == 25
+    assert latest["status"] == "success"
+    assert latest["fetched_count"] == 25
+    assert store.count_rows("product_snapshots") == 25
+
+
+def test_persist_run_streaming_marks_interrupted_run_partial(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+
+    with pytest.raises(PartialPersistError) as excinfo:
+        store.persist_run_streaming(
+            source="web",
+            fetched_at="2026-02-17T00:00:00+00:00",
+            search_term="",
+            record_limit=0,
+            status="success",
+            attempts=1,
+            error="",
+            articles=_streamed_articles(25, fail_after=15),
+            chunk_size=10,
+        )
+
+    latest = store.fetch_latest_run()
+    assert excinfo.value.run_record.status == "partial"
+    assert latest["status"] == "partial"
+    assert latest["fetched_count"] == 15
+    assert latest["error"] == "connection dropped"
+    assert store.count_rows("product_snapshots") == 15
+
+
+def _persist_articles(store, articles):
+    return store.persist_runs([run_fields(articles)])[0]
+
+
+def test_url_noise_maps_to_one_canonical_product(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    variants = [
+        "https://www.who.int/news/item/001",
+        "http://www.who.int/news/item/001/",
+        "https://WWW.WHO.INT/news/item/001?utm_source=newsletter&utm_medium=email",
+        "https://www.who.int/news/item/001#top",
+    ]
+
+    for url in variants:
+        _persist_articles(store, [{"title": "Measles update", "url": url, "category": "outbreak", "date": ""}])
+
+    assert store.count_rows("products") == 1
+    assert store.count_rows("product_snapshots") == 1
+    assert store.known_urls(variants + ["https://www.who.int/news/item/002"]) == set(variants)
+    with store._connect() as conn:
+        assert conn.execute("SELECT url FROM products").fetchone()[0] == variants[0]
+
+
+def test_repeat_run_skips_product_writes_with_warm_cache(tmp_path):
+    db_path = str(tmp_path / "events.db")
+    articles = [{"title": f"Article {index}", "url": f"https://www.who.int/news/item/{index}"} for index in range(20)]
+    with SQLiteArticleStore(db_path, persistent=True) as store:
+        store.init_schema()
+        _persist_articles(store, articles)
+
+    with SQLiteArticleStore(db_path, persistent=True, product_cache_size=50) as store:
+        store.init_schema()
+        assert len(store.product_ids) == 20
+        statements = []
+        with store._connect() as conn:
+            conn.set_trace_callback(statements.append)
+        _persist_articles(store, articles + [{"title": "New", "url": "https://www.who.int/news/item/new"}])
+        _persist_articles(store, articles)
+
+    product_writes = [sql for sql in statements if "INSERT INTO products" in sql]
+    assert len(product_writes) == 1
+    assert store.count_rows("products") == 21
+
+
+def test_warm_cache_covers_runs_that_skip_enrichment(tmp_path):
+    db_path = str(tmp_path / "events.db")
+    enriched = [
+        {"title": f"Article {index}", "url": f"https://www.who.int/news/item/{index}", "body": "Full text", "tags": "who"}
+        for index in range(5)
+    ]
+    with SQLiteArticleStore(db_path, persistent=True) as store:
+        store.init_schema()
+        _persist_articles(store, enriched)
+
+    with SQLiteArticleStore(db_path, persistent=True) as store:
+        store.init_schema()
+        statements = []
+        with store._connect() as conn:
+            conn.set_trace_callback(statements.append)
+        _persist_articles(store, [{"title": article["title"], "url": article["url"]} for article in enriched])
+        _persist_articles(store, [dict(enriched[0], body="Revised text")])
+        with store._connect() as conn:
+            bodies = [row[0] for row in conn.execute("SELECT body FROM products ORDER BY id")]
+
+    assert len([sql for sql in statements if "INSERT INTO products" in sql]) == 1
+    assert bodies == ["Revised text"] + ["Full text"] * 4
+
+
+def test_product_cache_is_bounded_and_ignores_rolled_back_runs(tmp_path):
+    store = SQLiteArticleStore(str(tmp_path / "events.db"), product_cache_size=2)
+    store.init_schema()
+    _persist_articles(store, [{"title": f"Article {index}", "url": f"https://www.who.int/{index}"} for index in range(3)])
+    assert len(store.product_ids) == 2
+
+    new_article = {"title": "Rolled back", "url": "https://www.who.int/rolled-back"}
+    with pytest.raises(sqlite3.IntegrityError):
+        store.persist_runs([run_fields([new_article]), run_fields([], status="bogus")])
+    assert store.product_ids.lookup({"url:https://www.who.int/rolled-back": (hash("Rolled back"), None, None, None)}) == {}
+
+    _persist_articles(store, [new_article])
+    assert store.count_rows("products") == 4
+
+
+def test_init_schema_rekeys_products_when_url_rules_change(tmp_path):
+    db_path = str(tmp_path / "events.db")
+    raw = SQLiteArticleStore(db_path, url_rules=UrlRules(enabled=False))
+    raw.init_schema()
+    _persist_articles(
+        raw,
+        [
+            {"title": "Tracked", "url": "https://www.who.int/news/item/001?utm_source=x"},
+            {"title": "Slash", "url": "https://www.who.int/news/item/002/"},
+            {"title": "Clean", "url": "https://www.who.int/news/item/002"},
+        ],
+    )
+
+    store = SQLiteArticleStore(db_path)
+    store.init_schema()
+    _persist_articles(store, [{"title": "Tracked", "url": "https://www.who.int/news/item/001"}])
+
+    with store._connect() as conn:
+        keys = [row[0] for row in conn.execute("SELECT canonical_key FROM products ORDER BY id")]
+    assert keys == [
+        "url:https://www.who.int/news/item/001",
+        "url:https://www.who.int/news/item/002",
+    ]
+    assert store.count_rows("product_snapshots") == 2
+
+
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_rekey_collision_merges_history_into_the_surviving_product(tmp_path, partitioned):
+    def open_store(url_rules=None):
+        if partitioned:
+            return PartitionedArticleStore(str(tmp_path / "partitions"), url_rules=url_rules)
+        return SQLiteArticleStore(str(tmp_path / "events.db"), url_rules=url_rules)
+
+    raw = open_store(UrlRules(enabled=False))
+    raw.init_schema()
+    persist(raw, [{"title": "First", "url": "https://www.who.int/news/item/002"}], "2026-02-17T00:00:00+00:00")
+    persist(raw, [{"title": "Second", "url": "https://www.who.int/news/item/002/"}], "2026-02-18T00:00:00+00:00")
+
+    store = open_store()
+    store.init_schema()
+    assert store.count_rows("products") == 1
+    assert store.count_rows("product_snapshots") == 2
+
+    persist(store, [{"title": "Second", "url": "https://www.who.int/news/item/002"}], "2026-02-19T00:00:00+00:00")
+    assert store.count_rows("products") == 1
+    assert store.count_rows("product_snapshots") == 2
+
+    persist(store, [{"title": "First", "url": "https://www.who.int/news/item/002"}], "2026-02-20T00:00:00+00:00")
+    assert store.count_rows("product_snapshots") == 3
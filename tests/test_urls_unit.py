@@ -0,0 +1,37 @@
+import pytest
+
+from healthcare_news_scraper.config import PipelineConfig
+from healthcare_news_scraper.urls import UrlRules
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("https://www.who.int/news/item/001", "https://www.who.int/news/item/001"),
+        ("  http://WWW.WHO.int:80/news/item/001/  ", "https://www.who.int/news/item/001"),
+        ("https://www.who.int:443/news/item/001#section-2", "https://www.who.int/news/item/001"),
+        ("https://www.who.int/news?utm_source=x&b=2&a=1&fbclid=abc&UTM_Medium=y", "https://www.who.int/news?a=1&b=2"),
+        ("https://www.who.int/news/?utm_campaign=z", "https://www.who.int/news"),
+        ("https://www.who.int", "https://www.who.int/"),
+        ("https://www.who.int:8443/news/", "https://www.who.int:8443/news"),
+        ("https://user@www.who.int/news", "https://www.who.int/news"),
+        ("mailto:media@who.int", "mailto:media@who.int"),
+        ("/news/item/001", "/news/item/001"),
+        ("", ""),
+    ],
+)
+def test_default_rules(raw, expected):
+    assert UrlRules().canonicalize(raw) == expected
+
+
+def test_rules_are_configurable():
+    rules = UrlRules(force_https=False, strip_www=True, strip_trailing_slash=False, sort_query=False, strip_params=("ref",))
+    assert rules.canonicalize("http://www.who.int/news/?b=2&ref=home&a=1") == "http://who.int/news/?b=2&a=1"
+    assert UrlRules(enabled=False).canonicalize(" http://www.who.int/news/ ") == "http://www.who.int/news/"
+
+
+def test_rules_from_config():
+    config = PipelineConfig(url_strip_www=True, url_force_https=False, url_strip_params="sessionid, ref*")
+    rules = UrlRules.from_config(config)
+    assert rules.strip_params == ("sessionid", "ref*")
+    assert rules.canonicalize("http://www.who.int/a?referrer=x&sessionid=1&q=2") == "http://who.int/a?q=2"
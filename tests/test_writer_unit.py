@@ -0,0 +1,182 @@
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from healthcare_news_scraper.config import PipelineConfig
+from healthcare_news_scraper.exceptions import StorageError
+from healthcare_news_scraper.protocols import ArticleStore, ArticleUrlIndex, StreamingArticleStore
+from healthcare_news_scraper.runner_once import run_once
+from healthcare_news_scraper.storage import SQLiteArticleStore
+from healthcare_news_scraper.writer import QueuedArticleStore
+from tests.store_helpers import make_article, persist, run_fields
+
+
+class FlakyStore(SQLiteArticleStore):
+    def _write_run(self, conn, **fields):
+        if fields["source"] == "broken":
+            raise StorageError("broken run")
+        return super()._write_run(conn, **fields)
+
+
+class BlockingStore(SQLiteArticleStore):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+        self.entered = threading.Event()
+
+    def persist_runs(self, runs):
+        self.entered.set()
+        self.release.wait(5)
+        return super().persist_runs(runs)
+
+
+def test_queued_store_satisfies_store_protocols(tmp_path):
+    with QueuedArticleStore(SQLiteArticleStore(str(tmp_path / "news.db"))) as store:
+        assert isinstance(store, ArticleStore)
+        assert isinstance(store, ArticleUrlIndex)
+        assert isinstance(store, StreamingArticleStore)
+
+
+def test_concurrent_producers_share_one_writer_with_group_commit(tmp_path):
+    inner = SQLiteArticleStore(str(tmp_path / "news.db"), persistent=True)
+    with QueuedArticleStore(inner, group_commit_seconds=0.05, max_batch=64) as store:
+        store.init_schema()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            records = list(pool.map(lambda index: persist(store, [make_article(index), make_article(index + 1000)]), range(40)))
+        assert store.stats.runs_committed == 40
+        assert store.stats.commits < 40
+        assert store.stats.largest_batch > 1
+
+        assert sorted(record.run_id for record in records) == list(range(1, 41))
+        assert all(record.fetched_count == 2 for record in records)
+        with inner.transaction() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 40
+            assert conn.execute("SELECT COUNT(*) FROM products").fetchone()[0] == 80
+        assert store.known_urls(["https://www.who.int/news/item/3", "https://example.org/x"]) == {
+            "https://www.who.int/news/item/3"
+        }
+
+
+def test_failed_run_does_not_fail_the_rest_of_its_batch(tmp_path):
+    inner = FlakyStore(str(tmp_path / "news.db"), persistent=True)
+    with QueuedArticleStore(inner, group_commit_seconds=0.2, max_batch=2) as store:
+        store.init_schema()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            good = pool.submit(persist, store, [make_article(1)])
+            bad = pool.submit(persist, store, [make_article(2)], source="broken")
+            assert good.result().fetched_count == 1
+            with pytest.raises(StorageError, match="broken run"):
+                bad.result()
+        assert store.stats.failed_runs == 1
+        with inner.transaction() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+
+
+def test_full_queue_applies_backpressure(tmp_path):
+    inner = BlockingStore(str(tmp_path / "news.db"), persistent=True)
+    inner.init_schema()
+    store = QueuedArticleStore(inner, max_pending=1, max_batch=1, group_commit_seconds=0, enqueue_timeout=0.05)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(persist, store, [make_article(1)])
+        assert inner.entered.wait(5)
+        second = pool.submit(persist, store, [make_article(2)])
+        deadline = time.monotonic() + 5
+        while not store._queue.full() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with pytest.raises(StorageError, match="stayed full"):
+            persist(store, [make_article(3)])
+        inner.release.set()
+        assert first.result().run_id == 1
+        assert second.result().run_id == 2
+    store.close()
+    with pytest.raises(StorageError, match="closed"):
+        persist(store, [make_article(4)])
+
+
+def test_run_once_routes_default_store_through_write_queue(tmp_path):
+    cfg = PipelineConfig(db_path=str(tmp_path / "news.db"), db_write_queue=True, retention_max_runs=1)
+    for _ in range(2):
+        summary = run_once(cfg, scrape_func=lambda _cfg: [make_article(1)])
+        assert summary.status == "success"
+    with SQLiteArticleStore(cfg.db_path) as store, store.transaction() as conn:
+        assert [row["id"] for row in conn.execute("SELECT id FROM runs")] == [2]
+
+
+def test_execute_waits_for_runs_queued_before_it(tmp_path):
+    inner = SQLiteArticleStore(str(tmp_path / "news.db"), persistent=True)
+    with QueuedArticleStore(inner, group_commit_seconds=0.5, max_batch=64) as store:
+        store.init_schema()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(persist, store, [make_article(1)])
+            time.sleep(0.1)
+            assert store.execute(lambda: inner.count_rows("runs")) == 1
+            assert pending.result().run_id == 1
+
+
+def test_streaming_runs_go_through_the_writer(tmp_path):
+    inner = SQLiteArticleStore(str(tmp_path / "news.db"), persistent=True)
+    with QueuedArticleStore(inner) as store:
+        store.init_schema()
+        record = store.persist_run_streaming(**run_fields(make_article(index) for index in range(5)), chunk_size=2)
+        assert (record.status, record.fetched_count) == ("success", 5)
+        assert inner.count_rows("product_snapshots") == 5
+
+
+def test_slow_stream_does_not_hold_up_other_writers(tmp_path):
+    inner = SQLiteArticleStore(str(tmp_path / "news.db"), persistent=True)
+    started, other_committed = threading.Event(), threading.Event()
+
+    def slow_articles():
+        yield make_article(1)
+        yield make_article(2)
+        started.set()
+        other_committed.wait(5)
+        yield make_article(3)
+
+    with QueuedArticleStore(inner, group_commit_seconds=0) as store, ThreadPoolExecutor(max_workers=1) as pool:
+        store.init_schema()
+        streaming = pool.submit(lambda: store.persist_run_streaming(**run_fields(slow_articles()), chunk_size=2))
+        assert started.wait(5)
+        started_at = time.monotonic()
+        assert persist(store, [make_article(10)], source="other").fetched_count == 1
+        assert time.monotonic() - started_at < 1
+        other_committed.set()
+        assert streaming.result().fetched_count == 3
+
+
+LOCK_HOLDER = """
+import fcntl, sys
+with open(sys.argv[1], "a+") as handle:
+    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+    print("locked", flush=True)
+    sys.stdin.readline()
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl is POSIX-only")
+def test_writer_waits_for_the_lock_held_by_another_process(tmp_path):
+    inner = SQLiteArticleStore(str(tmp_path / "news.db"), persistent=True)
+    inner.init_schema()
+    holder = subprocess.Popen(
+        [sys.executable, "-c", LOCK_HOLDER, f"{inner.db_path}.writer.lock"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        with QueuedArticleStore(inner, group_commit_seconds=0) as store, ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(persist, store, [make_article(1)])
+            time.sleep(0.3)
+            assert not pending.done()
+            assert inner.count_rows("runs") == 0
+            holder.stdin.write("\n")
+            holder.stdin.flush()
+            assert pending.result(timeout=5).run_id == 1
+    finally:
+        holder.stdin.close()
+        holder.wait(timeout=5)